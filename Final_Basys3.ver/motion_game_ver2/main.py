@@ -1,19 +1,26 @@
 # main.py
-from PIL import Image, ImageDraw
+# 실행: python main.py   (import만 하면 아무 것도 하지 않음 → tools/bench_startup.py 등에서 재사용)
+from utils.startup import timeline, StartupLoader, draw_splash   # 타임라인 기준 시각 = 이 import 시점
+
 from pathlib import Path
 import time
-import pygame
-import cv2
-import numpy as np
 import os
 
+import pygame
+
 from widgets import StartHoldWidget
-from scenes.ranking_widget import RankingScene  # ★ 추가
-# from scenes.mode_select_scene import ModeSelectScene
-from scenes.music_select_scene import MusicSelectScene
-from scenes.play_scene import PlayScene
-from scenes.setting_scene import SettingScene
-from scenes.ending_scene import EndingScene
+from utils.capture import CameraCapture
+from utils.fonts import fonts
+from utils.dirty import damage
+from utils.layers import StaticLayer
+from utils.latency import latency
+from utils.recorder import recorder, start_from_env as start_recorder
+from utils.assets import load_image, audit, cache as asset_cache
+from utils.layout import SCREEN_SIZE, CHAR_SIZE, CARD_SIZE, PLAY_VGA_SIZE
+from utils.songs import song_index
+# 씬(scenes.*)/PIL/serial/프리로더는 처음 쓰는 시점에 import (INTRO 첫 프레임까지 불필요)
+
+timeline.mark("imports")
 
 # ----------------- Ranking -----------------
 RANKINGS = []   # [(이름, 점수), ...] 최대 5명 유지
@@ -25,376 +32,511 @@ bg_path    = ASSETS / "background.png"
 char1_path = ASSETS / "1.png"
 char2_path = ASSETS / "2.png"
 
-# 폴더/토큰 매핑
-FOLDER_MAP     = {"GOLDEN": "golden", "SODA": "sodapop", "SODAPOP": "sodapop"}
-START_CHAR_MAP = {"GOLDEN": "g",      "SODA": "s",       "SODAPOP": "s"}
-
 # -------------- Layout -----------------
-W, H = 2560, 1440
+W, H = SCREEN_SIZE
 vga_x0, vga_y0 = 530, 200
 vga_x1, vga_y1 = 2030, 1325
 vga_w, vga_h   = (vga_x1 - vga_x0), (vga_y1 - vga_y0)
+VGA_RECT = (vga_x0, vga_y0, vga_w, vga_h)
 
-# ------------- Pygame ------------------
-pygame.init()
-screen = pygame.display.set_mode((W, H))
-pygame.display.set_caption("Motion Game")
-clock = pygame.time.Clock()
+# -------------- Render -----------------
+# full : 매 프레임 전체 배경 + flip (기본)
+# dirty: 씬이 그린 영역만 배경 복원 + display.update(rects), 씬 전환 시 전체 갱신
+RENDER_MODE  = os.environ.get("MG_RENDER_MODE", "full")
+DEBUG_DAMAGE = os.environ.get("MG_DEBUG_DAMAGE", "0") == "1"   # 갱신 영역 시각화
+# 첫 프레임을 그리고 바로 종료 (tools/bench_startup.py 용)
+EXIT_AFTER_STARTUP = os.environ.get("MG_EXIT_AFTER_STARTUP", "0") == "1"
+DEBUG_PRELOAD = os.environ.get("MG_DEBUG_PRELOAD", "0") == "1"   # 곡 팩 프리로드 결과/실패 로그
 
-# --------- Background (PIL→Surface) ----
-bg_layout = Image.open(bg_path).convert("RGBA").resize((W, H))
-draw = ImageDraw.Draw(bg_layout)
-draw.rectangle([vga_x0, vga_y0, vga_x1, vga_y1], fill="black")
-bg_layout_surf = pygame.image.fromstring(bg_layout.tobytes(), bg_layout.size, bg_layout.mode)
+# raw MJPEG 축소 디코드 기준: 상태별로 실제로 그리는 카메라 영역 크기
+# (카메라를 그리지 않는 화면은 레코더 링 크기(320x240)만 있으면 됨)
+CAM_TARGET = {"INTRO": (vga_w, vga_h), "MUSIC": (vga_w, vga_h), "SETTING": (vga_w, vga_h),
+              "PLAY": PLAY_VGA_SIZE}
+CAM_IDLE_SIZE = (320, 240)
 
-# PLAY용: 검정 사각형 없는 ‘깨끗한’ 배경
-bg_plain = Image.open(bg_path).convert("RGBA").resize((W, H))
-bg_plain_surf = pygame.image.fromstring(bg_plain.tobytes(), bg_plain.size, bg_plain.mode)
+CAM_STATS_EVERY = 10.0   # 초, 드롭/재사용 프레임 카운터 로그 주기 (0이면 끔)
 
-# --------------- Characters ------------
-char1_surf = pygame.image.load(char1_path).convert_alpha()
-char1_surf = pygame.transform.smoothscale(char1_surf, (600, 900))
-char2_surf = pygame.image.load(char2_path).convert_alpha()
-char2_surf = pygame.transform.smoothscale(char2_surf, (600, 900))
 
 # -------------- Camera -----------------
-def open_cam(index=1, width=640, height=480, fps=60):
-    cap = cv2.VideoCapture(index, cv2.CAP_DSHOW)
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH,  width)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
-    cap.set(cv2.CAP_PROP_FPS,          fps)
-    # FOURCC 설정: 우선 MJPG, 실패 시 무시
-    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
-    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-    return cap
-
-cap = open_cam(1)
-
-def blit_cam_into_rect(surface, frame_bgr, rect):
-    x0, y0, w, h = rect
-    rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
-    fh, fw = rgb.shape[:2]
-    s = min(w / fw, h / fh)
-    nw, nh = max(1, int(fw * s)), max(1, int(fh * s))
-    rgb_resized = cv2.resize(rgb, (nw, nh), interpolation=cv2.INTER_LINEAR)
-    cam_surf = pygame.image.frombuffer(rgb_resized.tobytes(), (nw, nh), "RGB")
-    pygame.draw.rect(surface, (0,0,0), (x0, y0, w, h))
-    ox, oy = x0 + (w - nw)//2, y0 + (h - nh)//2
-    surface.blit(cam_surf, (ox, oy))
-
-if not cap.isOpened():
-    print("[WARN] Camera open failed: index=1")
-
-# ------------- Start Widget ------------
-start_widget = StartHoldWidget(
-    (W, H),
-    port="COM11", baud=115200, parse_mode="token",
-    hold_s=2.0, timeout=0.25, debug=True
-    # label_idle="Start!!", label_done="Ready!",
-    # title_default="Motion Game",
-    # btn_rect=(60, H-180, 420, 130),
-    # title_pos=(W//2, 100)
-)
-
-# --------------- Main Loop -------------
-STATE = "INTRO"
-intro_block_until = 0.0 
-# mode_scene = None
-running = True
-last = time.monotonic()
-
-# mode_scene = None
-music_scene = None
-play_scene = None
-setting_scene = None
-current_song = None
-ending_scene = None     
-ranking_scene = None
-
-# ---------------- Main Loop ----------------
-while running:
-    now = time.monotonic()
-    dt  = min(0.1, now - last)
-    last = now
-
-    # 1️⃣ 이벤트 처리 (한 번만)
-    for e in pygame.event.get():
-        if e.type == pygame.QUIT:
-            running = False
-        elif e.type == pygame.KEYDOWN and e.key == pygame.K_ESCAPE:
-            running = False
-
-        # 상태별 이벤트 처리
+def open_cam():
+    """camera.json(MG_CAMERA_* 환경변수)로 고른 백엔드를 연다 — dshow/v4l2/replay/synthetic"""
+    from utils.camera import load_camera_config, open_backend   # 캡처 스레드에서 처음 import (cv2 포함)
+    cfg = load_camera_config()
+    print(f"[CAM] {cfg.describe()}")
+    return open_backend(cfg)
+
+_cam_presenters = {}   # rect → CamPresenter (버퍼/Surface 재사용)
+
+def blit_cam_into_rect(surface, frame_bgr, rect, frame_id=None, origin=None):
+    p = _cam_presenters.get(rect)
+    if p is None:
+        from utils.cam_presenter import CamPresenter
+        p = _cam_presenters[rect] = CamPresenter(rect)
+    p.draw(surface, frame_bgr, frame_id, origin)
+
+
+def startup_jobs(songs):
+    """INTRO 첫 프레임 + MUSIC 진입에 쓰는 이미지 [(path, size, alpha)] — 씬의 load_image와 같은 키"""
+    jobs = [(bg_path, (W, H), False),
+            (char1_path, CHAR_SIZE, True), (char2_path, CHAR_SIZE, True),
+            (ASSETS / "ques.png", CARD_SIZE, True)]
+    jobs += [(s.card, CARD_SIZE, True) for s in songs.songs() if s.card]
+    return jobs
+
+
+def make_start_widget():
+    return StartHoldWidget(
+        (W, H),
+        port="COM11", baud=115200, parse_mode="token",
+        hold_s=2.0, timeout=0.25, debug=True
+        # label_idle="Start!!", label_done="Ready!",
+        # title_default="Motion Game",
+        # btn_rect=(60, H-180, 420, 130),
+        # title_pos=(W//2, 100)
+    )
+
+
+def main():
+    damage.enabled = (RENDER_MODE == "dirty")
+    damage.debug   = DEBUG_DAMAGE
+
+    # ------------- Pygame ------------------
+    with timeline.phase("display"):
+        pygame.init()
+        screen = pygame.display.set_mode((W, H))
+        pygame.display.set_caption("Motion Game")
+        clock = pygame.time.Clock()
+
+    # -------------- Camera -----------------
+    # 캡처는 별도 스레드에서: 메인 루프는 최신 프레임만 논블로킹으로 읽는다
+    # (장치 열기를 기다리지 않음 → 열리기 전 프레임은 VGA 영역을 검정으로)
+    with timeline.phase("camera_start"):
+        cam = CameraCapture(open_cam, target_size=CAM_TARGET["INTRO"])   # 상태가 바뀌면 set_target_size
+        cam.start()
+    cam_checked = False
+    # 세션 레코더 (MG_RECORD=1): 캡처 단계에서 링 버퍼로 복사, 라운드 종료/이의 시 별도 프로세스에서 인코드
+    if start_recorder().enabled:
+        cam.slot.tap = recorder.push
+
+    # 곡 폴더/시작 문자/모션 목록은 assets/songs.json (utils/songs.py)
+    with timeline.phase("songs"):
+        SONGS = song_index()
+
+    # 시작 에셋은 스레드 풀에서 디코드 → 그동안 폰트 준비 + 스플래시 (검정 화면 대신 진행 바)
+    loader = StartupLoader(startup_jobs(SONGS)).start()
+
+    with timeline.phase("fonts"):
+        fonts.warm()   # 씬들이 쓰는 폰트를 미리 로드 (프레임 중 SysFont 생성 방지)
+
+    with timeline.phase("assets"):
+        while not loader.done():
+            draw_splash(screen, loader.progress())
+            pygame.display.flip()
+            timeline.mark("splash")
+            pygame.event.pump()
+            loader.pump(timeout=1 / 60)
+
+        # 아래 load_image는 전부 캐시 적중 (디코드 실패분만 여기서 다시 시도)
+        # --------- Background (화면 포맷/불투명, 베이크 있으면 mmap) ----
+        # PLAY용: 검정 사각형 없는 ‘깨끗한’ 배경 (캐시 공유본이므로 직접 수정 금지)
+        bg_plain_surf = load_image(bg_path, (W, H), alpha=False)
+
+        # INTRO/MUSIC용: VGA 자리에 검정 사각형 (x1/y1 포함)
+        bg_layout_surf = bg_plain_surf.copy()
+        pygame.draw.rect(bg_layout_surf, (0, 0, 0), (vga_x0, vga_y0, vga_w + 1, vga_h + 1))
+
+        # --------------- Characters ------------
+        char1_surf = load_image(char1_path, CHAR_SIZE)
+        char2_surf = load_image(char2_path, CHAR_SIZE)
+
+    # ----------- Song pack preload ---------
+    # MUSIC 동안 워커가 곡 팩(모션/결과 오버레이/기어)을 미리 디코드 → PlayScene 생성이 캐시 적중만
+    preloader = None
+
+    def preload_songs(music_scene):
+        """활성 카드 전부 낮은 우선순위로, 홀드 중인 카드는 최우선으로"""
+        from scenes.play_scene import pack_image_jobs
+        focus = music_scene.focus_key()
+        for key in music_scene.enabled_keys():
+            song = SONGS.get(key)
+            if song:
+                preloader.want(song.key, pack_image_jobs(song), priority=0 if key == focus else 10)
+
+    # ------------- Start Widget ------------
+    with timeline.phase("start_widget"):
+        start_widget = make_start_widget()
+
+    # ------------- Static Layers -----------
+    # INTRO: 배경 + 캐릭터 + 타이틀을 한 장으로 (매 프레임 blit 대신 begin_frame의 base로 사용)
+    # 캐릭터/타이틀은 VGA 영역과 겹치므로 over=True → 카메라 그린 뒤 restore_over로 다시 올림
+    def _build_intro(layer):
+        layer.blit(char1_surf, (50, 400), over=True)
+        layer.blit(char2_surf, (W - 650, 350), over=True)
+        sprite, pos = start_widget.title_sprite("Motion Game")
+        layer.blit(sprite, pos, over=True)
+
+    intro_layer = StaticLayer(_build_intro)
+
+    # --------------- Main Loop -------------
+    STATE = "INTRO"
+    drawn_state = None      # 마지막으로 그린 STATE (바뀌면 전체 갱신)
+    preload_focus = Ellipsis   # 마지막으로 프리로드 큐를 갱신한 focus 카드 (Ellipsis=아직 안 함)
+    intro_block_until = 0.0 
+    # mode_scene = None
+    running = True
+    last = time.monotonic()
+    cam_stats_t = last
+    startup_done = False
+
+    # mode_scene = None
+    music_scene = None
+    play_scene = None
+    setting_scene = None
+    current_song = None
+    ending_scene = None     
+    ranking_scene = None
+
+    # ---------------- Main Loop ----------------
+    while running:
+        now = time.monotonic()
+        dt  = min(0.1, now - last)
+        last = now
+
+        if CAM_STATS_EVERY > 0 and (now - cam_stats_t) >= CAM_STATS_EVERY:
+            cam_stats_t = now
+            print(f"[CAM] {cam.stats()}")
+            print(f"[LAT] {latency.report()}")   # 캡처→변환/blit/flip 구간 p50/p95/p99 (ms)
+            if recorder.enabled:
+                print(f"[REC] {recorder.stats()}")
+        if not cam_checked and cam.opened.is_set():
+            cam_checked = True
+            timeline.mark("camera_opened")
+            if not cam.ok:
+                print("[WARN] Camera open failed (camera.json)")
+
+        # 1️⃣ 이벤트 처리 (한 번만)
+        for e in pygame.event.get():
+            if e.type == pygame.QUIT:
+                running = False
+            elif e.type == pygame.KEYDOWN and e.key == pygame.K_ESCAPE:
+                running = False
+
+            # 상태별 이벤트 처리
+            if STATE == "INTRO":
+                start_widget.handle_event(e)
+            elif STATE == "MUSIC" and music_scene:
+                music_scene.handle_event(e, now)
+            elif STATE == "PLAY" and play_scene:
+                play_scene.handle_event(e, now)
+            elif STATE == "SETTING" and setting_scene:
+                setting_scene.handle_event(e, now)
+            elif STATE == "ENDING" and ending_scene:
+                ending_scene.handle_event(e)  # 이제 e만 전달
+
+        # 2️⃣ 배경 그리기 (dirty 모드면 지난 프레임에 그린 영역만 복원)
+        if STATE != drawn_state:
+            damage.invalidate()
+            drawn_state = STATE
+            cam.set_target_size(CAM_TARGET.get(STATE, CAM_IDLE_SIZE))
         if STATE == "INTRO":
-            start_widget.handle_event(e)
+            damage.begin_frame(screen, intro_layer.get(bg_layout_surf))
         elif STATE == "MUSIC" and music_scene:
-            music_scene.handle_event(e, now)
-        elif STATE == "PLAY" and play_scene:
-            play_scene.handle_event(e, now)
-        elif STATE == "SETTING" and setting_scene:
-            setting_scene.handle_event(e, now)
-        elif STATE == "ENDING" and ending_scene:
-            ending_scene.handle_event(e)  # 이제 e만 전달
-
-    # 2️⃣ 배경 그리기
-    if STATE in ("INTRO", "MODE", "MUSIC"):
-        screen.blit(bg_layout_surf, (0, 0))
-    else:
-        screen.blit(bg_plain_surf, (0, 0))
-
-    # ------------ INTRO ------------
-    if STATE == "INTRO":
-        # 카메라
-        ok, frame = cap.read()
-        if ok:
-            blit_cam_into_rect(screen, frame, (vga_x0, vga_y0, vga_w, vga_h))
+            damage.begin_frame(screen, music_scene.static_surface(bg_layout_surf))
+        elif STATE == "RANKING" and ranking_scene:
+            damage.begin_frame(screen, ranking_scene.static_surface(bg_plain_surf))
+        elif STATE in ("MODE", "MUSIC"):
+            damage.begin_frame(screen, bg_layout_surf)
         else:
-            pygame.draw.rect(screen, (0,0,0), (vga_x0, vga_y0, vga_w, vga_h))
-
-        # 캐릭터 스프라이트 고정 렌더링
-        screen.blit(char1_surf, (50, 400))
-        screen.blit(char2_surf, (W - 650, 350))
-        
-
-        # Start 홀드 UI
-        if time.monotonic() >= intro_block_until:
-            start_widget.pump_uart()
-            if start_widget.update(dt):
-                # INTRO → MODE 전환 (같은 창)
-                start_widget.stop()    # UART 쓰고 있으면 정리
-                music_scene = MusicSelectScene(W, H, assets_dir=ASSETS, 
-                                                port="COM11", baud=115200,
-                                                hold=2.0, timeout=0.25, debug=True,
-                                                confirm_show=1.0)
-                music_scene.enter()
-                STATE = "MUSIC"
-        start_widget.draw(screen, title="Motion Game",
-                          hint=None)
-    
-    # ------------- MODE -------------
-    #elif STATE == "MODE":
-    #    # 카메라
-    #    ok, frame = cap.read()
-    #    if ok:
-    #        blit_cam_into_rect(screen, frame, (vga_x0, vga_y0, vga_w, vga_h))
-    #    else:
-    #        pygame.draw.rect(screen, (0,0,0), (vga_x0, vga_y0, vga_w, vga_h))
-    #
-    #    mode_scene.update(dt, now)
-    #    mode_scene.draw(screen)
-    #    if mode_scene.done():
-    #        res = mode_scene.get_result()   # 'single' or 'Multi'
-    #        mode_scene.exit()
-    #        if res == "Single":
-    #            # MUSIC 씬 시작
-    #            music_scene = MusicSelectScene(W, H, assets_dir=ASSETS, 
-    #                                           port="COM11", baud=115200,
-    #                                           hold=2.0, timeout=0.25, debug=True,
-    #                                           confirm_show=1.0)
-    #            music_scene.enter()
-    #            STATE = "MUSIC"
-    #            continue
-    #        elif res == "Multi":
-    #            # TODO: 바로 게임(single)로 가고 싶다면 여기서 single 씬 생성
-    #            running = False
-    
-    # ------------ MUSIC -------------
-    elif STATE == "MUSIC":
-        ok, frame = cap.read()
-        if ok:
-            blit_cam_into_rect(screen, frame, (vga_x0, vga_y0, vga_w, vga_h))
-        else:
-            pygame.draw.rect(screen, (0,0,0), (vga_x0, vga_y0, vga_w, vga_h))
-
-        music_scene.update(dt, now)
-        music_scene.draw(screen)
-
-        if music_scene.done():
-            selected = music_scene.get_result()  # 'GOLDEN' / 'SODA' / ...
-            current_song = selected
-            print("SELECTED SONG:", selected)
-            music_scene.exit(); music_scene = None
-
-            # 선택된 곡에 따른 assets 폴더 결정
-            subdir = FOLDER_MAP.get(selected)
-            if not subdir:
-                print("[WARN] unknown selection; fallback to golden")
-                subdir = "golden"
-            play_assets = ASSETS / subdir
-            start_char_out = START_CHAR_MAP.get(selected)
-
-            print(f"[MUSIC→PLAY] assets_dir={play_assets}")
-
-            # PLAY 씬 준비만 하고, 렌더/업데이트는 다음 프레임부터 정상 루프에서 돌림
-            play_scene = PlayScene(
-                W, H,
-                assets_dir=play_assets,
-                overlay_dir=ASSETS,
-                port="COM21", baud=115200,
-                prep_seconds=5.0, result_hold=3.0,
-                pause_hold=1.0, pause_timeout=0.25,
-                parse_mode="ascii", debug=False,
-                pre_start_seconds=3.0, start_char=start_char_out,
-                done_char="f",
-                result_bytes={"P": b'p', "G": b'g', "B": b'b'},
-                ending_byte=b"e",
-                result_delay=3.0,   # ⬅⬅⬅ 여기 추가 (2초 대기)
-            )
-            play_scene.enter()
-            STATE = "PLAY"
-            continue
-
-    # ------------- PLAY -------------
-    elif STATE == "PLAY":
-        ok, frame = cap.read()
-        # 씬 인스턴스가 없으면 안전하게 생성(이상 케이스 대비)
-        if play_scene is None:
-            play_scene = PlayScene(
-                W, H, assets_dir=ASSETS, port="COM11", baud=115200,
-                prep_seconds=5.0, result_hold=3.0,
-                pause_hold=1.0, pause_timeout=0.25,
-                parse_mode="ascii", debug=False
-            )
-            play_scene.enter()
-
-        # ★ 매 프레임 호출
-        play_scene.update(dt, now)
-        play_scene.draw(screen, frame if ok else None)
-
-        if getattr(play_scene, "pause_requested", False):
-            play_scene.pause_requested = False   # 플래그 소모
-            play_scene.reset_pause_hold()
-
-            setting_scene = SettingScene(
-                W, H,
-                play_scene=play_scene,
-                title="Settings",
-                hold_s=2.0, timeout=0.25,
-                cover_ratio=0.25,
-                vga_rect=(vga_x0, vga_y0, vga_w, vga_h), # 실제로 화면에 쓰는 VGA 직사각형 전달
-                debug=True,
-                assets_dir=ASSETS
-            )
-            setting_scene.enter()
-            STATE = "SETTING"
-            continue
-
-        if play_scene.done():
-            res = play_scene.get_result()   # {'score': ..., ...}
-            final_score = int(res.get("score", 0))
-            play_scene.exit(); play_scene = None
-
-             # ★ 엔딩씬 생성
-            ending_scene = EndingScene(
-                W, H,
-                assets_dir=ASSETS,
-                song=current_song or "GOLDEN",
-                score=final_score,
-                show_seconds=10.0
-            )
-            ending_scene.enter()
-            STATE = "ENDING"
-            continue
-
-    # ------------- SETTING -------------
-    elif STATE == "SETTING":
-        # 카메라는 원하면 계속 blit 가능(정지 화면 원하면 생략)
-        ok, frame = cap.read()
-        if ok:
-            blit_cam_into_rect(screen, frame, (vga_x0, vga_y0, vga_w, vga_h))
-        else:
-            pygame.draw.rect(screen, (0,0,0), (vga_x0, vga_y0, vga_w, vga_h))
-
-        setting_scene.update(dt, now)
-        setting_scene.draw(screen)
-
-        if setting_scene.done():
-            act = setting_scene.get_action()
-            setting_scene.exit(); setting_scene = None
-
-            if act == "restart":
-                # 현재 스테이지를 5초 카운트다운부터 다시
-                if play_scene:
-                    play_scene.reset_pause_hold()
-                    play_scene.restart_stage(now)
-                    STATE = "PLAY"
-                    continue
-
-            elif act == "finish":
-                # 게임 종료 → INTRO(IDLE)로 복귀
-                if play_scene:
-                    play_scene.exit(); play_scene = None
+            damage.begin_frame(screen, bg_plain_surf)
 
-                # StartHoldWidget을 다시 쓸 거면 재생성 권장(예전에 stop() 했으니)
-                start_widget = StartHoldWidget(
-                    (W, H),
-                    port="COM11", baud=115200, parse_mode="token",
-                    hold_s=2.0, timeout=0.25, debug=True
+        # ------------ INTRO ------------
+        if STATE == "INTRO":
+            # 카메라
+            frm = cam.read()
+            if frm:
+                blit_cam_into_rect(screen, frm.image, (vga_x0, vga_y0, vga_w, vga_h), frm.frame_id, frm.origin)
+            else:
+                pygame.draw.rect(screen, (0,0,0), (vga_x0, vga_y0, vga_w, vga_h))
+
+            # 캐릭터/타이틀은 intro_layer에 포함 → 카메라와 겹친 부분만 다시 올림
+            intro_layer.restore_over(screen, VGA_RECT)
+
+            # Start 홀드 UI
+            if time.monotonic() >= intro_block_until:
+                start_widget.pump_uart()
+                if start_widget.update(dt):
+                    # INTRO → MODE 전환 (같은 창)
+                    start_widget.stop()    # UART 쓰고 있으면 정리
+                    from scenes.music_select_scene import MusicSelectScene
+                    if preloader is None:
+                        from utils.preload import Preloader
+                        preloader = Preloader(debug=DEBUG_PRELOAD)
+                        preloader.start()
+                    music_scene = MusicSelectScene(W, H, assets_dir=ASSETS, 
+                                                    port="COM11", baud=115200,
+                                                    hold=2.0, timeout=0.25, debug=True,
+                                                    confirm_show=1.0)
+                    music_scene.enter()
+                    STATE = "MUSIC"
+            start_widget.draw(screen, title="", hint=None)   # 타이틀은 intro_layer
+
+        # ------------- MODE -------------
+        #elif STATE == "MODE":
+        #    # 카메라
+        #    frm = cam.read()
+        #    if frm:
+        #        blit_cam_into_rect(screen, frm.image, (vga_x0, vga_y0, vga_w, vga_h), frm.frame_id)
+        #    else:
+        #        pygame.draw.rect(screen, (0,0,0), (vga_x0, vga_y0, vga_w, vga_h))
+        #
+        #    mode_scene.update(dt, now)
+        #    mode_scene.draw(screen)
+        #    if mode_scene.done():
+        #        res = mode_scene.get_result()   # 'single' or 'Multi'
+        #        mode_scene.exit()
+        #        if res == "Single":
+        #            # MUSIC 씬 시작
+        #            music_scene = MusicSelectScene(W, H, assets_dir=ASSETS, 
+        #                                           port="COM11", baud=115200,
+        #                                           hold=2.0, timeout=0.25, debug=True,
+        #                                           confirm_show=1.0)
+        #            music_scene.enter()
+        #            STATE = "MUSIC"
+        #            continue
+        #        elif res == "Multi":
+        #            # TODO: 바로 게임(single)로 가고 싶다면 여기서 single 씬 생성
+        #            running = False
+
+        # ------------ MUSIC -------------
+        elif STATE == "MUSIC":
+            frm = cam.read()
+            if frm:
+                blit_cam_into_rect(screen, frm.image, (vga_x0, vga_y0, vga_w, vga_h), frm.frame_id, frm.origin)
+            else:
+                pygame.draw.rect(screen, (0,0,0), (vga_x0, vga_y0, vga_w, vga_h))
+            music_scene.static_layer.restore_over(screen, VGA_RECT)
+
+            music_scene.update(dt, now)
+            music_scene.draw(screen)
+
+            focus = music_scene.focus_key()
+            if focus != preload_focus:   # 진입 직후 1회 + 홀드 카드가 바뀔 때만 큐 갱신
+                preload_songs(music_scene)
+                preload_focus = focus
+            preloader.pump()
+
+            if music_scene.done():
+                selected = music_scene.get_result()  # 'GOLDEN' / 'SODA' / ...
+                current_song = selected
+                print("SELECTED SONG:", selected)
+                music_scene.exit(); music_scene = None
+                preload_focus = Ellipsis
+
+                # 선택된 곡의 매니페스트 항목
+                song = SONGS.get(selected)
+                if not song:
+                    print("[WARN] unknown selection; fallback to first song")
+                    song = SONGS.songs()[0]
+                play_assets = song.folder
+                start_char_out = song.start_char
+
+                print(f"[MUSIC→PLAY] assets_dir={play_assets} rom_base={song.pattern_rom_base}")
+                ready = preloader.wait(song.key, timeout=2.0)   # 남은 디코드 마무리 (대개 이미 완료)
+                if DEBUG_PRELOAD:
+                    print(f"[PRELOAD] {song.key} ready={ready} {preloader.stats()}")
+
+                # PLAY 씬 준비만 하고, 렌더/업데이트는 다음 프레임부터 정상 루프에서 돌림
+                from scenes.play_scene import PlayScene
+                play_scene = PlayScene(
+                    W, H,
+                    song=song,
+                    overlay_dir=ASSETS,
+                    port="COM21", baud=115200,
+                    prep_seconds=5.0, result_hold=3.0,
+                    pause_hold=1.0, pause_timeout=0.25,
+                    parse_mode="ascii", debug=False,
+                    pre_start_seconds=3.0, start_char=start_char_out,
+                    done_char="f",
+                    result_bytes={"P": b'p', "G": b'g', "B": b'b'},
+                    ending_byte=b"e",
+                    result_delay=3.0,   # ⬅⬅⬅ 여기 추가 (2초 대기)
                 )
-                STATE = "INTRO"
+                play_scene.enter()
+                STATE = "PLAY"
                 continue
-    
-    # ------------- ENDING -------------
-    elif STATE == "ENDING":
-        if ending_scene:
-            ending_scene.update(dt, now)
-            ending_scene.draw(screen)
-
-            if ending_scene.done():
-                # 결과 가져오기
-                res = ending_scene.get_result()
-                name, score = res["name"], res["score"]
-
-                # 랭킹 갱신
-                RANKINGS.append((name, score))
-                RANKINGS.sort(key=lambda x: x[1], reverse=True)
-                RANKINGS[:] = RANKINGS[:5]  # 상위 5명만
-
-                # 엔딩 씬 정리
-                ending_scene = None
-
-                # 랭킹 씬 생성
-                ranking_scene = RankingScene(
-                    W, H, RANKINGS,
-                    show_seconds=8.0,
-                    port="COM11", baud=115200,   # ★ 여기서 지정
-                    send_byte=b't',
-                    debug=True
+
+        # ------------- PLAY -------------
+        elif STATE == "PLAY":
+            frm = cam.read()
+            # 씬 인스턴스가 없으면 안전하게 생성(이상 케이스 대비)
+            if play_scene is None:
+                from scenes.play_scene import PlayScene
+                play_scene = PlayScene(
+                    W, H, assets_dir=ASSETS, port="COM11", baud=115200,
+                    prep_seconds=5.0, result_hold=3.0,
+                    pause_hold=1.0, pause_timeout=0.25,
+                    parse_mode="ascii", debug=False
+                )
+                play_scene.enter()
+
+            # ★ 매 프레임 호출
+            play_scene.update(dt, now)
+            if play_scene.on_last_motion():   # 엔딩 배경을 워커에서 미리 합성 (곡당 1회)
+                from scenes.ending_scene import ending_composites
+                ending_composites.prepare(ASSETS, current_song or "GOLDEN", W, H)
+            play_scene.draw(screen, frm.image if frm else None,
+                            frm.frame_id if frm else None,
+                            frm.origin if frm else None)
+
+            if getattr(play_scene, "pause_requested", False):
+                play_scene.pause_requested = False   # 플래그 소모
+                play_scene.reset_pause_hold()
+
+                from scenes.setting_scene import SettingScene
+                setting_scene = SettingScene(
+                    W, H,
+                    play_scene=play_scene,
+                    title="Settings",
+                    hold_s=2.0, timeout=0.25,
+                    cover_ratio=0.25,
+                    vga_rect=(vga_x0, vga_y0, vga_w, vga_h), # 실제로 화면에 쓰는 VGA 직사각형 전달
+                    debug=True,
+                    assets_dir=ASSETS
                 )
-                ranking_scene.enter()
-                STATE = "RANKING"
+                setting_scene.enter()
+                STATE = "SETTING"
                 continue
 
-    # ---------------- RANKING ----------------
-    elif STATE == "RANKING":
-        if ranking_scene:
-            ranking_scene.update(dt, now)
-            ranking_scene.draw(screen)
-
-            if ranking_scene.done():
-                ranking_scene.exit()   # ★ 정리
-                ranking_scene = None
-
-                # INTRO용 StartHoldWidget 재생성 (그대로 유지)
-                start_widget = StartHoldWidget(
-                    (W, H),
-                    port="COM11",
-                    baud=115200,
-                    parse_mode="token",
-                    hold_s=2.0,
-                    timeout=0.25,
-                    debug=True
+            if play_scene.done():
+                res = play_scene.get_result()   # {'score': ..., ...}
+                final_score = int(res.get("score", 0))
+                play_scene.exit(); play_scene = None
+
+                 # ★ 엔딩씬 생성
+                from scenes.ending_scene import EndingScene
+                ending_scene = EndingScene(
+                    W, H,
+                    assets_dir=ASSETS,
+                    song=current_song or "GOLDEN",
+                    score=final_score,
+                    show_seconds=10.0
                 )
-                start_widget.reset()
-                intro_block_until = time.monotonic() + 1.2
-                pygame.event.clear()
-                STATE = "INTRO"
+                ending_scene.enter()
+                STATE = "ENDING"
                 continue
 
-    pygame.display.flip()
-    clock.tick(60)
+        # ------------- SETTING -------------
+        elif STATE == "SETTING":
+            # 카메라는 원하면 계속 blit 가능(정지 화면 원하면 생략)
+            frm = cam.read()
+            if frm:
+                blit_cam_into_rect(screen, frm.image, (vga_x0, vga_y0, vga_w, vga_h), frm.frame_id, frm.origin)
+            else:
+                pygame.draw.rect(screen, (0,0,0), (vga_x0, vga_y0, vga_w, vga_h))
+
+            setting_scene.update(dt, now)
+            setting_scene.draw(screen)
+
+            if setting_scene.done():
+                act = setting_scene.get_action()
+                setting_scene.exit(); setting_scene = None
+
+                if act == "restart":
+                    # 현재 스테이지를 5초 카운트다운부터 다시
+                    if play_scene:
+                        play_scene.reset_pause_hold()
+                        play_scene.restart_stage(now)
+                        STATE = "PLAY"
+                        continue
+
+                elif act == "finish":
+                    # 게임 종료 → INTRO(IDLE)로 복귀
+                    if play_scene:
+                        play_scene.exit(); play_scene = None
+
+                    # StartHoldWidget을 다시 쓸 거면 재생성 권장(예전에 stop() 했으니)
+                    start_widget = make_start_widget()
+                    STATE = "INTRO"
+                    continue
+
+        # ------------- ENDING -------------
+        elif STATE == "ENDING":
+            if ending_scene:
+                ending_scene.update(dt, now)
+                ending_scene.draw(screen)
+
+                if ending_scene.done():
+                    # 결과 가져오기
+                    res = ending_scene.get_result()
+                    name, score = res["name"], res["score"]
+
+                    # 랭킹 갱신
+                    RANKINGS.append((name, score))
+                    RANKINGS.sort(key=lambda x: x[1], reverse=True)
+                    RANKINGS[:] = RANKINGS[:5]  # 상위 5명만
+
+                    # 엔딩 씬 정리
+                    ending_scene = None
+
+                    # 랭킹 씬 생성
+                    from scenes.ranking_widget import RankingScene
+                    ranking_scene = RankingScene(
+                        W, H, RANKINGS,
+                        show_seconds=8.0,
+                        port="COM11", baud=115200,   # ★ 여기서 지정
+                        send_byte=b't',
+                        debug=True
+                    )
+                    ranking_scene.enter()
+                    STATE = "RANKING"
+                    continue
+
+        # ---------------- RANKING ----------------
+        elif STATE == "RANKING":
+            if ranking_scene:
+                ranking_scene.update(dt, now)
+                ranking_scene.draw(screen)
+
+                if ranking_scene.done():
+                    ranking_scene.exit()   # ★ 정리
+                    ranking_scene = None
+
+                    # INTRO용 StartHoldWidget 재생성 (그대로 유지)
+                    start_widget = make_start_widget()
+                    start_widget.reset()
+                    intro_block_until = time.monotonic() + 1.2
+                    pygame.event.clear()
+                    STATE = "INTRO"
+                    continue
 
-# -------------- Cleanup ----------------
-start_widget.stop()
-if cap: cap.release()
-pygame.quit()
+        if latency.calibrator:   # MG_LATENCY_CAL=1: glass-to-glass 측정용 깜빡이 마커
+            latency.calibrator.draw(screen, now)
+        damage.present()    # full 모드/전환 프레임은 flip, 그 외 update(rects)
+        latency.flip()
+        recorder.poll()
+        if not startup_done:
+            startup_done = True
+            timeline.mark("interactive")    # 첫 INTRO 프레임 = 입력을 받기 시작하는 시점
+            timeline.write()
+            print(f"[STARTUP] time-to-interactive {timeline.marks['interactive']:.1f} ms "
+                  f"(startup loader {loader.loaded} decoded, {loader.failed} failed, {loader.workers} workers)\n"
+                  + timeline.summary())
+            if EXIT_AFTER_STARTUP:
+                running = False
+        clock.tick(60)
+
+    # -------------- Cleanup ----------------
+    start_widget.stop()
+    cam.stop()
+    recorder.stop()
+    if preloader:
+        preloader.stop()
+    print("[ASSET] cache:", asset_cache.stats())
+    print("[LAT]", latency.report())
+    if audit.enabled:   # MG_AUDIT_SURFACES=1
+        print("[ASSET] audit:", audit.stats())
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
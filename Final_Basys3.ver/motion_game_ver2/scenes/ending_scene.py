@@ -1,12 +1,23 @@
 # scenes/ending_scene.py
 # scenes/ending_scene.py
 from __future__ import annotations
-import time
+import os, time, hashlib, threading
 from pathlib import Path
 from typing import Optional
 import pygame
 from PIL import Image
 
+from utils.fonts import get_font
+from utils.dirty import damage
+from utils.assets import from_pil, to_display, audit
+from utils.baked import BAKE_DIR
+from utils.songs import song_index
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
 try:
     from utils.neon import draw_neon_text
 except Exception:
@@ -19,22 +30,143 @@ NEON_BLUE  = (100, 150, 255)
 NEON_YEL   = (255, 220, 120)
 NEON_GREEN = (0, 255, 0)
 
+# ---------- 곡별 엔딩 배경 합성 ----------
+def ending_song(song) -> str:
+    """선택 결과 → 엔딩 곡 키 (songs.json 별칭 처리: SODAPOP → SODA)"""
+    return song_index().canonical(song)
+
+
+def ending_layout(song: str, W: int):
+    """곡별 캐릭터 배치: [(경로, 크기, 위치), ...] (songs.json의 ending, 붙이는 순서대로). 모르는 곡은 배경만"""
+    s = song_index().get(song)
+    return s.ending_layout(W) if s else []
+
+
+def compose_ending(assets_dir: Path, song: str, W: int, H: int) -> Image.Image:
+    """배경 + 캐릭터 PIL 합성 (RGB). 디스플레이를 쓰지 않으므로 워커 스레드에서 호출 가능."""
+    bg = Image.open(assets_dir / "background.png").convert("RGBA").resize((W, H))
+    for name, size, pos in ending_layout(song, W):
+        c = Image.open(assets_dir / name).convert("RGBA").resize(size)
+        bg.paste(c, pos, c)
+    return bg.convert("RGB")
+
+
+class EndingComposites:
+    """
+    곡별 엔딩 배경 캐시.
+    - 키: 곡 + 원본 파일 mtime/크기 + 화면 크기 + 배치 → 원본이 바뀌면 자동 재합성
+    - 디스크: assets/.baked/ending_<song>_<sig>.npy (RGB, 다음 실행부터 mmap)
+    - prepare(): 워커 스레드에서 미리 합성 (PLAY 마지막 모션 동안)
+    - get(): 화면 포맷 Surface (준비 중이면 기다리고, 안 했으면 그 자리에서 합성)
+    """
+    def __init__(self, root: Path = BAKE_DIR):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._raw: dict = {}        # (song, sig) → RGB ndarray 또는 PIL.Image
+        self._surf: dict = {}       # (song, sig) → Surface
+        self._jobs: dict = {}       # (assets, song, W, H) → Thread
+        self.built = 0
+        self.disk_hits = 0
+
+    def _sig(self, assets_dir: Path, song: str, W: int, H: int) -> str:
+        parts = [song, W, H]
+        for name, size, pos in [("background.png", (W, H), (0, 0))] + ending_layout(song, W):
+            st = os.stat(assets_dir / name)
+            parts.append((name, st.st_mtime_ns, st.st_size, size, pos))
+        return hashlib.sha1(repr(parts).encode()).hexdigest()[:16]
+
+    def _disk_path(self, song: str, sig: str) -> Path:
+        return self.root / f"ending_{song.lower()}_{sig}.npy"
+
+    def _produce(self, assets_dir: Path, song: str, W: int, H: int):
+        sig = self._sig(assets_dir, song, W, H)
+        key = (song, sig)
+        if key in self._raw or key in self._surf:
+            return key
+        f = self._disk_path(song, sig)
+        raw = None
+        if np is not None and f.exists():
+            try:
+                raw = np.load(f, mmap_mode="r")
+                if raw.shape != (H, W, 3):
+                    raw = None
+                else:
+                    self.disk_hits += 1
+            except Exception:
+                raw = None
+        if raw is None:
+            img = compose_ending(assets_dir, song, W, H)
+            self.built += 1
+            raw = img
+            if np is not None:
+                raw = np.asarray(img)
+                self._save(f, raw, song)
+        with self._lock:
+            self._raw[key] = raw
+        return key
+
+    def _save(self, f: Path, arr, song: str):
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            for old in self.root.glob(f"ending_{song.lower()}_*.npy"):
+                if old != f:
+                    old.unlink()
+            tmp = f.with_suffix(".tmp.npy")
+            np.save(tmp, arr)
+            os.replace(tmp, f)
+        except Exception as e:
+            print(f"[ENDING] cache save fail {f}: {e}")
+
+    def prepare(self, assets_dir: Path, song: str, W: int, H: int):
+        song = ending_song(song)
+        job = (str(assets_dir), song, W, H)
+        if job in self._jobs:
+            return
+        t = threading.Thread(target=self._produce, args=(Path(assets_dir), song, W, H), daemon=True)
+        self._jobs[job] = t
+        t.start()
+
+    def get(self, assets_dir: Path, song: str, W: int, H: int) -> pygame.Surface:
+        song = ending_song(song)
+        t = self._jobs.pop((str(assets_dir), song, W, H), None)
+        if t is not None:
+            t.join()
+        key = self._produce(Path(assets_dir), song, W, H)
+        s = self._surf.get(key)
+        if s is None:
+            with self._lock:
+                raw = self._raw.pop(key)
+            if isinstance(raw, Image.Image):
+                s = from_pil(raw, alpha=False)
+            else:
+                src = pygame.image.frombuffer(raw, (W, H), "RGB")
+                s = to_display(src, alpha=False)
+                if s is src:
+                    s = src.copy()          # mmap 버퍼와 분리
+            s = self._surf[key] = s
+        return s
+
+    def stats(self) -> dict:
+        return {"built": self.built, "disk_hits": self.disk_hits, "surfaces": len(self._surf)}
+
+
+ending_composites = EndingComposites()
+
+
 class EndingScene:
     """곡별 엔딩 + 이름 입력 + 점수 표시"""
     def __init__(self, W:int, H:int, *, assets_dir:Path, song:str, score:int,
                  show_seconds:float=6.0, name_maxlen:int=10):
         self.W, self.H = W, H
         self.assets_dir = Path(assets_dir)
-        self.song = (song or "").upper()
-        if self.song == "SODAPOP":
-            self.song = "SODA"
+        self.song = ending_song(song)
         self.score = int(score)
         self.show_seconds = show_seconds
 
         # 폰트
-        self.title_font = pygame.font.SysFont("Arial", 180, bold=True)
-        self.score_font = pygame.font.SysFont("Arial", 140, bold=True)
-        self.input_font = pygame.font.SysFont("Arial", 100, bold=True)
+        self.title_font = get_font("Arial", 180, bold=True)
+        self.score_font = get_font("Arial", 140, bold=True)
+        self.input_font = get_font("Arial", 100, bold=True)
 
         # 배경 합성용
         self.surface: Optional[pygame.Surface] = None
@@ -77,53 +209,27 @@ class EndingScene:
 
     def draw(self, screen: "pygame.Surface"):
         # 배경 + 캐릭터
+        damage.add(screen.get_rect(), screen)   # 전체 화면 배경
         if self.surface:
-            screen.blit(self.surface, (0, 0))
+            screen.blit(audit.check(self.surface, "ending_bg", opaque=True), (0, 0))
 
         # 타이틀
-        title_rect = self.title_font.render("Ending", True, WHITE).get_rect(midtop=(self.W//2, 24))
+        title_rect = pygame.Rect((0, 0), self.title_font.size("Ending")); title_rect.midtop = (self.W//2, 24)
         draw_neon_text(screen, self.title_font, "Ending", WHITE, NEON_BLUE, title_rect)
 
         # 점수
         score_text = f"Score : {self.score}"
-        score_rect = self.score_font.render(score_text, True, WHITE).get_rect(midtop=(self.W//2, 230))
+        score_rect = pygame.Rect((0, 0), self.score_font.size(score_text)); score_rect.midtop = (self.W//2, 230)
         draw_neon_text(screen, self.score_font, score_text, WHITE, NEON_YEL, score_rect)
 
         # 이름 입력
         name_display = self.player_name or "_"
-        name_rect = self.input_font.render(name_display, True, WHITE).get_rect(midtop=(self.W//2, 400))
+        name_rect = pygame.Rect((0, 0), self.input_font.size(name_display)); name_rect.midtop = (self.W//2, 400)
         draw_neon_text(screen, self.input_font, name_display, WHITE, NEON_GREEN, name_rect)
 
     def _build_composited_surface(self) -> pygame.Surface:
-        W, H = self.W, self.H
-        bg = Image.open(self.assets_dir / "background.png").convert("RGBA").resize((W, H))
-
-        if self.song == "GOLDEN":
-            def _load(name, size):
-                p = self.assets_dir / f"golden_ending_{name}.png"
-                return Image.open(p).convert("RGBA").resize(size)
-            c1 = _load("1", (800, 1000))
-            c2 = _load("2", (800, 1000))
-            c3 = _load("3", (800, 1000))
-            bg.paste(c1, (100, 400), c1)
-            bg.paste(c2, (W - 850, 350), c2)
-            bg.paste(c3, (1250, 500), c3)
-        else:  # SODA
-            def _load(name, size):
-                p = self.assets_dir / f"sodapop_ending_{name}.png"
-                return Image.open(p).convert("RGBA").resize(size)
-            c1 = _load("1", (800, 1000))
-            c2 = _load("2", (800, 1000))
-            c4 = _load("4", (500, 600))
-            c3 = _load("3", (500, 500))
-            c5 = _load("5", (600, 800))
-            bg.paste(c1, (50, 400), c1)
-            bg.paste(c2, (W - 850, 350), c2)
-            bg.paste(c4, (450, 900), c4)
-            bg.paste(c3, (1820, 950), c3)
-            bg.paste(c5, (1300, 720), c5)
-
-        return pygame.image.fromstring(bg.tobytes(), bg.size, bg.mode)
+        # 곡별 캐시(메모리 → 디스크 → 합성). PLAY 마지막 모션 동안 prepare()로 미리 만들어 둔다
+        return ending_composites.get(self.assets_dir, self.song, self.W, self.H)
 
     def done(self) -> bool:
         return self._done
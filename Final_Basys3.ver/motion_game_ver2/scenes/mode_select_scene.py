@@ -1,7 +1,11 @@
 # scenes/mode_select_scene.py
 import sys, time, threading, queue
 import pygame
-from utils.neon import draw_neon_text
+from utils.neon import draw_neon_text, render_text
+from utils.fonts import get_font, fonts
+from utils.dirty import damage
+from utils.assets import load_image
+from utils.layout import MODE_1P_SIZE, MODE_2P_SIZE
 
 try:
     import serial
@@ -79,17 +83,15 @@ class ModeSelectScene:
         self.W=W; self.H=H
         self.port, self.baud, self.parse, self.hold_s, self.timeout, self.debug = port, baud, parse, hold, timeout, debug
 
-        self.title_font = pygame.font.SysFont("Arial", 180, bold=True)
-        self.p_font     = pygame.font.SysFont("Arial", 150, bold=True)
+        self.title_font = get_font("Arial", 180, bold=True)
+        self.p_font     = get_font("Arial", 150, bold=True)
         self.title_rect = self.title_font.render("Mode Select", True, WHITE).get_rect(center=(W//2, 100))
         self.p1_rect    = self.p_font.render("1P", True, WHITE).get_rect(center=(280, 390))
         self.p2_rect    = self.p_font.render("2P", True, WHITE).get_rect(center=(W-240, 390))
 
         # 캐릭터
-        left_img  = pygame.image.load(f"{assets_dir}/1p.png").convert_alpha()
-        right_img = pygame.image.load(f"{assets_dir}/2p.png").convert_alpha()
-        self.left_img  = pygame.transform.smoothscale(left_img, (550, 900))
-        self.right_img = pygame.transform.smoothscale(right_img, (500, 900))
+        self.left_img  = load_image(f"{assets_dir}/1p.png", MODE_1P_SIZE)
+        self.right_img = load_image(f"{assets_dir}/2p.png", MODE_2P_SIZE)
 
         self.left_dim  = self.left_img.copy();  self.left_dim.fill((100,100,100,255),  special_flags=pygame.BLEND_RGBA_MULT)
         self.right_dim = self.right_img.copy(); self.right_dim.fill((100,100,100,255), special_flags=pygame.BLEND_RGBA_MULT)
@@ -168,14 +170,14 @@ class ModeSelectScene:
         self._gauge(screen, self.right_pos, self.right_dim, self.right_green if self.result=="Multi" else self.right_red, self._r2)
 
         # 하단 힌트
-        hint_font=pygame.font.SysFont("Arial", 36)
         hint="1P: LEFT · 2P: RIGHT · 2초 유지로 선택 · 1/2 키 테스트 · ESC 종료"
-        hs=hint_font.render(hint, True, (230,230,230))
-        screen.blit(hs, hs.get_rect(midbottom=(self.W//2, self.H-20)))
+        hint_font=fonts.for_text(hint, "Arial", 36)
+        hs=render_text(hint_font, hint, (230,230,230))
+        damage.add(screen.blit(hs, hs.get_rect(midbottom=(self.W//2, self.H-20))))
 
     # 게이지 채우기
     def _gauge(self, screen, pos, base, overlay, ratio):
-        x,y=pos; screen.blit(base, (x,y))
+        x,y=pos; damage.add(screen.blit(base, (x,y)))
         ratio=max(0.0, min(1.0, ratio))
         if ratio<=0: return
         w,h=overlay.get_width(), overlay.get_height()
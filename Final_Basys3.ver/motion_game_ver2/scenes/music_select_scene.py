@@ -1,9 +1,19 @@
 # scenes/music_select_scene.py
 import time, queue, threading
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional
 from pathlib import Path
 import pygame
 
+from utils.neon import draw_neon_text, render_text, render_neon_text
+from utils.fonts import get_font
+from utils.dirty import damage
+from utils.layers import StaticLayer
+from utils.assets import load_image
+from utils.surfaces import overlays
+from utils.layout import CARD_SIZE
+from utils.songs import SongIndex, song_index
+
 try:
     import serial
 except Exception:
@@ -66,27 +76,28 @@ class Choice:
     hold: Hold
     scale_on_hold: float = 1.25
     enabled: bool = True
+    zoom: list = field(default_factory=list)      # 홀드/확정 애니메이션용 미리 스케일한 프레임
+    dim: Optional[pygame.Surface] = None          # 비활성 카드용 반투명 사본
 
-# ---- 텍스트/그림 도우미 (필요한 것만) ----
-def draw_neon_text(surface, font, text, base_color, glow_color, rect, glow_layers=6):
-    for i in range(1, glow_layers+1):
-        g = font.render(text, True, glow_color); g.set_alpha(40)
-        for dx,dy in ((i,0),(-i,0),(0,i),(0,-i),(i,i),(-i,-i),(i,-i),(-i,i)): surface.blit(g, rect.move(dx,dy))
-    surface.blit(font.render(text, True, base_color), rect)
+# 확정 애니메이션은 scale_on_hold-ZOOM_SPAN .. scale_on_hold 구간을 ZOOM_FRAMES장으로 근사
+ZOOM_SPAN   = 0.1
+ZOOM_FRAMES = 8
 
+# 카드 슬롯 순서(좌상→우상→좌하→우하)와 슬롯별 UART 토큰
+SLOT_TOKENS = (("LT","LEFTTOP","LEFT_TOP"), ("RT","RIGHTTOP","RIGHT_TOP"),
+               ("LB","LEFTBOTTOM","LEFT_BOT"), ("RB","RIGHTBOTTOM","RIGHT_BOT"))
+SLOT_KEYS   = (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4)
+
+# ---- 텍스트/그림 도우미 (필요한 것만) ----
 def draw_fill_text(surface, font, text, rect, ratio, base_color=WHITE, fill_color=NEON_YELLOW):
-    base = font.render(text, True, base_color); base_rect = base.get_rect(center=rect.center)
-    surface.blit(base, base_rect.topleft)
+    base = render_text(font, text, base_color); base_rect = base.get_rect(center=rect.center)
+    damage.add(surface.blit(base, base_rect.topleft), surface)
     ratio=max(0.0,min(1.0,ratio)); 
     if ratio<=0: return
-    fill = font.render(text, True, fill_color)
+    fill = render_text(font, text, fill_color)
     clip_w = int(fill.get_width()*ratio)
     surface.set_clip(pygame.Rect(base_rect.x, base_rect.y, clip_w, fill.get_height()))
-    surface.blit(fill, base_rect.topleft); surface.set_clip(None)
-
-def load_image(path: Path, size=None, alpha=True):
-    img = pygame.image.load(str(path)).convert_alpha() if alpha else pygame.image.load(str(path)).convert()
-    return pygame.transform.smoothscale(img, size) if size else img
+    damage.add(surface.blit(fill, base_rect.topleft), surface); surface.set_clip(None)
 
 class MusicSelectScene:
     """
@@ -94,13 +105,18 @@ class MusicSelectScene:
       - enter() / exit()
       - handle_event(e, now)
       - update(dt, now)
-      - draw(screen)
+      - static_surface(base) -> 배경 + 정적 요소(타이틀, 비활성 카드) 합성본
+      - draw(screen)  (동적 요소만)
       - done() -> bool
       - get_result() -> str (예: 'GOLDEN'/'SODA'/...)
+    카드는 songs(매니페스트) 순서대로 슬롯에 배치, 남는 슬롯은 'Coming Soon'.
     """
-    def __init__(self, W, H, *, assets_dir: Path, port=None, baud=115200, hold=2.0, timeout=0.25, debug=False, confirm_show: float = 1.0):
+    def __init__(self, W, H, *, assets_dir: Path, port=None, baud=115200, hold=2.0, timeout=0.25, debug=False, confirm_show: float = 1.0,
+                 songs: Optional[SongIndex] = None):
         self.W, self.H = W, H
         self.assets = Path(assets_dir)
+        self.songs = songs or song_index()
+        self._tokens: dict = {}    # UART 토큰 → 카드 key
         self.port, self.baud, self.debug = port, baud, debug
         self.hold_s, self.timeout = hold, timeout
 
@@ -109,36 +125,47 @@ class MusicSelectScene:
         self._entered=False
         self.confirm_show = confirm_show
         self._kb_hold = None
+        self.static_layer = StaticLayer(self._build_static, key=self._layout_key)
 
     def enter(self):
         # 배경/이미지/폰트
         W,H = self.W, self.H
         self.bg = load_image(self.assets/"background.png", size=(W,H), alpha=False)
-        golden = load_image(self.assets/"golden.png", size=(530,500), alpha=True)
-        soda   = load_image(self.assets/"soda_pop.png", size=(530,500), alpha=True)
-        ques   = load_image(self.assets/"ques.png", size=(530,500), alpha=True)
+        ques   = load_image(self.assets/"ques.png", size=CARD_SIZE, alpha=True)
 
-        self.title_font = pygame.font.SysFont("Arial", 180, bold=True)
+        self.title_font = get_font("Arial", 180, bold=True)
         self.title_rect = self.title_font.render("Music Select", True, WHITE).get_rect(center=(W//2, 100))
 
-        rect_lt = pygame.Rect(0, 300, 530, 500)
-        rect_rt = pygame.Rect(W-530, 300, 530, 500)
-        rect_lb = pygame.Rect(0, 910, 530, 500)
-        rect_rb = pygame.Rect(W-530, 910, 530, 500)
-
-        lbl_big = pygame.font.SysFont("Arial", 110, bold=True)
-        lbl_mid = pygame.font.SysFont("Arial", 100, bold=True)
-        t_g = lbl_big.render("Golden", True, WHITE).get_rect(center=(rect_lt.centerx, rect_lt.top-40))
-        t_s = lbl_big.render("Soda Pop", True, WHITE).get_rect(center=(rect_rt.centerx, rect_rt.top-40))
-        t_c1= lbl_mid.render("Coming Soon", True, WHITE).get_rect(center=(rect_lb.centerx, rect_lb.top-40))
-        t_c2= lbl_mid.render("Coming Soon", True, WHITE).get_rect(center=(rect_rb.centerx, rect_rb.top-40))
-
-        self.choices = [
-            Choice("GOLDEN","Golden",     golden, rect_lt, t_g, Hold(self.hold_s, self.timeout), enabled=True),
-            Choice("SODA",  "Soda Pop",   soda,   rect_rt, t_s, Hold(self.hold_s, self.timeout), enabled=True),
-            Choice("COMING1","Coming Soon",ques,  rect_lb, t_c1, Hold(self.hold_s, self.timeout), enabled=False),
-            Choice("COMING2","Coming Soon",ques,  rect_rb, t_c2, Hold(self.hold_s, self.timeout), enabled=False),
-        ]
+        slots = [pygame.Rect(0, 300, 530, 500), pygame.Rect(W-530, 300, 530, 500),
+                 pygame.Rect(0, 910, 530, 500), pygame.Rect(W-530, 910, 530, 500)]
+
+        self.lbl_big = lbl_big = get_font("Arial", 110, bold=True)
+        self.lbl_mid = lbl_mid = get_font("Arial", 100, bold=True)
+
+        songs = self.songs.songs()
+        if len(songs) > len(slots) and self.debug:
+            print(f"[MUSIC][WARN] 곡 {len(songs)}개 중 {len(slots)}개만 표시")
+        self.choices = []
+        self._tokens = {}
+        for i, rect in enumerate(slots):
+            if i < len(songs):
+                s = songs[i]
+                img = load_image(s.card, size=CARD_SIZE, alpha=True) if s.card else ques
+                font = lbl_big
+                ch = Choice(s.key, s.label, img, rect, None, Hold(self.hold_s, self.timeout), enabled=True)
+                tokens = (s.key, *s.aliases) + ((s.start_char.upper(),) if s.start_char else ())
+            else:
+                n = i - len(songs) + 1
+                font = lbl_mid
+                ch = Choice(f"COMING{n}", "Coming Soon", ques, rect, None, Hold(self.hold_s, self.timeout), enabled=False)
+                tokens = (ch.key, f"C{n}")
+            ch.text_rect = pygame.Rect((0, 0), font.size(ch.label))
+            ch.text_rect.center = (rect.centerx, rect.top-40)
+            for t in tokens + SLOT_TOKENS[i]:
+                self._tokens.setdefault(t.upper(), ch.key)
+            self.choices.append(ch)
+        for ch in self.choices:
+            self._prepare_frames(ch)
 
         # UART
         if self.port and serial is not None:
@@ -160,28 +187,20 @@ class MusicSelectScene:
 
     def handle_event(self, e, now):
         if e.type == pygame.KEYDOWN:
-            if e.key==pygame.K_1: self._kb_hold = "GOLDEN"
-            elif e.key==pygame.K_2: self._kb_hold = "SODA"
-            elif e.key==pygame.K_3: self._kb_hold = "COMING1"
-            elif e.key==pygame.K_4: self._kb_hold = "COMING2"
+            if e.key in SLOT_KEYS:   # 1~4 = 슬롯 순서
+                self._kb_hold = self.choices[SLOT_KEYS.index(e.key)].key
         elif e.type == pygame.KEYUP:
             # 1~4 키를 떼면 중지
-            if e.key in (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4):
+            if e.key in SLOT_KEYS:
                 self._kb_hold = None
 
     def _drain_uart(self):
         try:
             while True:
                 _typ, s, ts = self.q.get_nowait()
-                su = s.upper()
-                if su in ("GOLDEN","G","LT","LEFTTOP","LEFT_TOP"):
-                    self._pulse("GOLDEN", ts)
-                elif su in ("SODA","SODAPOP","SODA_POP","S","RT","RIGHTTOP","RIGHT_TOP"):  # ★ SODAPOP 추가
-                    self._pulse("SODA", ts)
-                elif su in ("COMING1","C1","LB","LEFTBOTTOM","LEFT_BOT"):
-                    self._pulse("COMING1", ts)
-                elif su in ("COMING2","C2","RB","RIGHTBOTTOM","RIGHT_BOT"):
-                    self._pulse("COMING2", ts)
+                key = self._tokens.get(s.upper())   # 곡 키/별칭/시작 문자/슬롯 토큰
+                if key:
+                    self._pulse(key, ts)
         except queue.Empty:
             pass
 
@@ -201,26 +220,71 @@ class MusicSelectScene:
         else:
             self._confirm_t += dt
 
+    # ---- 프리로드 힌트 ----
+    def enabled_keys(self):
+        return [ch.key for ch in self.choices if ch.enabled] if self._entered else []
+
+    def focus_key(self):
+        """홀드 게이지가 차고 있거나 확정된 카드 key (없으면 None)"""
+        if self._selected:
+            return self._selected
+        for ch in self.choices:
+            if ch.enabled and ch.hold.progress > 0.0:
+                return ch.key
+        return None
+
+    # ---- 카드 프레임 미리 계산 (draw에서 smoothscale/copy 안 함) ----
+    def _prepare_frames(self, ch: Choice):
+        if not ch.enabled:
+            ch.dim = ch.img.copy()
+            ch.dim.set_alpha(120)
+            return
+        w, h = ch.img.get_size()
+        lo = ch.scale_on_hold - ZOOM_SPAN
+        ch.zoom = []
+        for i in range(ZOOM_FRAMES):
+            s = lo + ZOOM_SPAN * i / (ZOOM_FRAMES - 1)
+            ch.zoom.append(pygame.transform.smoothscale(ch.img, (int(w*s), int(h*s))))
+
+    def _zoom_frame(self, ch: Choice, scale: float) -> pygame.Surface:
+        if scale == 1.0 or not ch.zoom:
+            return ch.img
+        k = (scale - (ch.scale_on_hold - ZOOM_SPAN)) / ZOOM_SPAN
+        i = int(round(max(0.0, min(1.0, k)) * (ZOOM_FRAMES - 1)))
+        return ch.zoom[i]
+
+    # ---- 정적 레이어 ----
+    def _layout_key(self):
+        """레이아웃이 바뀌면 정적 레이어 재합성"""
+        return (self.W, self.H, tuple(self.title_rect),
+                tuple((ch.key, ch.enabled, tuple(ch.base_rect), tuple(ch.text_rect)) for ch in self.choices))
+
+    def _build_static(self, layer: StaticLayer):
+        # 타이틀 (VGA 영역과 살짝 겹치므로 over=True: 카메라 위로 다시 올림)
+        layer.blit(render_neon_text(self.title_font, "Music Select", WHITE, NEON_BLUE),
+                   self.title_rect.move(-6, -6).topleft, over=True)
+        for ch in self.choices:
+            if ch.enabled:
+                continue
+            # 비활성: 반투명하게, 게이지/스케일 효과 금지
+            rect = ch.dim.get_rect(center=ch.base_rect.center)
+            layer.blit(ch.dim, rect.topleft)
+            # 회색 라벨
+            layer.blit(render_neon_text(self.lbl_mid, ch.label, (180,180,180), (60,60,60)),
+                       ch.text_rect.move(-6, -6).topleft, over=True)
+            # 자물쇠 모양(간단 박스)
+            layer.blit(overlays.rounded(rect.size, (0,0,0,80), radius=20), rect.topleft)
+
+    def static_surface(self, base: "pygame.Surface") -> "pygame.Surface":
+        return self.static_layer.get(base)
+
     def draw(self, screen):
-        draw_neon_text(screen, self.title_font, "Music Select", WHITE, NEON_BLUE, self.title_rect)
+        """동적 요소만 (타이틀/비활성 카드는 static_surface에 포함)"""
         now = time.monotonic()
 
         for ch in self.choices:
             ratio, holding, _ = ch.hold.update(0, now)
-
-            # 비활성: 반투명하게, 게이지/스케일 효과 금지
             if not ch.enabled:
-                img = ch.img.copy()
-                img.set_alpha(120)
-                rect = img.get_rect(center=ch.base_rect.center)
-                screen.blit(img, rect.topleft)
-                # 회색 라벨
-                font = pygame.font.SysFont("Arial", 100, bold=True)
-                draw_neon_text(screen, font, ch.label, (180,180,180), (60,60,60), ch.text_rect)
-                # 자물쇠 모양(간단 박스)
-                lock = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-                pygame.draw.rect(lock, (0,0,0,80), lock.get_rect(), border_radius=20)
-                screen.blit(lock, rect.topleft)
                 continue
 
             # 활성 카드: 기존 로직 그대로
@@ -229,17 +293,15 @@ class MusicSelectScene:
                 t = min(1.0, self._confirm_t / self.confirm_show)
                 scale = ch.scale_on_hold - 0.1 * t
 
-            img = ch.img
             if scale != 1.0:
-                sw, sh = int(img.get_width()*scale), int(img.get_height()*scale)
-                simg = pygame.transform.smoothscale(img, (sw, sh))
+                simg = self._zoom_frame(ch, scale)
                 rect = simg.get_rect(center=ch.base_rect.center)
-                screen.blit(simg, rect.topleft)
+                damage.add(screen.blit(simg, rect.topleft))
             else:
                 rect = ch.base_rect
-                screen.blit(img, rect.topleft)
+                damage.add(screen.blit(ch.img, rect.topleft))
 
-            font = pygame.font.SysFont("Arial", 110, bold=True)
+            font = self.lbl_big
             draw_neon_text(screen, font, ch.label, WHITE, NEON_RED, ch.text_rect)
             fill_ratio = 1.0 if (self._selected==ch.key) else ratio
             if fill_ratio > 0.0:
@@ -249,10 +311,9 @@ class MusicSelectScene:
                 t = min(1.0, self._confirm_t / self.confirm_show)
                 flash_alpha = int(180 * (1.0 - t))
                 if flash_alpha > 0:
-                    s = pygame.Surface((rect.width+30, rect.height+30), pygame.SRCALPHA)
-                    s.fill((255,255,255, flash_alpha))
+                    s = overlays.solid((rect.width+30, rect.height+30), (255,255,255), flash_alpha)
                     r = s.get_rect(center=rect.center)
-                    screen.blit(s, r.topleft)
+                    damage.add(screen.blit(s, r.topleft))
 
     def done(self): 
         # 선택 후 1초 보여주고 끝내고 싶다면:
@@ -5,7 +5,16 @@ from pathlib import Path
 from typing import Optional, List
 
 import pygame
-import numpy as np
+
+from utils.cam_presenter import CamPresenter
+from utils.fonts import get_font
+from utils.dirty import damage
+from utils.assets import load_image, audit
+from utils.surfaces import overlays
+from utils.layout import MOTION_SIZE, GEAR_SIZE, PLAY_VGA_SIZE
+from utils.songs import Song
+from utils.motion_stream import MotionStream
+from utils.recorder import recorder
 
 try:
     import serial
@@ -179,18 +188,75 @@ class _Hold:
         return r, holding, just
 
 
+# -------------- Song pack 탐색 (매니페스트 없는 폴더용 폴백) --------------
+RESULT_STEMS = (("P","perfect"), ("G","good"), ("B","bad"))
+
+def find_png_ci(folder: Path, stem_lower: str) -> Path | None:
+    """folder 안에서 .png 파일을 이름(확장자 제외) 대소문자 무시로 찾아서 Path 반환"""
+    try:
+        want = stem_lower.lower()
+        for p in Path(folder).iterdir():
+            if p.is_file() and p.suffix.lower()==".png" and p.stem.lower()==want:
+                return p
+    except Exception:
+        pass
+    return None
+
+def find_motion_images(root: Path) -> list[Path]:
+    rx1 = re.compile(r'^(?:G|S|M)(\d+)\.png$', re.IGNORECASE)
+    rx2 = re.compile(r'^(\d+)\.png$', re.IGNORECASE)
+
+    items = []
+    for p in Path(root).iterdir():
+        if not p.is_file(): 
+            continue
+        m = rx1.match(p.name) or rx2.match(p.name)
+        if m:
+            items.append((int(m.group(1)), p))
+    items.sort(key=lambda t: t[0])
+    return [p for _, p in items]
+
+def lookup_pack_png(assets_dir: Path, overlay_dir: Path, stem: str) -> Path | None:
+    """곡 폴더에서 먼저 찾고, 없으면 루트 assets에서도 찾아본다"""
+    return find_png_ci(assets_dir, stem) or find_png_ci(overlay_dir, stem)
+
+def scan_song(assets_dir: Path, overlay_dir: Optional[Path] = None) -> Song:
+    """songs.json에 없는 폴더를 직접 스캔해 Song 구성 (곡 폴더 → 루트 assets 순)"""
+    assets_dir = Path(assets_dir)
+    overlay_dir = Path(overlay_dir) if overlay_dir else assets_dir.parent
+    overlays = {}
+    for k, stem in RESULT_STEMS:
+        p = lookup_pack_png(assets_dir, overlay_dir, stem)
+        if p:
+            overlays[k] = p
+    return Song(key=assets_dir.name.upper(), label=assets_dir.name, folder=assets_dir,
+                start_char=None, pattern_rom_base=0,
+                motions=find_motion_images(assets_dir), overlays=overlays,
+                gear=lookup_pack_png(assets_dir, overlay_dir, "gear"))
+
+def pack_image_jobs(song: Song, motion_ahead: int = 1) -> list:
+    """PlayScene이 처음 쓸 이미지 목록 [(path, size, alpha)] — 프리로더가 같은 키로 미리 디코드
+    (모션은 앞의 motion_ahead+1장만: 나머지는 MotionStream이 게임 중에 당겨 옴)"""
+    jobs = [(p, MOTION_SIZE, True) for p in song.motions[:motion_ahead + 1]]
+    jobs += [(p, PLAY_VGA_SIZE, True) for p in song.overlays.values()]
+    if song.gear:
+        jobs.append((song.gear, GEAR_SIZE, True))
+    return jobs
+
+
 # -------------- Play Scene --------------
 class PlayScene:
     """
-    - 좌측: 현재 Motion 이미지 (M1..M*.png 자동 탐색)
+    - 좌측: 현재 Motion 이미지 (song 매니페스트 순서, song이 없으면 M1..M*.png 자동 탐색)
     - 상단: 카운트다운 숫자(우상단), 게이지 바
     - 우측 VGA 영역: 카메라 or (결과) Perfect/Good/Bad 오버레이
     - UART: P/G/B 라인 수신 → 결과 표시 result_hold초 → mN_done 송신
     - UART: PAUSE/MENU/GEAR 펄스 pause_hold초 유지 → pause 요청 (콘솔 로그)
     인터페이스:
-      enter()/exit()/handle_event(e, now)/update(dt, now)/draw(screen, frame_bgr)/done()/get_result()
+      enter()/exit()/handle_event(e, now)/update(dt, now)/draw(screen, frame_bgr, frame_id)/done()/get_result()
     """
-    def __init__(self, W:int, H:int, *, assets_dir: Path,
+    def __init__(self, W:int, H:int, *, assets_dir: Optional[Path] = None,
+                 song: Optional[Song] = None,
                  overlay_dir: Optional[Path] = None, 
                  port: Optional[str]=None, baud:int=115200,
                  prep_seconds: float=5.0, result_hold: float=3.0,
@@ -200,11 +266,14 @@ class PlayScene:
                  pre_start_seconds: float = 0.0, start_token: str = "game_start",
                  start_char:str | None = None, done_char:str | None = "f",
                  result_bytes: dict | None = None,          # ★ 추가
-                 ending_byte: bytes | None = b"e"           # ★ 추가
+                 ending_byte: bytes | None = b"e",          # ★ 추가
+                 motion_ahead: int = 1, motion_budget_mb: float = 16.0
                  ):
         self.W, self.H = W, H
-        self.assets_dir = Path(assets_dir)
+        self.assets_dir = Path(assets_dir) if assets_dir else song.folder
         self.overlay_dir = Path(overlay_dir) if overlay_dir else self.assets_dir.parent
+        # 곡 구성: 매니페스트(song)가 있으면 그대로, 없으면 폴더 스캔
+        self.song = song or scan_song(self.assets_dir, self.overlay_dir)
         self.port, self.baud, self.parse_mode, self.debug = port, baud, parse_mode, debug
         self.prep_s = prep_seconds
         self.res_hold = result_hold
@@ -217,11 +286,14 @@ class PlayScene:
         self.LEFT_RECT = pygame.Rect(0, 240, 960, 1200)
         self.MOTION_POS = (220, 450)
         self.SCORE_POS = (W//2, 80)
+        self.cam_presenter = CamPresenter(self.VGA_RECT, tag="play")
 
         # 상태
         self.score = 0
-        self.motion_paths: List[Path] = self._find_motion_images(self.assets_dir)
-        self.motion_imgs = self._load_motion_surfaces(self.motion_paths)
+        self.motion_paths: List[Path] = list(self.song.motions)
+        # 모션 이미지는 현재+다음 motion_ahead장만 상주 (다음 장은 결과 표시 중에 워커가 디코드)
+        self.motions = MotionStream(self.motion_paths, MOTION_SIZE, ahead=motion_ahead,
+                                    budget_bytes=int(motion_budget_mb * 2**20), debug=debug)
         self.motion_idx = 0
         self.pre_start_s = pre_start_seconds
         self.start_token = start_token
@@ -242,23 +314,15 @@ class PlayScene:
         self._kb_pause = False
         self._score_mark_sent = False # 결과 문자(P/G/B) 1회만 송신
 
-        # 결과 오버레이: PNG 대소문자 무시 + 곡 폴더 → 루트 assets 순으로 탐색
+        # 결과 오버레이 (song.overlays: "P"/"G"/"B" → Path)
         self.result_assets = {}
         W, H = self.VGA_RECT.width, self.VGA_RECT.height
 
-        def _lookup(stem):
-            # 곡 폴더에서 먼저 찾고, 없으면 루트 assets에서도 찾아본다
-            return (self._find_png_ci(self.assets_dir, stem) or
-                    self._find_png_ci(self.overlay_dir, stem))
-
-        for k, stem in (("P","perfect"), ("G","good"), ("B","bad")):
-            p = _lookup(stem)
+        for k, _ in RESULT_STEMS:
+            p = self.song.overlays.get(k)
             if p:
                 try:
-                    surf = pygame.image.load(str(p)).convert_alpha()
-                    if (surf.get_width(), surf.get_height()) != (W, H):
-                        surf = pygame.transform.smoothscale(surf, (W, H))
-                    self.result_assets[k] = surf
+                    self.result_assets[k] = load_image(p, (W, H))
                 except Exception as e:
                     if self.debug: print(f"[PLAY] overlay load fail {p}: {e}")
 
@@ -267,8 +331,11 @@ class PlayScene:
             print("[PLAY] some overlays missing; fallback text will be used.")
 
         # UI 리소스
-        self.score_font = pygame.font.SysFont("Arial", 150, bold=True)
-        self.label_font = pygame.font.SysFont("Arial", 150, bold=True)
+        self.score_font = get_font("Arial", 150, bold=True)
+        self.label_font = get_font("Arial", 150, bold=True)
+        self.timer_font = get_font("Arial", 140, bold=True)
+        self.count_font = get_font("Arial", 280, bold=True)
+        self.result_font = get_font("Arial", 220, bold=True)
         self.label_rect = self.label_font.render("Follow Motion", True, WHITE).get_rect(center=(470, H - 1100))
 
         # UART
@@ -276,14 +343,13 @@ class PlayScene:
         self.setting_q: "queue.Queue" = queue.Queue()
         self.uart=None
 
-        # --- gear icon for pause (대소문자 무시 + 곡 폴더 → 루트) ---
-        self.label_font = pygame.font.SysFont("Arial", 150, bold=True)
+        # --- gear icon for pause ---
+        self.label_font = get_font("Arial", 150, bold=True)
         self.label_gap = 24  # 모션 이미지 위로 띄울 간격(px)
-        p_gear = _lookup("gear")
+        p_gear = self.song.gear
         if p_gear:
             try:
-                img = pygame.image.load(str(p_gear)).convert_alpha()
-                self.gear_img = pygame.transform.smoothscale(img, (90, 90))
+                self.gear_img = load_image(p_gear, GEAR_SIZE)
                 self.gear_rect = self.gear_img.get_rect(topleft=(24, 18))
             except Exception as e:
                 if self.debug: print(f"[WARN] gear load fail {p_gear}: {e}")
@@ -311,6 +377,8 @@ class PlayScene:
         self._pending_result = None
         self.motion_idx = 0
         self.score = 0
+        self.motions.seek(0)
+        self.motions.prefetch(1)
 
         # --- 일시정지/홀드 관련 플래그 초기화 ---
         self.pause_requested = False
@@ -362,54 +430,11 @@ class PlayScene:
             self.uart.stop()
             self.uart.join(timeout=1.0)
             self.uart=None
+        if self.debug:
+            print(f"[PLAY] motion stream {self.motions.stats()}")
+        self.motions.close()
 
     # ---------- helpers ----------
-    def _find_png_ci(self, folder: Path, stem_lower: str) -> Path | None:
-        """folder 안에서 .png 파일을 이름(확장자 제외) 대소문자 무시로 찾아서 Path 반환"""
-        try:
-            want = stem_lower.lower()
-            for p in folder.iterdir():
-                if p.is_file() and p.suffix.lower()==".png" and p.stem.lower()==want:
-                    return p
-        except Exception:
-            pass
-        return None
-
-    def _find_motion_images(self, root: Path) -> list[Path]:
-        rx1 = re.compile(r'^(?:G|S|M)(\d+)\.png$', re.IGNORECASE)
-        rx2 = re.compile(r'^(\d+)\.png$', re.IGNORECASE)
-
-        items = []
-        for p in root.iterdir():
-            if not p.is_file(): 
-                continue
-            m = rx1.match(p.name) or rx2.match(p.name)
-            if m:
-                items.append((int(m.group(1)), p))
-        items.sort(key=lambda t: t[0])
-        return [p for _, p in items]
-
-    def _load_motion_surfaces(self, paths: List[Path]):
-        out={}
-        for p in paths:
-            try:
-                img = pygame.image.load(str(p)).convert_alpha()
-                img = pygame.transform.smoothscale(img, (550, 900))
-                out[p.name] = img
-            except Exception as e:
-                print(f"[WARN] image load fail {p}: {e}")
-        return out
-
-    # [추가] 파일명 대소문자 무시로 .png 찾기
-    def _find_png_ci(self, folder: Path, stem_lower: str) -> Path | None:
-        try:
-            for p in folder.iterdir():
-                if p.is_file() and p.suffix.lower()==".png" and p.stem.lower()==stem_lower:
-                    return p
-        except Exception:
-            pass
-        return None
-
     def _build_missing_overlays(self):
         """Perfect/Good/Bad 모듈의 build_surface()를 이용해 부족한 오버레이를 런타임 생성."""
         #W, H = self.VGA_RECT.width, self.VGA_RECT.height
@@ -451,33 +476,20 @@ class PlayScene:
         if self.debug:
             print("[PLAY] overlay builders disabled; using PNGs only.")
 
-    def _blit_cam(self, surface: "pygame.Surface", frame_bgr, rect: pygame.Rect):
-        """OpenCV BGR 프레임을 rect 안에 비율 유지로 렌더."""
-        pygame.draw.rect(surface, (0,0,0), rect)
-        if frame_bgr is None:
-            return
-        if not isinstance(frame_bgr, np.ndarray) or frame_bgr.ndim!=3 or frame_bgr.shape[2]!=3:
-            return
-        # BGR -> RGB
-        rgb = frame_bgr[:, :, ::-1]
-        h, w = rgb.shape[:2]
-        s = min(rect.width / w, rect.height / h)
-        nw, nh = max(1, int(w*s)), max(1, int(h*s))
-        rgb_resized = pygame.transform.smoothscale(
-            pygame.image.frombuffer(rgb.tobytes(), (w, h), "RGB"), (nw, nh)
-        )
-        ox = rect.x + (rect.width - nw)//2
-        oy = rect.y + (rect.height - nh)//2
-        surface.blit(rgb_resized, (ox, oy))
+    def _blit_cam(self, surface: "pygame.Surface", frame_bgr, rect: pygame.Rect, frame_id=None, origin=None):
+        """OpenCV BGR 프레임을 rect 안에 비율 유지로 렌더. (같은 frame_id면 변환 생략, origin=지연 계측 기준 시각)"""
+        if self.cam_presenter.rect != rect:
+            self.cam_presenter = CamPresenter(rect, tag="play")
+        self.cam_presenter.draw(surface, frame_bgr, frame_id, origin)
 
     def _draw_top_timer(self, surface, t_left, t_total):
-        font_num = pygame.font.SysFont("Arial", 140, bold=True)
+        font_num = self.timer_font
         secs = max(0, int(t_left + 0.999))
-        num_rect = font_num.render("0", True, WHITE).get_rect(topright=(self.W - 60, 20))
+        num_rect = pygame.Rect((0, 0), font_num.size("0")); num_rect.topright = (self.W - 60, 20)
         draw_neon_text(surface, font_num, str(secs), WHITE, NEON_YELLOW, num_rect)
 
         bar_rect = pygame.Rect(60, 190, self.W - 120, 24)
-        pygame.draw.rect(surface, GAUGE_BG, bar_rect, border_radius=12)
+        damage.add(pygame.draw.rect(surface, GAUGE_BG, bar_rect, border_radius=12), surface)
         ratio = 0.0 if t_total <= 0 else max(0.0, min(1.0, (t_total - t_left)/t_total))
         fill = bar_rect.copy(); fill.width = int(bar_rect.width * ratio)
         pygame.draw.rect(surface, NEON_RED, fill, border_radius=12)
@@ -487,12 +499,12 @@ class PlayScene:
         img = self.result_assets.get(result)
         if img:
             # 이미 정사이즈로 보정됨
-            surface.blit(img, rect.topleft)
+            damage.add(surface.blit(img, rect.topleft), surface)
         else:
             # 폴백 텍스트
-            font = pygame.font.SysFont("Arial", 220, bold=True)
+            font = self.result_font
             txt = {"P":"PERFECT","G":"GOOD","B":"BAD"}[result]
-            r = font.render(txt, True, WHITE).get_rect(center=rect.center)
+            r = pygame.Rect((0, 0), font.size(txt)); r.center = rect.center
             glow = {"P":NEON_GREEN,"G":NEON_BLUE,"B":NEON_RED}[result]
             draw_neon_text(surface, font, txt, WHITE, glow, r)
 
@@ -505,6 +517,11 @@ class PlayScene:
                 elif e.key==pygame.K_g: self._pending_result = ("G", now)
                 elif e.key==pygame.K_b: self._pending_result = ("B", now)
 
+            # 판정 이의: D 키 → 최근 구간 클립 저장 (MG_RECORD=1일 때)
+            if e.key==pygame.K_d:
+                recorder.mark("dispute", motion=self.motion_idx + 1, result=self.result_value)
+                recorder.request_clip("dispute", priority=True, motion=self.motion_idx + 1)
+
             # ★ 세팅(일시정지) 테스트: M 키를 '홀드'로 사용
             if e.key==pygame.K_m:
                 self._kb_pause = True      # 누르는 동안 유지
@@ -535,6 +552,7 @@ class PlayScene:
     def update(self, dt: float, now: float):
         # UART 메시지 처리
         self._drain_uart(now)
+        self.motions.pump()
 
         # ★ 키보드 M을 누르고 있는 동안에는 매 프레임 pulse 유지
         if self._kb_pause:
@@ -556,6 +574,8 @@ class PlayScene:
                 self.state = "show_result"
                 self.t0 = now
                 self._pending_result = None   # 보류 비우기
+                self.motions.prefetch(self.motion_idx + 1)   # 결과 표시 동안 다음 모션 디코드
+                recorder.mark("result", value=code, motion=self.motion_idx + 1, score=self.score)
 
         # ⬇️ prestart 상태 처리: 3..2..1 대기 → 끝나면 UART로 start 토큰 1회 송신
         if self.state == "prestart":
@@ -616,49 +636,53 @@ class PlayScene:
                     if tag: print(f"[ACK] (fake) send byte '{tag}'")
 
                 self._round_active = False
+                recorder.request_clip(f"round{self.motion_idx + 1}", motion=self.motion_idx + 1)   # 라운드 하이라이트
 
                 if is_last:
                     self.state = "done"
                 else:
                     self.motion_idx += 1
+                    self.motions.seek(self.motion_idx)
                     self.result_value = None
                     self.state = "prepare"
                     self.t0 = now
 
-    def draw(self, screen: "pygame.Surface", frame_bgr):
+    def on_last_motion(self) -> bool:
+        """마지막 모션 진행 중 (엔딩 준비 시작 시점)"""
+        return bool(self.motion_paths) and self.motion_idx >= len(self.motion_paths) - 1
+
+    def draw(self, screen: "pygame.Surface", frame_bgr, frame_id=None, frame_origin=None):
         # 좌측 반투명 오버레이
-        s = pygame.Surface((self.LEFT_RECT.width, self.LEFT_RECT.height), pygame.SRCALPHA)
-        s.fill((255,255,255,180))
-        screen.blit(s, self.LEFT_RECT.topleft)
+        s = overlays.solid(self.LEFT_RECT.size, (255,255,255), 180)
+        damage.add(screen.blit(s, self.LEFT_RECT.topleft))
 
         # 우측 VGA 영역
-        pygame.draw.rect(screen, (0,0,0), self.VGA_RECT)
+        damage.add(pygame.draw.rect(screen, (0,0,0), self.VGA_RECT))
 
         # 점수
         score_text = f"Score : {self.score}"
-        score_rect = self.score_font.render(score_text, True, WHITE).get_rect(center=self.SCORE_POS)
+        score_rect = pygame.Rect((0, 0), self.score_font.size(score_text)); score_rect.center = self.SCORE_POS
         draw_neon_text(screen, self.score_font, score_text, WHITE, NEON_BLUE, score_rect)
 
         # 라벨
         label_x = self.MOTION_POS[0] + 550 // 2
         label_y = self.MOTION_POS[1] - self.label_gap
-        label_rect = self.label_font.render("Follow Motion", True, WHITE)\
-                    .get_rect(midbottom=(label_x, label_y))
+        label_rect = pygame.Rect((0, 0), self.label_font.size("Follow Motion"))
+        label_rect.midbottom = (label_x, label_y)
         draw_neon_text(screen, self.label_font, "Follow Motion", WHITE, NEON_RED, label_rect)
 
         # 현재 모션 이미지
         if self.motion_idx < len(self.motion_paths):
-            key = self.motion_paths[self.motion_idx].name
-            img = self.motion_imgs.get(key)
+            img = self.motions.get(self.motion_idx)
             if img:
-                screen.blit(img, self.MOTION_POS)
+                damage.add(screen.blit(audit.check(img, "motion"), self.MOTION_POS))
 
         # ⬇️ prestart: 중앙에 숫자 카운트다운
         if self.state == "prestart":
             t_left = max(0.0, self.pre_start_s - (time.monotonic() - self.t0))
             secs = max(0, int(t_left + 0.999))
-            font_big = pygame.font.SysFont("Arial", 280, bold=True)
-            rect = font_big.render("0", True, WHITE).get_rect(center=(self.W//2, self.H//2))
+            font_big = self.count_font
+            rect = pygame.Rect((0, 0), font_big.size("0")); rect.center = (self.W//2, self.H//2)
             draw_neon_text(screen, font_big, str(secs), WHITE, NEON_YELLOW, rect)
             return  # prestart는 여기서 그리기 끝
 
@@ -671,25 +695,25 @@ class PlayScene:
         if self.state=="show_result" and self.result_value in ("P","G","B"):
             self._draw_result_overlay(screen, self.VGA_RECT, self.result_value)
         else:
-            self._blit_cam(screen, frame_bgr, self.VGA_RECT)
+            self._blit_cam(screen, frame_bgr, self.VGA_RECT, frame_id, frame_origin)
 
         # 좌상단 기어 + pause 링
         if self.gear_img:
-            screen.blit(self.gear_img, self.gear_rect.topleft)
+            damage.add(screen.blit(self.gear_img, self.gear_rect.topleft))
             center = self.gear_rect.center
         else:
             center = (60, 60)
 
         radius = 60
         thick  = 10
-        pygame.draw.circle(screen, (80,80,90), center, radius, thick)
+        damage.add(pygame.draw.circle(screen, (80,80,90), center, radius, thick))
 
         if self._pause_ratio > 0:
             r = max(0.0, min(1.0, self._pause_ratio))
             start = -math.pi/2
             end   = start + r*2*math.pi
             rect = pygame.Rect(0,0, radius*2, radius*2); rect.center = center
-            pygame.draw.arc(screen, NEON_BLUE, rect, start, end, thick)
+            damage.add(pygame.draw.arc(screen, NEON_BLUE, rect, start, end, thick))
 
     def done(self) -> bool:
         # 모든 모션 종료
@@ -787,4 +811,4 @@ class PlayScene:
                 if s:
                     self.uart.send_line(s)
         except Exception as e:
-            print(f"[UART] send_uart error: {e}")
\ No newline at end of file
+            print(f"[UART] send_uart error: {e}")
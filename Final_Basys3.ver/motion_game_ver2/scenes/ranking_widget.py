@@ -3,6 +3,10 @@ from __future__ import annotations
 import time
 import pygame
 
+from utils.neon import render_text
+from utils.fonts import get_font
+from utils.layers import StaticLayer
+
 # ----- 가벼운 UART 송신 헬퍼 (pyserial 있으면 사용, 없으면 FAKE 로그) -----
 class SerialSender:
     def __init__(self, port: str | None, baud: int = 115200, *, debug: bool = False):
@@ -88,12 +92,14 @@ class RankingScene:
         # 폰트는 pygame.init 이후 생성 가능
         self._font_big = None
         self._font_small = None
+        # 랭킹 화면은 전부 정적 → 한 장으로 미리 합성
+        self.static_layer = StaticLayer(self._build_static, key=lambda: tuple(self.rankings))
 
     def enter(self):
         if self._font_big is None:
-            self._font_big = pygame.font.SysFont(None, 90)
+            self._font_big = get_font(None, 90)
         if self._font_small is None:
-            self._font_small = pygame.font.SysFont(None, 60)
+            self._font_small = get_font(None, 60)
 
         self.start_time = time.monotonic()
         if self.debug:
@@ -105,14 +111,22 @@ class RankingScene:
         if (now - self.start_time) > self.show_seconds:
             self.finished = True
 
-    def draw(self, screen):
-        screen.fill((20, 20, 20))
-        title_txt = self._font_big.render("Ranking Board", True, (255, 215, 0))
-        screen.blit(title_txt, (self.W // 2 - title_txt.get_width() // 2, 80))
+    def _build_static(self, layer: StaticLayer):
+        layer.surface.fill((20, 20, 20))
+        title_txt = render_text(self._font_big, "Ranking Board", (255, 215, 0))
+        layer.blit(title_txt, (self.W // 2 - title_txt.get_width() // 2, 80))
 
         for i, (name, score) in enumerate(self.rankings, start=1):
-            line = self._font_small.render(f"{i}. {name} - {score}", True, (200, 200, 255))
-            screen.blit(line, (self.W // 2 - line.get_width() // 2, 200 + i * 70))
+            line = render_text(self._font_small, f"{i}. {name} - {score}", (200, 200, 255))
+            layer.blit(line, (self.W // 2 - line.get_width() // 2, 200 + i * 70))
+
+    def static_surface(self, base: "pygame.Surface") -> "pygame.Surface":
+        """배경 + 제목 + 순위 목록 합성본 (begin_frame의 base로 사용)"""
+        return self.static_layer.get(base)
+
+    def draw(self, screen):
+        # 그릴 동적 요소 없음 (전부 static_surface에 포함)
+        pass
 
     def done(self) -> bool:
         return self.finished
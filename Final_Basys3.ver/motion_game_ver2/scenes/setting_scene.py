@@ -3,6 +3,12 @@ import time
 import pygame
 from pathlib import Path
 
+from utils.neon import render_text
+from utils.fonts import get_font
+from utils.dirty import damage
+from utils.assets import load_image
+from utils.surfaces import overlays
+
 WHITE=(255,255,255); ACCENT=(255,220,120)
 
 class _Hold:
@@ -39,9 +45,9 @@ class SettingScene:
         self.W, self.H = W, H
         self.play_scene = play_scene
         self.title = title
-        self.font_title = pygame.font.SysFont("Arial", 160, bold=True)
-        self.font_big   = pygame.font.SysFont("Arial", 80, bold=True)
-        self.font_small = pygame.font.SysFont("Arial", 48, bold=True)
+        self.font_title = get_font("Arial", 160, bold=True)
+        self.font_big   = get_font("Arial", 80, bold=True)
+        self.font_small = get_font("Arial", 48, bold=True)
 
         self.left_box  = None
         self.right_box = None
@@ -131,14 +137,11 @@ class SettingScene:
                selected: bool = False):
 
         # 카드 배경
-        body = pygame.Surface(rect.size, pygame.SRCALPHA)
-        body.fill((0, 0, 0, 150))
-        pygame.draw.rect(body, (255, 255, 255, 90), body.get_rect(), width=3, border_radius=24)
+        body = overlays.rounded(rect.size, (0, 0, 0, 150), border=((255, 255, 255, 90), 3, 24))
         screen.blit(body, rect.topleft)
 
         # 제목만 상단 중앙
-        f_title = pygame.font.SysFont("Arial", 80, bold=True)  # 기존 72 → 80 (가독성)
-        r = f_title.render(title, True, (255, 255, 255))
+        r = render_text(self.font_big, title, (255, 255, 255))  # 80 bold (가독성)
         title_margin_top = 18
         screen.blit(r, (rect.centerx - r.get_width() // 2, rect.top + title_margin_top))
 
@@ -156,12 +159,12 @@ class SettingScene:
 
     def draw(self, screen):
         # 반투명 덮개
-        s = pygame.Surface((self.W, self.H), pygame.SRCALPHA); s.fill((0,0,0,180))
-        screen.blit(s, (0,0))
+        damage.add(screen.blit(overlays.solid((self.W, self.H), (0,0,0), 180), (0,0)))
 
         # 타이틀(조금 더 위로)
-        title_rect = self.font_title.render("Settings", True, WHITE).get_rect(midtop=(self.W//2, 12))  # ★ top 12
-        screen.blit(self.font_title.render("Settings", True, WHITE), title_rect.topleft)
+        title_surf = render_text(self.font_title, "Settings", WHITE)
+        title_rect = title_surf.get_rect(midtop=(self.W//2, 12))  # ★ top 12
+        screen.blit(title_surf, title_rect.topleft)
 
         # 카드(텍스트만: Resume / Quit)
         self._draw_card(screen, self.left_box,  "Resume",  None, None, getattr(self, "_ratio_l", 0.0))
@@ -211,7 +214,7 @@ class SettingScene:
             try:
                 if not png_path.exists():
                     return None
-                img = pygame.image.load(str(png_path)).convert_alpha()
+                img = load_image(png_path)
                 iw, ih = img.get_size()
 
                 # 카드 내부에서 이미지가 들어갈 영역 계산 (타이틀/게이지 여백 제외)
@@ -227,8 +230,7 @@ class SettingScene:
 
                 s = min(area_w / iw, area_h / ih, 1.0)
                 new_size = (max(1, int(iw*s)), max(1, int(ih*s)))
-                fitted = pygame.transform.smoothscale(img, new_size)
-                return fitted
+                return load_image(png_path, new_size)   # 맞춘 크기도 캐시 (일시정지마다 재사용)
             except Exception:
                 return None
 
@@ -283,4 +285,4 @@ class SettingScene:
             return
         for v in data:
             ch = chr(v) if 32 <= v <= 126 else '.'
-            print(f"{prefix} 0x{v:02x} ('{ch}')")
\ No newline at end of file
+            print(f"{prefix} 0x{v:02x} ('{ch}')")
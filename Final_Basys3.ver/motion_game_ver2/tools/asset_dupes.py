@@ -0,0 +1,69 @@
+# tools/asset_dupes.py
+# 내용이 같은 PNG 목록 + 공유로 아끼는 메모리 리포트 (AssetCache는 내용 해시 키라 같은 파일은 Surface 하나)
+# 실행: motion_game_ver2 폴더에서  python -m tools.asset_dupes
+import sys, fnmatch, argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PIL import Image
+
+from utils.layout import BAKE_SPECS
+from utils.baked import ASSETS_DIR, BAKE_DIR, content_hash
+
+
+def load_size(path: Path):
+    """
+    런타임에 쓰는 (크기, alpha): BAKE_SPECS에 있으면 그 값, 없으면 원본 크기 + 알파.
+    엔딩 캐릭터(*_ending_*)는 PIL로 배경에 합성될 뿐 AssetCache를 거치지 않으므로 None.
+    """
+    name = path.name.lower()
+    if fnmatch.fnmatchcase(name, "*_ending_*"):
+        return None
+    for pattern, size, alpha in BAKE_SPECS:
+        if fnmatch.fnmatchcase(name, pattern):
+            return tuple(size), alpha
+    with Image.open(path) as im:
+        return im.size, True
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("root", nargs="?", default=str(ASSETS_DIR), help="검사할 폴더 (기본 assets)")
+    args = ap.parse_args()
+    root = Path(args.root).resolve()
+
+    groups: dict = {}
+    for p in sorted(root.rglob("*.png")):
+        if BAKE_DIR in p.parents:
+            continue
+        groups.setdefault(content_hash(p), []).append(p)
+
+    dupes = [(sha, ps) for sha, ps in groups.items() if len(ps) > 1]
+    if not dupes:
+        print("[DUPES] 중복 없음")
+        return
+
+    disk = mem = 0
+    for sha, ps in sorted(dupes, key=lambda g: g[1][0].as_posix().lower()):
+        disk += (len(ps) - 1) * ps[0].stat().st_size
+        # 캐시 키는 (내용 해시, 크기, alpha) → 런타임 크기가 다른 사본은 Surface를 공유하지 못함 (디스크만 중복)
+        by_load: dict = {}
+        for p in ps:
+            by_load.setdefault(load_size(p), []).append(p)
+        saved = sum((len(g) - 1) * ls[0][0] * ls[0][1] * 4               # 화면 포맷 32bpp
+                    for ls, g in by_load.items() if ls is not None)
+        mem += saved
+        print(f"{sha}  x{len(ps)}  saves {saved / 2**20:6.1f} MB"
+              + ("" if len(by_load) == 1 else f"  ({len(by_load)} load sizes, disk-only across sizes)"))
+        for ls, g in by_load.items():
+            tag = "composite" if ls is None else f"{ls[0][0]}x{ls[0][1]} {'rgba' if ls[1] else 'rgb '}"
+            for p in g:
+                print(f"    {tag:<14} {p.relative_to(root).as_posix()}")
+
+    print(f"[DUPES] {len(dupes)} groups, {sum(len(ps) - 1 for _, ps in dupes)} redundant files: "
+          f"disk {disk / 2**20:.1f} MB, decoded surfaces {mem / 2**20:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# tools/bake_assets.py
+# 오프라인 에셋 베이크: utils/layout.BAKE_SPECS 크기로 미리 스케일한 픽셀을 assets/.baked/*.npy로 저장
+# 실행: motion_game_ver2 폴더에서  python -m tools.bake_assets [--clean] [--force] [--dry-run]
+# 런타임 load_image()는 같은 (내용 해시, 크기, alpha)의 .npy가 있으면 mmap으로 바로 쓴다.
+import os, sys, json, time, argparse, fnmatch
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from utils.layout import BAKE_SPECS
+from utils.baked import ASSETS_DIR, BAKE_DIR, INDEX_NAME, content_hash, bake_name
+
+
+def collect(assets: Path):
+    """assets 아래 png 중 BAKE_SPECS에 걸리는 것 → [(path, size, alpha)]"""
+    jobs = []
+    for p in sorted(assets.rglob("*.png")):
+        if BAKE_DIR in p.parents:
+            continue
+        name = p.name.lower()
+        for pattern, size, alpha in BAKE_SPECS:
+            if fnmatch.fnmatchcase(name, pattern):
+                jobs.append((p, size, alpha))
+                break
+    return jobs
+
+
+def render(path: Path, size, alpha: bool) -> np.ndarray:
+    """런타임 load_image와 같은 경로(화면 포맷 변환 → smoothscale)로 만든 HxWxC uint8"""
+    img = pygame.image.load(str(path))
+    img = img.convert_alpha() if alpha else img.convert()
+    if img.get_size() != tuple(size):
+        img = pygame.transform.smoothscale(img, tuple(size))
+    mode = "RGBA" if alpha else "RGB"
+    buf = pygame.image.tobytes(img, mode)
+    return np.frombuffer(buf, np.uint8).reshape(size[1], size[0], len(mode))
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--force", action="store_true", help="이미 있는 .npy도 다시 생성")
+    ap.add_argument("--clean", action="store_true", help="인덱스에 없는 .npy 삭제")
+    ap.add_argument("--dry-run", action="store_true", help="대상 목록만 출력")
+    args = ap.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))   # convert()/convert_alpha()용
+
+    jobs = collect(ASSETS_DIR)
+    if not args.dry_run:
+        BAKE_DIR.mkdir(parents=True, exist_ok=True)
+        (BAKE_DIR / ".gitignore").write_text("*\n")   # 생성물은 커밋하지 않음
+
+    index, used = {}, set()
+    made = skipped = 0
+    total = 0
+    t0 = time.perf_counter()
+    for path, size, alpha in jobs:
+        rel = path.relative_to(ASSETS_DIR).as_posix()
+        sha = content_hash(path)
+        name = bake_name(sha, size, alpha)
+        out = BAKE_DIR / name
+        st = path.stat()
+        index[rel] = {"mtime_ns": st.st_mtime_ns, "bytes": st.st_size, "sha": sha}
+        used.add(name)
+        if args.dry_run:
+            print(f"  {rel:<32} {size[0]}x{size[1]} {'rgba' if alpha else 'rgb '} → {name}")
+            continue
+        if out.exists() and not args.force:
+            skipped += 1
+            continue
+        arr = render(path, size, alpha)
+        tmp = out.with_suffix(".tmp.npy")
+        np.save(tmp, arr)
+        os.replace(tmp, out)
+        made += 1
+        total += arr.nbytes
+        print(f"  baked {rel:<32} {size[0]}x{size[1]} {arr.nbytes / 2**20:6.1f} MB")
+
+    if args.dry_run:
+        print(f"{len(jobs)} files")
+        return
+
+    (BAKE_DIR / INDEX_NAME).write_text(json.dumps(index, indent=1, ensure_ascii=False), encoding="utf-8")
+
+    removed = 0
+    if args.clean:
+        for f in BAKE_DIR.glob("*.npy"):
+            if f.name not in used:
+                f.unlink()
+                removed += 1
+
+    print(f"[BAKE] {made} baked ({total / 2**20:.1f} MB), {skipped} up to date, {removed} removed, "
+          f"{time.perf_counter() - t0:.2f}s → {BAKE_DIR}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# tools/bench_neon.py
+# 네온 글로우 마이크로 벤치마크: 기존 draw_neon_text(8방향 fan) vs 블러 글로우
+# 실행: motion_game_ver2 폴더에서  python -m tools.bench_neon [--n 20]
+import os, sys, time, argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from utils import neon
+
+WHITE = (255, 255, 255); NEON_YELLOW = (255, 220, 120)
+
+# PlayScene(140 타이머 / 150 점수·라벨 / 220 결과 폴백 / 280 카운트다운), StartHoldWidget(150 버튼 / 180 타이틀)
+CASES = [
+    (140, "5"),
+    (150, "Score : 120"),
+    (150, "Start!!"),
+    (180, "Motion Game"),
+    (220, "PERFECT"),
+    (280, "3"),
+]
+
+def legacy_draw(surface, font, text, base_color, glow_color, rect, glow_layers=6, alpha=40):
+    """캐시 도입 전 draw_neon_text (매 호출 렌더 + 48회 블릿)"""
+    glow = font.render(text, True, glow_color).convert_alpha()
+    glow.set_alpha(alpha)
+    for i in range(1, glow_layers + 1):
+        for dx, dy in ((i,0),(-i,0),(0,i),(0,-i),(i,i),(-i,-i),(i,-i),(-i,i)):
+            surface.blit(glow, rect.move(dx, dy))
+    surface.blit(font.render(text, True, base_color), rect)
+
+def _time(fn, n):
+    fn()  # 워밍업
+    t = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - t) / n * 1000.0
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=20, help="케이스당 반복 횟수")
+    args = ap.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((2560, 1440))
+    print(f"{'size':>4} {'text':<14} {'legacy':>8} " +
+          " ".join(f"{q:>8}" for q in ("fan", *neon.GLOW_QUALITY)) + "   (ms/첫 렌더, cache miss)")
+    for size, text in CASES:
+        font = pygame.font.SysFont("Arial", size, bold=True)
+        rect = pygame.Rect((100, 100), font.size(text))
+        row = [_time(lambda: legacy_draw(screen, font, text, WHITE, NEON_YELLOW, rect), args.n)]
+        for q in ("fan", *neon.GLOW_QUALITY):
+            def build():
+                neon.sprite_cache.clear()
+                neon.draw_neon_text(screen, font, text, WHITE, NEON_YELLOW, rect, quality=q)
+            row.append(_time(build, args.n))
+        print(f"{size:>4} {text:<14} " + " ".join(f"{v:8.2f}" for v in row))
+
+    # 캐시 적중 시 비용 (라벨 1개 = 블릿 1회)
+    font = pygame.font.SysFont("Arial", 150, bold=True)
+    rect = pygame.Rect((100, 100), font.size("Score : 120"))
+    hit = _time(lambda: neon.draw_neon_text(screen, font, "Score : 120", WHITE, NEON_YELLOW, rect), args.n * 10)
+    print(f"cache hit (150px 'Score : 120'): {hit:.3f} ms   stats={neon.sprite_cache.stats()}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# tools/bench_startup.py
+# 시작 시간 벤치: main.py를 N번 새 프로세스로 띄워 첫 프레임까지의 단계별 시간(중앙값) 비교
+# 실행: motion_game_ver2 폴더에서  python -m tools.bench_startup [-n 5] [--headless] [--imports 15]
+#  - 각 실행은 MG_EXIT_AFTER_STARTUP=1 → 첫 프레임 후 종료, 타임라인은 임시 jsonl로
+#  - --imports K: python -X importtime 으로 'import main' 누적 시간 상위 K개 모듈
+import os, sys, json, time, argparse, statistics, subprocess, tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def run_once(headless: bool, log: Path) -> float:
+    env = dict(os.environ, MG_EXIT_AFTER_STARTUP="1", MG_STARTUP_LOG=str(log))
+    if headless:
+        env.setdefault("SDL_VIDEODRIVER", "dummy")
+        env.setdefault("SDL_AUDIODRIVER", "dummy")
+    t = time.perf_counter()
+    subprocess.run([sys.executable, "main.py"], cwd=ROOT, env=env,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+    return (time.perf_counter() - t) * 1000.0
+
+
+def import_profile(top: int):
+    """'import main' 의 모듈별 누적 import 시간 (부작용 없이 import 되는지도 같이 확인)"""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    code = "import main, pygame; assert not pygame.display.get_init(), 'import main opened a display'"
+    r = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, env=env,
+                       capture_output=True, text=True)
+    if r.returncode != 0:
+        print(r.stderr.strip().splitlines()[-1])
+        return
+    rows = []
+    for line in r.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cum, name = line[len("import time:"):].split("|")
+        rows.append((int(cum), name.rstrip()))
+    total = next((c for c, n in rows if n.strip() == "main"), 0)
+    print(f"[IMPORT] import main: {total / 1000:.1f} ms (side-effect free)")
+    for cum, name in sorted(rows, reverse=True)[:top]:
+        print(f"  {cum / 1000:8.1f} ms  {name}")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("-n", type=int, default=5, help="실행 횟수")
+    ap.add_argument("--headless", action="store_true", help="SDL dummy 드라이버 (창 없이)")
+    ap.add_argument("--imports", type=int, default=0, metavar="K", help="import 상위 K개 출력")
+    args = ap.parse_args()
+
+    if args.imports:
+        import_profile(args.imports)
+
+    walls, reports = [], []
+    with tempfile.TemporaryDirectory() as td:
+        log = Path(td) / "startup.jsonl"
+        for i in range(args.n):
+            walls.append(run_once(args.headless, log))
+        reports = [json.loads(l) for l in log.read_text(encoding="utf-8").splitlines() if l.strip()]
+
+    phases, marks = {}, {}
+    for r in reports:
+        for p in r["phases"]:
+            phases.setdefault(p["name"], []).append(p["ms"])
+        for k, v in r["marks"].items():
+            marks.setdefault(k, []).append(v)
+
+    med = statistics.median
+    print(f"[BENCH] {len(reports)}/{args.n} runs  wall(launch→exit) median {med(walls):.1f} ms  "
+          f"min {min(walls):.1f}  max {max(walls):.1f}")
+    for name, v in phases.items():
+        print(f"  {name:<18} {med(v):8.1f} ms   (min {min(v):.1f}, max {max(v):.1f})")
+    for name, v in marks.items():
+        print(f"  @{name:<17} {med(v):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+# tools/probe_camera.py
+# 카메라 모드 프로브: (해상도, FOURCC, 버퍼 수) 조합마다 장치가 실제로 주는 값과
+#   실측 fps / 프레임 간격 지터 / read() 지연을 재서 순위표를 만들고, 1위를 camera.json에 기록
+# 실행: motion_game_ver2 폴더에서
+#   python -m tools.probe_camera                       # camera.json의 백엔드(auto=dshow/v4l2)
+#   python -m tools.probe_camera --backend synthetic   # 장치 없이 (파일 대역: replay --source clip.avi)
+#   --backend/--source 또는 MG_CAMERA_BACKEND/SOURCE로 소스를 바꾼 실행은 리포트만 (설정 파일에 쓰지 않음)
+#   옵션: --sizes 640x480,1280x720 --fourcc MJPG,YUYV --buffers 1,2,4 --fps 60 --seconds 2 --no-write
+#         --min-size 640x480 (이보다 작은 모드는 순위 맨 뒤, 기본: 설정 파일의 width x height)
+import os, sys, json, time, argparse, statistics
+from dataclasses import replace
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from utils.camera import BACKENDS, load_camera_config, save_camera_config, open_backend
+from utils.mjpeg import is_jpeg_payload, jpeg_size
+
+REPORT_PATH = ROOT / "logs" / "camera_probe.json"
+SIZES = "640x480,800x600,1280x720,1920x1080"
+
+
+def negotiated(cap, img) -> dict:
+    """
+    장치 백엔드는 드라이버가 돌려준 값, 파일/합성 소스는 실제 프레임 크기.
+    raw_mjpeg면 img가 JPEG 바이트(1-D 또는 1xN)이므로 크기는 JPEG 헤더에서 읽는다.
+    """
+    n = dict(getattr(cap, "negotiated", None) or {})
+    if is_jpeg_payload(img):
+        size = jpeg_size(img.reshape(-1))
+        if size:
+            n["width"], n["height"] = size
+    elif img is not None and getattr(img, "ndim", 0) == 3:
+        n["width"], n["height"] = int(img.shape[1]), int(img.shape[0])
+    n.setdefault("fourcc", "-")
+    n.setdefault("buffers", "-")
+    return n
+
+
+def measure(cfg, seconds: float, warmup: float = 0.3) -> dict:
+    cap = open_backend(cfg)
+    if cap is None or not cap.isOpened():
+        return {"ok": False, "error": "open failed"}
+    try:
+        ok, img = cap.read()
+        if not ok:
+            return {"ok": False, "error": "first read failed"}
+        neg = negotiated(cap, img)
+        t_end = time.perf_counter() + warmup            # 자동 노출/버퍼 채움 구간 제외
+        while time.perf_counter() < t_end:
+            cap.read()
+
+        stamps, lat, fails = [], [], 0
+        t_end = time.perf_counter() + seconds
+        while time.perf_counter() < t_end:
+            t0 = time.perf_counter()
+            ok, img = cap.read()
+            t1 = time.perf_counter()
+            if not ok:
+                fails += 1
+                continue
+            lat.append((t1 - t0) * 1000.0)
+            stamps.append(t1)
+    finally:
+        cap.release()
+
+    if len(stamps) < 3:
+        return {"ok": False, "error": f"only {len(stamps)} frames", "negotiated": neg}
+    iv = [(b - a) * 1000.0 for a, b in zip(stamps, stamps[1:])]
+    iv_sorted = sorted(iv)
+    return {
+        "ok": True,
+        "negotiated": neg,
+        "frames": len(stamps),
+        "read_fail": fails,
+        "fps": round((len(stamps) - 1) / (stamps[-1] - stamps[0]), 2),
+        "interval_ms": round(statistics.mean(iv), 2),
+        "jitter_ms": round(statistics.pstdev(iv), 2),
+        "interval_p95_ms": round(iv_sorted[int(0.95 * (len(iv_sorted) - 1))], 2),
+        "read_ms": round(statistics.mean(lat), 2),
+        "read_p95_ms": round(sorted(lat)[int(0.95 * (len(lat) - 1))], 2),
+    }
+
+
+def score(r: dict, want_fps: float, min_size):
+    """
+    정렬 키 (작을수록 좋음): min_size 이상 → 목표 fps 달성률 → 지터 → read 지연 → 해상도 큰 쪽.
+    지터는 거의 같은 값이 나오지 않으므로 해상도를 동점 처리로만 두면 작은 모드가 이긴다
+    → 화면(PLAY 1600x1200)에 늘려 그릴 만큼 작은 모드는 아예 뒤로 보냄.
+    """
+    n = r["negotiated"]
+    small = n["width"] < min_size[0] or n["height"] < min_size[1]
+    reach = min(1.0, r["fps"] / want_fps) if want_fps else 1.0
+    return (small, -round(reach, 2), r["jitter_ms"], r["read_p95_ms"], -(n["width"] * n["height"]))
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--config", default=None, help="읽고 쓸 설정 파일 (기본 camera.json)")
+    ap.add_argument("--backend", choices=BACKENDS, default=None)
+    ap.add_argument("--source", default=None, help="replay 소스 (동영상/이미지 폴더/글롭)")
+    ap.add_argument("--sizes", default=SIZES)
+    ap.add_argument("--fourcc", default="MJPG,YUYV")
+    ap.add_argument("--buffers", default="1,2,4")
+    ap.add_argument("--fps", type=int, default=None, help="요청 fps (기본: 설정 값)")
+    ap.add_argument("--seconds", type=float, default=2.0, help="조합당 측정 시간")
+    ap.add_argument("--min-size", default=None, help="순위에 올릴 최소 해상도 WxH (기본: 설정 값)")
+    ap.add_argument("--no-write", action="store_true", help="설정 파일은 그대로 두고 리포트만")
+    args = ap.parse_args()
+
+    base = load_camera_config(args.config)
+    if args.backend:
+        base.backend = args.backend
+    if args.source:
+        base.source = args.source
+    if args.fps:
+        base.fps = args.fps
+    overridden = [n for n, v in (("--backend", args.backend), ("--source", args.source),
+                                 ("MG_CAMERA_BACKEND", os.environ.get("MG_CAMERA_BACKEND")),
+                                 ("MG_CAMERA_SOURCE", os.environ.get("MG_CAMERA_SOURCE"))) if v]
+    if overridden and not args.no_write:
+        print(f"[PROBE] {', '.join(overridden)} 지정 → 설정 파일에 쓰지 않음 (--no-write)")
+        args.no_write = True
+    min_size = (tuple(int(v) for v in args.min_size.lower().split("x")) if args.min_size
+                else (base.width, base.height))
+    print(f"[PROBE] {base.describe()}  {args.seconds:.1f}s per mode, min {min_size[0]}x{min_size[1]}")
+
+    sizes = [tuple(int(v) for v in s.lower().split("x")) for s in args.sizes.split(",") if s]
+    combos = [(w, h, f, int(b)) for (w, h) in sizes
+              for f in args.fourcc.split(",") for b in args.buffers.split(",")]
+
+    results, seen = [], {}
+    for w, h, fcc, nbuf in combos:
+        cfg = replace(base, width=w, height=h, fourcc=[fcc], buffers=nbuf)
+        ask = f"{w}x{h} {fcc} buf{nbuf}"
+        r = measure(cfg, args.seconds)
+        r["asked"] = {"width": w, "height": h, "fourcc": fcc, "buffers": nbuf, "fps": base.fps}
+        if not r["ok"]:
+            print(f"  {ask:<24} FAIL {r['error']}")
+            results.append(r)
+            continue
+        n = r["negotiated"]
+        key = (n["width"], n["height"], n["fourcc"], n["buffers"])
+        if key in seen:     # 드라이버가 같은 모드로 맞춘 조합은 한 번만 순위에
+            r["duplicate_of"] = seen[key]
+        else:
+            seen[key] = ask
+        results.append(r)
+        print(f"  {ask:<24} → {n['width']}x{n['height']} {n['fourcc']} buf{n['buffers']}  "
+              f"{r['fps']:6.1f} fps  jitter {r['jitter_ms']:5.2f} ms  read p95 {r['read_p95_ms']:6.2f} ms"
+              + ("  (dup)" if "duplicate_of" in r else ""))
+
+    ranked = sorted((r for r in results if r["ok"] and "duplicate_of" not in r),
+                    key=lambda r: score(r, base.fps, min_size))
+    report = {"ts": time.strftime("%Y-%m-%d %H:%M:%S"), "backend": base.resolved_backend(),
+              "source": base.source, "seconds": args.seconds, "ranked": ranked, "all": results}
+    REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    if not (REPORT_PATH.parent / ".gitignore").exists():
+        (REPORT_PATH.parent / ".gitignore").write_text("*\n")
+    REPORT_PATH.write_text(json.dumps(report, indent=1, ensure_ascii=False), encoding="utf-8")
+
+    print(f"[PROBE] ranking ({len(ranked)} distinct modes) → {REPORT_PATH}")
+    for i, r in enumerate(ranked[:5], 1):
+        n = r["negotiated"]
+        print(f"  {i}. {n['width']}x{n['height']} {n['fourcc']} buf{n['buffers']}  "
+              f"{r['fps']:.1f} fps, jitter {r['jitter_ms']:.2f} ms, read p95 {r['read_p95_ms']:.2f} ms")
+    if not ranked:
+        print("[PROBE] 측정 가능한 모드 없음 — 설정 파일은 그대로")
+        return
+    if args.no_write:
+        return
+
+    best = ranked[0]
+    a = best["asked"]       # open_cam은 요청 값을 쓰므로 1위 모드를 만든 요청을 기록
+    saved = load_camera_config(args.config, env=False)     # 파일 값 그대로 + 프로브한 4개 값만 교체
+    cfg = replace(saved, width=a["width"], height=a["height"], buffers=a["buffers"],
+                  fourcc=[a["fourcc"]] + [f for f in saved.fourcc if f != a["fourcc"]])
+    save_camera_config(cfg, args.config, extra={"probe": {
+        "ts": report["ts"], "fps": best["fps"], "jitter_ms": best["jitter_ms"],
+        "read_p95_ms": best["read_p95_ms"], "negotiated": best["negotiated"]}})
+    print(f"[PROBE] wrote {cfg.describe()} → {args.config or os.environ.get('MG_CAMERA_CONFIG') or 'camera.json'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+# utils/assets.py
+# 이미지 로딩 계층: 모든 Surface를 화면 픽셀 포맷으로 맞춘다 (blit 시 포맷 변환 제거)
+#  - 알파가 필요 없는 이미지(배경 등)는 convert() → 불투명 Surface
+#  - 알파가 필요한 이미지(캐릭터/아이콘 등)는 convert_alpha()
+#  - audit: 핫패스에서 변환 안 된 Surface가 blit되면 태그별로 카운트 + 1회 경고
+#  - cache: (내용 해시, 크기, 모드) 키의 프로세스 전역 LRU (씬 인스턴스가 바뀌어도 재사용,
+#           곡 폴더마다 복사된 같은 PNG(Perfect/Good/Bad/Gear 등)는 Surface 하나를 공유)
+#  - baked: tools/bake_assets로 미리 스케일한 .npy가 있으면 디코드/리샘플 대신 mmap
+import os
+from collections import OrderedDict
+
+import pygame
+
+from utils.baked import baked, content_hash
+
+
+def _display():
+    return pygame.display.get_surface()
+
+
+def has_alpha(surf: "pygame.Surface") -> bool:
+    return bool(surf.get_flags() & pygame.SRCALPHA)
+
+
+def is_display_format(surf: "pygame.Surface") -> bool:
+    """surf가 화면과 같은 픽셀 포맷인지 (화면이 없으면 판단 불가 → True)"""
+    disp = _display()
+    if disp is None or surf is disp:
+        return True
+    if surf.get_masks()[:3] != disp.get_masks()[:3]:
+        return False
+    if has_alpha(surf):
+        return surf.get_bitsize() == 32
+    return surf.get_bitsize() == disp.get_bitsize()
+
+
+def to_display(surf: "pygame.Surface", alpha=None) -> "pygame.Surface":
+    """
+    화면 포맷으로 변환. alpha=None이면 surf의 SRCALPHA 여부를 따른다.
+    alpha=False면 알파를 버리고 불투명 Surface로 만든다.
+    이미 화면 포맷이면 그대로 반환 (복사 없음).
+    """
+    if _display() is None:
+        return surf
+    if alpha is None:
+        alpha = has_alpha(surf)
+    if alpha == has_alpha(surf) and is_display_format(surf):
+        return surf
+    return surf.convert_alpha() if alpha else surf.convert()
+
+
+def surface_bytes(surf: "pygame.Surface") -> int:
+    return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+
+class AssetCache:
+    """
+    (내용 해시, 목표 크기, alpha) → 변환/스케일까지 끝난 Surface.
+    - budget_bytes를 넘으면 가장 오래 안 쓴 항목부터 제거 (LRU)
+    - 해시는 (경로, mtime, 파일 크기)별로 한 번만 계산 → 파일이 바뀌면 자연히 새 키
+    - 내용이 같은 파일은 경로가 달라도 같은 키 (dedup_paths: 공유로 아낀 경로 수)
+    반환된 Surface는 공유되므로 호출자가 직접 수정하면 안 된다 (필요하면 copy()).
+    """
+    def __init__(self, budget_bytes: int):
+        self.budget_bytes = budget_bytes
+        self._items: "OrderedDict" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._sha: dict = {}       # (절대경로, mtime_ns, 바이트) → 내용 해시
+        self._paths: dict = {}     # 내용 해시 → {절대경로}
+
+    def content_id(self, path) -> str:
+        p = os.path.abspath(str(path))
+        st = os.stat(p)
+        memo = (p, st.st_mtime_ns, st.st_size)
+        sha = self._sha.get(memo)
+        if sha is None:
+            try:
+                sha = baked.source_hash(p)     # 베이크 인덱스가 맞으면 재계산 없음
+            except Exception:
+                sha = content_hash(p)
+            self._sha[memo] = sha
+            self._paths.setdefault(sha, set()).add(p)
+        return sha
+
+    def key(self, path, size, alpha):
+        return (self.content_id(path), tuple(size) if size else None, bool(alpha))
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key):
+        s = self._items.get(key)
+        if s is None:
+            self.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.hits += 1
+        return s
+
+    def put(self, key, surf):
+        n = surface_bytes(surf)
+        if n > self.budget_bytes:
+            return surf          # 예산보다 큰 건 캐시하지 않음
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.bytes -= surface_bytes(old)
+        self._items[key] = surf
+        self.bytes += n
+        self._trim()
+        return surf
+
+    def _trim(self):
+        while self.bytes > self.budget_bytes and self._items:
+            _, ev = self._items.popitem(last=False)
+            self.bytes -= surface_bytes(ev)
+            self.evictions += 1
+
+    def set_budget(self, budget_bytes: int):
+        self.budget_bytes = budget_bytes
+        self._trim()
+
+    def clear(self):
+        self._items.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        return {"items": len(self._items), "mb": round(self.bytes / 2**20, 1),
+                "budget_mb": round(self.budget_bytes / 2**20, 1),
+                "hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "dedup_paths": sum(len(ps) - 1 for ps in self._paths.values())}
+
+
+cache = AssetCache(int(float(os.environ.get("MG_ASSET_BUDGET_MB", "192")) * 2**20))
+
+
+def load_image(path, size=None, alpha=True, cached=True) -> "pygame.Surface":
+    """
+    파일 → 화면 포맷 Surface. size가 다르면 smoothscale. cached=True면 AssetCache 경유.
+    size가 있고 베이크 결과가 있으면 PNG 디코드/리샘플 없이 mmap 버퍼에서 바로 변환.
+    """
+    key = cache.key(path, size, alpha) if cached else None
+    if key is not None:
+        img = cache.get(key)
+        if img is not None:
+            return img
+    img = decode_image(path, size, alpha)
+    return cache.put(key, img) if key is not None else img
+
+
+_templates: dict = {}   # alpha → 화면 포맷 1x1 Surface
+
+def display_template(alpha: bool) -> "pygame.Surface":
+    """
+    화면 포맷 1x1 Surface. 워커 스레드는 convert_alpha() 대신 surf.convert(template)로
+    같은 포맷을 만든다 (결과 픽셀 동일). 메인 스레드에서 먼저 한 번 불러 둘 것.
+    """
+    t = _templates.get(alpha)
+    if t is None:
+        t = _templates[alpha] = to_display(pygame.Surface((1, 1), pygame.SRCALPHA if alpha else 0), alpha=alpha)
+    return t
+
+
+def decode_image(path, size=None, alpha=True, template=None) -> "pygame.Surface":
+    """
+    캐시 없이 디코드 + 화면 포맷 변환 + 스케일 (베이크가 있으면 mmap 사용).
+    template을 주면 그 Surface 포맷으로 변환 → 디스플레이에 손대지 않으므로 워커 스레드에서 호출 가능.
+    """
+    def conv(s):
+        return s.convert(template) if template is not None else to_display(s, alpha=alpha)
+
+    img = None
+    raw = baked.load_surface(path, size, alpha) if size else None
+    if raw is not None:
+        img = conv(raw)
+        if img is raw:
+            img = raw.copy()        # 화면이 없을 때도 mmap 버퍼와 분리
+    if img is None:
+        img = conv(pygame.image.load(str(path)))
+        if size and tuple(size) != img.get_size():
+            img = pygame.transform.smoothscale(img, tuple(size))
+    return img
+
+
+def from_pil(img, alpha=None) -> "pygame.Surface":
+    """
+    PIL.Image → 화면 포맷 Surface.
+    alpha=None이면 RGBA/LA/P 모드만 알파 유지, alpha=False면 RGB로 바꿔 불투명하게.
+    """
+    if alpha is None:
+        alpha = img.mode in ("RGBA", "LA", "P")
+    img = img.convert("RGBA" if alpha else "RGB")
+    surf = pygame.image.fromstring(img.tobytes(), img.size, img.mode)
+    return to_display(surf, alpha=alpha)
+
+
+class SurfaceAudit:
+    """
+    핫패스 blit 직전에 check(surf, tag)로 포맷 점검.
+    - 화면 포맷이 아니면 unconverted[tag] += 1
+    - opaque=True인데 SRCALPHA면 needless_alpha[tag] += 1 (전체화면 배경 등)
+    태그별 첫 1회만 경고 출력. enabled=False(기본)면 아무것도 안 함.
+    """
+    def __init__(self):
+        self.enabled = os.environ.get("MG_AUDIT_SURFACES", "0") == "1"
+        self.checks = 0
+        self.unconverted: dict = {}
+        self.needless_alpha: dict = {}
+        self._warned = set()
+
+    def check(self, surf, tag: str, opaque: bool = False):
+        if not self.enabled or surf is None:
+            return surf
+        self.checks += 1
+        if not is_display_format(surf):
+            self._hit(self.unconverted, tag, surf, "display 포맷 아님")
+        elif opaque and has_alpha(surf):
+            self._hit(self.needless_alpha, tag, surf, "불필요한 SRCALPHA")
+        return surf
+
+    def _hit(self, table, tag, surf, why):
+        table[tag] = table.get(tag, 0) + 1
+        if (tag, why) not in self._warned:
+            self._warned.add((tag, why))
+            print(f"[ASSET][WARN] {tag}: {why} ({surf.get_size()[0]}x{surf.get_size()[1]}, "
+                  f"{surf.get_bitsize()}bit)")
+
+    def stats(self) -> dict:
+        return {"checks": self.checks, "unconverted": dict(self.unconverted),
+                "needless_alpha": dict(self.needless_alpha)}
+
+
+audit = SurfaceAudit()
@@ -0,0 +1,100 @@
+# utils/baked.py
+# 오프라인 베이크 결과(assets/.baked/*.npy) 조회: PNG 디코드 + 리샘플 대신 mmap + Surface 래핑
+#  - 파일명: <원본 내용 해시>_<w>x<h>_<rgba|rgb>.npy  (내용이 같으면 경로가 달라도 공유)
+#  - index.json: 원본 상대경로 → {mtime_ns, bytes, sha}  (mtime/크기가 같으면 해시 재계산 생략)
+# 베이크: python -m tools.bake_assets
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pygame
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+BAKE_DIR   = ASSETS_DIR / ".baked"
+INDEX_NAME = "index.json"
+
+
+def content_hash(path) -> str:
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()[:20]
+
+
+def bake_name(sha: str, size, alpha: bool) -> str:
+    return f"{sha}_{size[0]}x{size[1]}_{'rgba' if alpha else 'rgb'}.npy"
+
+
+class BakedStore:
+    """베이크 폴더 조회기. 폴더/numpy가 없으면 항상 None (기존 PNG 로드로 폴백)."""
+    def __init__(self, root: Path = BAKE_DIR, assets: Path = ASSETS_DIR):
+        self.root = Path(root)
+        self.assets = Path(assets)
+        self._index = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def available(self) -> bool:
+        return np is not None and self.root.is_dir()
+
+    def index(self) -> dict:
+        if self._index is None:
+            try:
+                self._index = json.loads((self.root / INDEX_NAME).read_text(encoding="utf-8"))
+            except Exception:
+                self._index = {}
+        return self._index
+
+    def _rel(self, path) -> str:
+        try:
+            return Path(path).resolve().relative_to(self.assets.resolve()).as_posix()
+        except ValueError:
+            return Path(path).resolve().as_posix()
+
+    def source_hash(self, path) -> str:
+        """인덱스의 mtime/크기가 맞으면 저장된 해시, 아니면 새로 계산 (체크아웃 등으로 mtime만 바뀐 경우)"""
+        st = os.stat(path)
+        ent = self.index().get(self._rel(path))
+        if ent and ent.get("mtime_ns") == st.st_mtime_ns and ent.get("bytes") == st.st_size:
+            return ent["sha"]
+        return content_hash(path)
+
+    def lookup(self, path, size, alpha: bool):
+        """(path, size, alpha)의 베이크 배열(mmap, HxWxC uint8) 또는 None"""
+        if not size or not self.available:
+            return None
+        try:
+            f = self.root / bake_name(self.source_hash(path), size, alpha)
+            if not f.exists():
+                self.misses += 1
+                return None
+            arr = np.load(f, mmap_mode="r")
+        except Exception:
+            self.misses += 1
+            return None
+        if arr.shape[:2] != (size[1], size[0]) or arr.shape[2] != (4 if alpha else 3):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return arr
+
+    def load_surface(self, path, size, alpha: bool):
+        """베이크가 있으면 mmap 버퍼를 그대로 감싼 Surface (호출자가 화면 포맷으로 변환/복사)"""
+        arr = self.lookup(path, size, alpha)
+        if arr is None:
+            return None
+        return pygame.image.frombuffer(arr, tuple(size), "RGBA" if alpha else "RGB")
+
+    def stats(self) -> dict:
+        return {"available": self.available, "hits": self.hits, "misses": self.misses}
+
+
+baked = BakedStore()
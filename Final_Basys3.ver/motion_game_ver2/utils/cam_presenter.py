@@ -0,0 +1,77 @@
+# utils/cam_presenter.py
+# 카메라 BGR 프레임 → 고정 rect 안에 비율 유지로 그리기 (프레임당 할당 없음)
+import time
+
+import pygame
+import numpy as np
+import cv2
+
+from utils.dirty import damage
+from utils.latency import latency
+
+
+class CamPresenter:
+    """
+    고정된 target rect 하나를 담당하는 카메라 프레젠터.
+    - 원본 해상도가 같으면 scale/offset, 버퍼, Surface를 계속 재사용
+    - cv2.resize / cvtColor 를 dst= 로 미리 잡아둔 버퍼에 직접 씀
+    - Surface는 RGB 버퍼를 frombuffer로 공유 → 버퍼 갱신이 곧 Surface 갱신
+    - frame_id가 지난번과 같으면 변환 없이 캐시된 Surface만 blit
+    - origin(캡처 기준 시각)을 주면 utils.latency에 tag 이름으로 변환/blit 시각 기록
+    """
+    def __init__(self, rect, interpolation=cv2.INTER_LINEAR, tag: str = "main"):
+        self.rect = pygame.Rect(rect)
+        self.interpolation = interpolation
+        self.tag = tag
+        self._src_shape = None
+        self._size = (0, 0)
+        self._offset = self.rect.topleft
+        self._bgr = None        # 리사이즈 결과 (nh, nw, 3) BGR
+        self._rgb = None        # Surface가 공유하는 (nh, nw, 3) RGB
+        self.surface = None
+        self._last_id = None
+        self.converted = 0
+        self.skipped = 0
+
+    def _layout(self, shape):
+        """원본 (h, w)가 바뀌었을 때만 scale/offset/버퍼 재계산"""
+        fh, fw = shape[:2]
+        r = self.rect
+        s = min(r.width / fw, r.height / fh)
+        nw, nh = max(1, int(fw * s)), max(1, int(fh * s))
+        self._src_shape = shape
+        self._size = (nw, nh)
+        self._offset = (r.x + (r.width - nw) // 2, r.y + (r.height - nh) // 2)
+        self._bgr = np.empty((nh, nw, 3), np.uint8)
+        self._rgb = np.empty((nh, nw, 3), np.uint8)
+        self.surface = pygame.image.frombuffer(self._rgb, (nw, nh), "RGB")
+        self._last_id = None
+
+    def _convert(self, frame_bgr):
+        if frame_bgr.shape != self._src_shape:
+            self._layout(frame_bgr.shape)
+        if self._size == (frame_bgr.shape[1], frame_bgr.shape[0]):
+            cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB, dst=self._rgb)
+        else:
+            cv2.resize(frame_bgr, self._size, dst=self._bgr, interpolation=self.interpolation)
+            cv2.cvtColor(self._bgr, cv2.COLOR_BGR2RGB, dst=self._rgb)
+        self.converted += 1
+
+    def draw(self, surface: "pygame.Surface", frame_bgr, frame_id=None, origin=None):
+        """frame_bgr가 None이면 검정 rect만. frame_id가 None이면 매번 변환."""
+        damage.add(pygame.draw.rect(surface, (0, 0, 0), self.rect), surface)
+        if frame_bgr is None:
+            return
+        if not isinstance(frame_bgr, np.ndarray) or frame_bgr.ndim != 3 or frame_bgr.shape[2] != 3:
+            return
+        new = frame_id is None or frame_id != self._last_id or frame_bgr.shape != self._src_shape
+        conv_ms = None
+        if new:
+            t = time.perf_counter()
+            self._convert(frame_bgr)
+            conv_ms = (time.perf_counter() - t) * 1000.0
+            self._last_id = frame_id
+        else:
+            self.skipped += 1
+        surface.blit(self.surface, self._offset)
+        latency.blit(self.tag, frame_id, origin, conv_ms, new, frame_bgr if latency.calibrator else None)
@@ -0,0 +1,309 @@
+# utils/camera.py
+# 카메라 백엔드: camera.json(또는 환경변수)로 고르는 캡처 소스
+#  - dshow    : Windows DirectShow (기존 open_cam 동작)
+#  - v4l2     : Linux V4L2, FOURCC → 해상도 → fps → 버퍼 수 순으로 설정 후 실제 값 확인
+#  - replay   : 동영상 파일 또는 이미지 시퀀스(폴더/글롭) 재생, 실시간 또는 최대 속도
+#  - synthetic: 컬러 바 + 움직이는 막대 + 프레임 번호 (장치 없이 부하 테스트)
+#  - auto     : win32면 dshow, 그 외 v4l2
+# 모든 백엔드는 VideoCapture와 같은 isOpened()/read()/release() → CameraCapture가 그대로 사용
+# raw_mjpeg=true: 디코드하지 않은 JPEG 바이트를 돌려줌 → CameraCapture가 utils/mjpeg 워커 풀에서 축소 디코드
+# 환경변수: MG_CAMERA_CONFIG(설정 파일), MG_CAMERA_BACKEND, MG_CAMERA_SOURCE (파일 값보다 우선)
+#          MG_REPLAY_CACHE_MB: replay 이미지 시퀀스 디코드 캐시 상한 (기본 64MB, 0이면 매번 디코드)
+import os
+import sys
+import json
+import glob
+import time
+from dataclasses import dataclass, field, asdict, fields
+from pathlib import Path
+from typing import Optional
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+try:
+    import cv2
+except Exception:
+    cv2 = None
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "camera.json"
+BACKENDS = ("auto", "dshow", "v4l2", "replay", "synthetic")
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".bmp")
+REPLAY_CACHE_MB = float(os.environ.get("MG_REPLAY_CACHE_MB", "64"))
+
+
+@dataclass
+class CamConfig:
+    backend: str = "auto"
+    index: int = 1
+    device: Optional[str] = None          # v4l2: "/dev/video0" 처럼 경로 지정 시 index 대신 사용
+    width: int = 640
+    height: int = 480
+    fps: int = 60
+    fourcc: list = field(default_factory=lambda: ["MJPG", "YUYV"])   # 앞에서부터 시도
+    buffers: int = 1
+    source: Optional[str] = None          # replay: 동영상 경로, 이미지 폴더 또는 글롭
+    realtime: bool = True                 # replay/synthetic: False면 최대 속도
+    loop: bool = True                     # replay: 끝나면 처음부터
+    pattern: str = "bars"                 # synthetic: "bars" | "noise"
+    raw_mjpeg: bool = False               # MJPG 압축 그대로 받아 워커에서 디코드
+    jpeg_reduce: object = "auto"          # "auto" | 1 | 2 | 4 | 8 (IMREAD_REDUCED_COLOR_n)
+    decode_workers: int = 2
+
+    def resolved_backend(self) -> str:
+        if self.backend == "auto":
+            return "dshow" if sys.platform == "win32" else "v4l2"
+        return self.backend
+
+    def describe(self) -> str:
+        b = self.resolved_backend()
+        if b == "replay":
+            return f"replay:{self.source}"
+        if b == "synthetic":
+            return f"synthetic:{self.pattern} {self.width}x{self.height}@{self.fps}"
+        return f"{b}:{self.device or self.index} {self.width}x{self.height}@{self.fps}"
+
+
+def load_camera_config(path=None, env: bool = True) -> CamConfig:
+    """설정 파일(없으면 기본값) + 환경변수 덮어쓰기(env=False면 파일 값 그대로). 모르는 키는 무시."""
+    path = Path(path or os.environ.get("MG_CAMERA_CONFIG") or CONFIG_PATH)
+    data = {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"[CAM] config read fail {path}: {e}", file=sys.stderr)
+    names = {f.name for f in fields(CamConfig)}
+    cfg = CamConfig(**{k: v for k, v in data.items() if k in names})
+    if isinstance(cfg.fourcc, str):
+        cfg.fourcc = [cfg.fourcc]
+    if env:
+        cfg.backend = os.environ.get("MG_CAMERA_BACKEND", cfg.backend)
+        cfg.source = os.environ.get("MG_CAMERA_SOURCE", cfg.source)
+    if cfg.backend not in BACKENDS:
+        print(f"[CAM] unknown backend '{cfg.backend}' → auto", file=sys.stderr)
+        cfg.backend = "auto"
+    return cfg
+
+
+def save_camera_config(cfg: CamConfig, path=None, extra: Optional[dict] = None):
+    """cfg(+ extra 키, 예: 프로브 결과 요약)를 설정 파일에 저장"""
+    path = Path(path or os.environ.get("MG_CAMERA_CONFIG") or CONFIG_PATH)
+    data = asdict(cfg)
+    if extra:
+        data.update(extra)
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+def fourcc_str(v) -> str:
+    v = int(v)
+    return "".join(chr((v >> (8 * i)) & 0xFF) for i in range(4)) if v > 0 else "?"
+
+
+# ---------------- 장치 (OpenCV) ----------------
+class DeviceCapture:
+    """cv2.VideoCapture 래퍼: 설정 적용 후 장치가 실제로 준 값(negotiated)을 기록"""
+    def __init__(self, cfg: CamConfig, api: int, name: str):
+        self.cfg = cfg
+        self.name = name
+        self.negotiated: dict = {}
+        target = cfg.device if (cfg.device and name == "v4l2") else cfg.index
+        self.cap = cv2.VideoCapture(target, api)
+        if self.cap.isOpened():
+            self._configure()
+
+    def _configure(self):
+        c, cap = self.cfg, self.cap
+        # V4L2는 픽셀 포맷을 먼저 정해야 그 포맷의 해상도/fps 목록에서 고른다
+        for fcc in c.fourcc:
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fcc))
+            if fourcc_str(cap.get(cv2.CAP_PROP_FOURCC)) == fcc:
+                break
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH,  c.width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, c.height)
+        cap.set(cv2.CAP_PROP_FPS,          c.fps)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE,   c.buffers)   # v4l2: 드라이버 버퍼 개수
+        self.negotiated = {
+            "fourcc": fourcc_str(cap.get(cv2.CAP_PROP_FOURCC)),
+            "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            "fps": round(cap.get(cv2.CAP_PROP_FPS), 2),
+            "buffers": int(cap.get(cv2.CAP_PROP_BUFFERSIZE)),
+        }
+        want = {"width": c.width, "height": c.height, "fps": c.fps}
+        diff = {k: v for k, v in self.negotiated.items() if k in want and v and v != want[k]}
+        if diff or self.negotiated["fourcc"] not in c.fourcc:
+            print(f"[CAM] {self.name} negotiated {self.negotiated} (asked {want} {c.fourcc})")
+        if c.raw_mjpeg:
+            # CONVERT_RGB=0: 백엔드가 지원하면 read()가 1xN JPEG 버퍼를 준다 (아니면 평소처럼 BGR)
+            raw = self.negotiated["fourcc"] == "MJPG" and cap.set(cv2.CAP_PROP_CONVERT_RGB, 0)
+            self.negotiated["raw"] = bool(raw)
+            if not raw:
+                print(f"[CAM] {self.name} raw MJPEG 불가 (fourcc {self.negotiated['fourcc']}) → 디코드된 프레임 사용")
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def read(self):
+        return self.cap.read()
+
+    def timestamp(self):
+        """마지막 프레임의 드라이버 버퍼 시각(monotonic 초). v4l2는 CLOCK_MONOTONIC 기준.
+        time.monotonic()과 기준이 다르면(dshow 등) None → 호출자가 read 시각 사용"""
+        t = self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+        return t if 0.0 <= time.monotonic() - t < 1.0 else None
+
+    def set(self, prop, value):
+        return self.cap.set(prop, value)
+
+    def get(self, prop):
+        return self.cap.get(prop)
+
+    def release(self):
+        self.cap.release()
+
+
+# ---------------- 재생 ----------------
+class _Pacer:
+    """realtime이면 fps 간격에 맞춰 대기 (밀리면 따라잡지 않고 기준을 옮김)"""
+    def __init__(self, fps: float, realtime: bool):
+        self.dt = 1.0 / fps if (realtime and fps and fps > 0) else 0.0
+        self.next_t = None
+
+    def wait(self):
+        if not self.dt:
+            return
+        now = time.monotonic()
+        if self.next_t is None or now - self.next_t > self.dt:
+            self.next_t = now
+        elif self.next_t > now:
+            time.sleep(self.next_t - now)
+        self.next_t += self.dt
+
+
+class ReplaySource:
+    """
+    동영상 파일 또는 이미지 시퀀스를 카메라처럼 재생 (BGR ndarray).
+    raw_mjpeg면 .jpg 시퀀스는 파일 바이트를 그대로 (= MJPEG 장치의 원본 프레임과 같은 형태)
+    """
+    def __init__(self, cfg: CamConfig):
+        self.cfg = cfg
+        self.video = None
+        self.files = []
+        self.pos = 0
+        src = cfg.source or ""
+        p = Path(src)
+        if p.is_dir():
+            self.files = sorted(str(f) for f in p.iterdir() if f.suffix.lower() in IMAGE_EXTS)
+        elif any(ch in src for ch in "*?["):
+            self.files = sorted(f for f in glob.glob(src) if f.lower().endswith(IMAGE_EXTS))
+        elif p.is_file():
+            self.video = cv2.VideoCapture(str(p))
+        fps = cfg.fps
+        if self.video is not None and self.video.isOpened():
+            fps = self.video.get(cv2.CAP_PROP_FPS) or cfg.fps
+        self.fps = fps
+        self.pacer = _Pacer(fps, cfg.realtime)
+        self._cache = {}     # 이미지 시퀀스: 경로 → 디코드 결과 (반복 재생 시 재디코드 없음)
+        self._cache_bytes = 0
+        self._cache_max = int(REPLAY_CACHE_MB * 2**20)   # 넘치면 나머지 파일은 매번 디코드
+
+    def isOpened(self):
+        return bool(self.files) or (self.video is not None and self.video.isOpened())
+
+    def read(self):
+        self.pacer.wait()
+        if self.video is not None:
+            ok, img = self.video.read()
+            if not ok and self.cfg.loop:
+                self.video.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                ok, img = self.video.read()
+            return ok, img
+        if self.pos >= len(self.files):
+            if not self.cfg.loop:
+                return False, None
+            self.pos = 0
+        f = self.files[self.pos]
+        self.pos += 1
+        img = self._cache.get(f)
+        if img is None:
+            if self.cfg.raw_mjpeg and f.lower().endswith((".jpg", ".jpeg")):
+                img = np.fromfile(f, np.uint8)
+            else:
+                img = cv2.imread(f, cv2.IMREAD_COLOR)
+            if img is not None and self._cache_bytes + img.nbytes <= self._cache_max:
+                self._cache[f] = img
+                self._cache_bytes += img.nbytes
+        return img is not None, img
+
+    def release(self):
+        if self.video is not None:
+            self.video.release()
+        self._cache.clear()
+        self._cache_bytes = 0
+
+
+class SyntheticSource:
+    """
+    테스트 패턴 생성기: bars=컬러 바 + 가로로 움직이는 흰 막대 + 프레임 번호, noise=랜덤.
+    raw_mjpeg면 JPEG로 인코드해서 돌려줌 (MJPEG 장치 대역)
+    """
+    BARS = [(255, 255, 255), (0, 255, 255), (255, 255, 0), (0, 255, 0),
+            (255, 0, 255), (0, 0, 255), (255, 0, 0), (0, 0, 0)]     # BGR
+
+    def __init__(self, cfg: CamConfig):
+        self.cfg = cfg
+        self.w, self.h = cfg.width, cfg.height
+        self.n = 0
+        self.pacer = _Pacer(cfg.fps, cfg.realtime)
+        self.base = None
+        if np is not None:
+            self.base = np.zeros((self.h, self.w, 3), np.uint8)
+            bw = max(1, self.w // len(self.BARS))
+            for i, c in enumerate(self.BARS):
+                self.base[:, i * bw:(i + 1) * bw] = c
+            self._rng = np.random.default_rng(0)
+
+    def isOpened(self):
+        return self.base is not None
+
+    def read(self):
+        self.pacer.wait()
+        self.n += 1
+        if self.cfg.pattern == "noise":
+            return self._out(self._rng.integers(0, 256, (self.h, self.w, 3), np.uint8))
+        img = self.base.copy()
+        x = (self.n * 8) % self.w
+        img[:, x:x + 16] = 255
+        if cv2 is not None:
+            cv2.putText(img, str(self.n), (20, self.h - 30), cv2.FONT_HERSHEY_SIMPLEX,
+                        2.0, (0, 0, 0), 6, cv2.LINE_AA)
+            cv2.putText(img, str(self.n), (20, self.h - 30), cv2.FONT_HERSHEY_SIMPLEX,
+                        2.0, (255, 255, 255), 2, cv2.LINE_AA)
+        return self._out(img)
+
+    def _out(self, img):
+        if self.cfg.raw_mjpeg and cv2 is not None:
+            ok, buf = cv2.imencode(".jpg", img, [cv2.IMWRITE_JPEG_QUALITY, 85])
+            return ok, buf.reshape(-1)
+        return True, img
+
+    def release(self):
+        self.base = None
+
+
+def open_backend(cfg: CamConfig):
+    """cfg.backend에 맞는 캡처 객체 (열기 실패 시 isOpened()=False 인 객체 또는 None)"""
+    b = cfg.resolved_backend()
+    if b == "synthetic":
+        return SyntheticSource(cfg)
+    if cv2 is None:
+        print("[CAM] opencv 없음", file=sys.stderr)
+        return None
+    if b == "replay":
+        return ReplaySource(cfg)
+    if b == "dshow":
+        return DeviceCapture(cfg, cv2.CAP_DSHOW, "dshow")
+    return DeviceCapture(cfg, cv2.CAP_V4L2, "v4l2")
@@ -0,0 +1,165 @@
+# utils/capture.py
+# 카메라 캡처 스레드 + 최신 프레임 1칸 버퍼
+import sys, time, threading
+from dataclasses import dataclass
+from typing import Callable, Optional, Any
+
+
+
+@dataclass
+class Frame:
+    """캡처된 프레임 1장 (image: BGR ndarray)"""
+    frame_id: int
+    image: Any
+    ts: float           # read()가 돌아온 시각(monotonic)
+    cap_ts: Optional[float] = None   # 백엔드 버퍼 시각(monotonic, 있으면)
+
+    @property
+    def origin(self) -> float:
+        """지연 계측 기준 시각: 백엔드 시각이 있으면 그것, 없으면 read 시각"""
+        return self.cap_ts if self.cap_ts is not None else self.ts
+
+
+class LatestFrame:
+    """
+    최신 프레임만 보관하는 1칸 버퍼.
+    - publish(): 이전 프레임을 아무도 안 읽었으면 dropped += 1
+    - read(): 절대 블록하지 않음. 마지막으로 읽은 것과 같은 프레임이면 stale += 1
+    - tap: publish된 모든 프레임을 받는 콜백 (레코더 등, 캡처/디코드 스레드에서 호출되므로 블록 금지)
+    - clear(): 장치가 끊겼을 때 비움 → read()가 None (화면은 검정 rect로 돌아감)
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.tap: Optional[Callable[[Frame], None]] = None
+        self._frame: Optional[Frame] = None
+        self._consumed = True
+        self._last_read_id = -1
+        self.published = 0
+        self.dropped = 0
+        self.stale = 0
+
+    def publish(self, frame: Frame):
+        with self._lock:
+            if not self._consumed:
+                self.dropped += 1
+            self._frame = frame
+            self._consumed = False
+            self.published += 1
+        if self.tap:
+            self.tap(frame)
+
+    def clear(self):
+        with self._lock:
+            self._frame = None
+            self._consumed = True
+
+    def read(self) -> Optional[Frame]:
+        with self._lock:
+            f = self._frame
+            if f is None:
+                return None
+            if f.frame_id == self._last_read_id:
+                self.stale += 1
+            self._last_read_id = f.frame_id
+            self._consumed = True
+            return f
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"published": self.published, "dropped": self.dropped, "stale": self.stale}
+
+
+class CameraCapture(threading.Thread):
+    """
+    VideoCapture를 별도 스레드에서 돌리고 최신 프레임만 LatestFrame에 올린다.
+    - opener: 캡처 객체를 만드는 함수 (예: open_cam). 스레드 안에서 호출됨
+    - read()는 메인 루프에서 호출, 블록 없음
+    - read 실패가 lost_after번 연속되면 슬롯을 비움 (끊긴 장치의 마지막 프레임이 멈춘 채 남지 않게)
+    - 캡처 객체가 JPEG 원본(raw_mjpeg)을 주면 MjpegDecodePool이 target_size에 맞춰 축소 디코드 후 올림
+    """
+    daemon = True
+    lost_after = 30
+    def __init__(self, opener: Callable[[], Any], debug: bool = False, target_size=None):
+        super().__init__(name="CameraCapture")
+        self.opener = opener
+        self.debug = debug
+        self.target_size = target_size
+        self.decoder = None               # MjpegDecodePool (첫 JPEG 원본 프레임에서 생성)
+        self.slot = LatestFrame()
+        self.read_fail = 0
+        self.opened = threading.Event()   # open 시도 끝나면 set (성공/실패 무관)
+        self.ok = False
+        self._stop_evt = threading.Event()
+        self._next_id = 0
+        self._fail_run = 0                # 연속 read 실패 수
+        self.cap = None
+
+    def run(self):
+        try:
+            self.cap = self.opener()
+            self.ok = bool(self.cap is not None and self.cap.isOpened())
+        except Exception as e:
+            print(f"[CAM] open fail: {e}", file=sys.stderr)
+            self.ok = False
+        self.opened.set()
+        if not self.ok:
+            return
+        from utils.mjpeg import MjpegDecodePool, is_jpeg_payload   # cv2 포함 → 캡처 스레드에서 import
+
+        while not self._stop_evt.is_set():
+            try:
+                ok, img = self.cap.read()
+            except Exception as e:
+                print(f"[CAM] read err: {e}", file=sys.stderr)
+                ok, img = False, None
+            if not ok or img is None:
+                self.read_fail += 1
+                self._fail_run += 1
+                if self._fail_run == self.lost_after:
+                    self.slot.clear()
+                    print(f"[CAM] {self.lost_after} reads failed in a row → cleared", file=sys.stderr)
+                time.sleep(0.005)    # 장치가 끊겼을 때 바쁜 루프 방지
+                continue
+            self._fail_run = 0
+            self._next_id += 1
+            ts = time.monotonic()
+            cap_ts = self.cap.timestamp() if hasattr(self.cap, "timestamp") else None
+            if is_jpeg_payload(img):
+                if self.decoder is None:
+                    cfg = getattr(self.cap, "cfg", None)
+                    self.decoder = MjpegDecodePool(self.slot, Frame,
+                                                   workers=getattr(cfg, "decode_workers", 2),
+                                                   target_size=self.target_size,
+                                                   reduce=getattr(cfg, "jpeg_reduce", "auto"))
+                self.decoder.submit(self._next_id, img, ts, cap_ts)
+                continue
+            self.slot.publish(Frame(self._next_id, img, ts, cap_ts))
+
+        if self.decoder:
+            self.decoder.stop()
+        try:
+            self.cap.release()
+        except Exception:
+            pass
+
+    def set_target_size(self, size):
+        """지금 화면에 그리는 카메라 영역 크기 (raw MJPEG 축소 디코드 기준)"""
+        self.target_size = size
+        if self.decoder:
+            self.decoder.set_target(size)
+
+    def read(self) -> Optional[Frame]:
+        """최신 프레임(없으면 None). 블록하지 않는다."""
+        return self.slot.read()
+
+    def stats(self) -> dict:
+        s = self.slot.stats()
+        s["read_fail"] = self.read_fail
+        if self.decoder:
+            s.update(self.decoder.stats())
+        return s
+
+    def stop(self, timeout: float = 1.0):
+        self._stop_evt.set()
+        if self.is_alive():
+            self.join(timeout=timeout)
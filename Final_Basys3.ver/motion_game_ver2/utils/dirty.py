@@ -0,0 +1,105 @@
+# utils/dirty.py
+# 더티 렉트 렌더링: 씬이 그린 영역만 배경 복원 + display.update(rects)
+import pygame
+
+from utils.fonts import get_font
+from utils.assets import audit
+
+DEBUG_COLOR = (255, 0, 255)
+
+
+class DamageTracker:
+    """
+    한 프레임 동안 화면에 그린 영역(rect)을 모아 두었다가
+    - begin_frame(): 지난 프레임에 그린 영역만 base(배경)로 복원
+    - present(): 지난 프레임 + 이번 프레임 영역만 display.update
+    enabled=False(기본)면 매 프레임 전체 배경 blit + flip (기존 동작).
+    invalidate() 후 첫 프레임도 전체 갱신 (씬 전환/배경 교체 시).
+    """
+    MERGE_OVER = 48   # rect가 이보다 많으면 하나로 합친다
+
+    def __init__(self):
+        self.enabled = False
+        self.debug = False
+        self._screen_rect = None
+        self._prev: list = []
+        self._cur: list = []
+        self._full = True
+        self.frames = 0
+        self.full_frames = 0
+        self.last_area = 0.0     # 마지막 프레임 갱신 면적 비율 (0..1)
+
+    def _display(self):
+        return pygame.display.get_surface()
+
+    def add(self, rect, surface=None):
+        """그린 영역 보고. surface가 화면이 아니면 무시 (오프스크린 합성 등)."""
+        if not self.enabled or rect is None:
+            return rect
+        if surface is not None and surface is not self._display():
+            return rect
+        r = pygame.Rect(rect)
+        if self._screen_rect is not None:
+            r = r.clip(self._screen_rect)
+        if r.width > 0 and r.height > 0:
+            self._cur.append(r)
+        return rect
+
+    def invalidate(self):
+        """다음 프레임은 전체 배경 복원 + flip"""
+        self._full = True
+
+    def begin_frame(self, screen: "pygame.Surface", base: "pygame.Surface"):
+        self._screen_rect = screen.get_rect()
+        audit.check(base, "frame_base", opaque=True)
+        if not self.enabled or self._full:
+            screen.blit(base, (0, 0))
+            self._prev = []
+            self._cur = []
+            return
+        # present() 없이 넘어간 프레임(continue)에서 그린 것도 복원 대상
+        restore = self._prev + self._cur
+        self._prev, self._cur = restore, []
+        for r in restore:
+            screen.blit(base, r, area=r)
+
+    def present(self):
+        self.frames += 1
+        if not self.enabled or self._full:
+            if self.enabled and self.debug:
+                self._draw_debug()
+            pygame.display.flip()
+            self.full_frames += 1
+            self.last_area = 1.0
+            self._prev, self._cur = self._cur, []
+            self._full = False
+            return
+        if self.debug:
+            self._draw_debug()
+        rects = self._prev + self._cur
+        if len(rects) > self.MERGE_OVER:
+            rects = [rects[0].unionall(rects[1:])]
+        if self._screen_rect:
+            area = sum(r.width * r.height for r in rects)
+            self.last_area = min(1.0, area / float(self._screen_rect.width * self._screen_rect.height))
+        pygame.display.update(rects)
+        self._prev, self._cur = self._cur, []
+
+    def _draw_debug(self):
+        screen = self._display()
+        for r in list(self._cur):
+            pygame.draw.rect(screen, DEBUG_COLOR, r, width=2)
+        try:
+            font = get_font(None, 28)
+            msg = f"dirty {len(self._prev) + len(self._cur)} rects  {self.last_area*100:.1f}%  full {self.full_frames}/{self.frames}"
+            txt = font.render(msg, True, DEBUG_COLOR)
+            self._cur.append(screen.blit(txt, (8, screen.get_height() - txt.get_height() - 8)))
+        except Exception:
+            pass
+
+    def stats(self) -> dict:
+        return {"enabled": self.enabled, "frames": self.frames,
+                "full_frames": self.full_frames, "last_area": round(self.last_area, 3)}
+
+
+damage = DamageTracker()
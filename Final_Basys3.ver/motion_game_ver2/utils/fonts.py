@@ -0,0 +1,75 @@
+# utils/fonts.py
+# 프로세스 전역 폰트 레지스트리: SysFont 생성(시스템 폰트 검색 + TTF 로드)을 1회로
+import pygame
+
+# 한글이 들어간 문자열용 대체 폰트 후보 (앞에서부터 match_font로 확인)
+HANGUL_FALLBACKS = ("malgungothic", "nanumgothic", "nanumbarungothic", "applegothic",
+                    "notosanscjkkr", "notosanskr", "gulim", "dotum")
+
+# main에서 시작 시 미리 만들어 둘 (name, size, bold) 목록 — 씬들이 실제로 쓰는 크기
+DEFAULT_WARM = [
+    ("Arial", 36, False),
+    ("Arial", 48, True), ("Arial", 80, True), ("Arial", 100, True), ("Arial", 110, True),
+    ("Arial", 140, True), ("Arial", 150, True), ("Arial", 160, True), ("Arial", 180, True),
+    ("Arial", 220, True), ("Arial", 280, True),
+    (None, 60, False), (None, 90, False),
+]
+
+
+def has_hangul(text: str) -> bool:
+    return any("가" <= ch <= "힣" or "ㄱ" <= ch <= "ㆎ" for ch in text)
+
+
+class FontRegistry:
+    """(name, size, bold) → pygame.font.Font 캐시. hits/misses 카운터 포함."""
+    def __init__(self):
+        self._fonts: dict = {}
+        self._hangul = False     # False=아직 검색 안 함, None=없음, str=폰트 이름
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name, size: int, bold: bool = False) -> "pygame.font.Font":
+        key = (name.lower() if isinstance(name, str) else name, int(size), bool(bold))
+        f = self._fonts.get(key)
+        if f is not None:
+            self.hits += 1
+            return f
+        self.misses += 1
+        f = self._fonts[key] = pygame.font.SysFont(name, int(size), bold=bold)
+        return f
+
+    def hangul_name(self):
+        """설치된 한글 폰트 이름 (없으면 None). 한 번만 검색."""
+        if self._hangul is False:
+            self._hangul = None
+            for cand in HANGUL_FALLBACKS:
+                try:
+                    if pygame.font.match_font(cand):
+                        self._hangul = cand
+                        break
+                except Exception:
+                    break
+        return self._hangul
+
+    def for_text(self, text: str, name, size: int, bold: bool = False) -> "pygame.font.Font":
+        """text에 한글이 있으면 한글 폰트로 대체 (없으면 요청한 폰트 그대로)"""
+        if text and has_hangul(text):
+            name = self.hangul_name() or name
+        return self.get(name, size, bold)
+
+    def warm(self, specs=DEFAULT_WARM, hangul_sizes=(36,)):
+        for name, size, bold in specs:
+            self.get(name, size, bold)
+        if self.hangul_name():
+            for size in hangul_sizes:
+                self.get(self.hangul_name(), size)
+
+    def stats(self) -> dict:
+        return {"fonts": len(self._fonts), "hits": self.hits, "misses": self.misses,
+                "hangul": self.hangul_name()}
+
+
+fonts = FontRegistry()
+
+def get_font(name, size: int, bold: bool = False) -> "pygame.font.Font":
+    return fonts.get(name, size, bold)
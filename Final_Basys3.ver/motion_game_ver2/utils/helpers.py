@@ -1,5 +1,42 @@
+import math
+
 import pygame
 
+from utils.fonts import get_font
+
+# 메트릭 기준 크기: 이 크기 폰트 하나로 모든 크기의 폭/높이를 비례 계산
+_REF_SIZE = 200
+_metrics: dict = {}    # (font_name, bold) → _GlyphMetrics
+_fit_cache: dict = {}  # (text, rect 크기, font_name, bold, max_size, inner_pad, glow_layers) → 글자 크기
+
+
+class _GlyphMetrics:
+    """
+    폰트 1종의 기준 크기 메트릭 (줄 높이 + 문자열 폭 테이블).
+    문자열 폭은 기준 폰트로 한 번만 재고(font.size, 커닝 포함) 크기에 비례해 환산.
+    """
+    def __init__(self, font_name, bold):
+        self.font = get_font(font_name, _REF_SIZE, bold=bold)
+        self.height = self.font.get_height()
+        self.widths: dict = {}
+
+    def size_at(self, text: str, size: int):
+        """size pt에서의 (폭, 높이) 추정. 글리프별 힌팅 반올림 오차로 0.5px씩 여유를 둔다."""
+        w = self.widths.get(text)
+        if w is None:
+            w = self.widths[text] = self.font.size(text)[0]
+        k = size / _REF_SIZE
+        return w * k + 0.5 * len(text), math.ceil(self.height * k)
+
+
+def _glyph_metrics(font_name, bold) -> _GlyphMetrics:
+    key = (font_name, bold)
+    m = _metrics.get(key)
+    if m is None:
+        m = _metrics[key] = _GlyphMetrics(font_name, bold)
+    return m
+
+
 def make_font_to_fit_rect(text: str,
                           rect: pygame.Rect,
                           font_name: str = "Arial",
@@ -11,20 +48,36 @@ def make_font_to_fit_rect(text: str,
     rect 안에 네온 글로우까지 고려해 글자가 들어오도록 폰트 크기 자동 결정.
     - inner_pad: 게이지 배경과 같은 내부 패딩(좌우/상하)
     - glow_layers: draw_neon_text에서 번지는 픽셀 수(양쪽으로 i픽셀씩 번짐)
+    결과 크기는 (text, rect 크기, 폰트, 패딩) 키로 캐시되고,
+    새 문자열도 기준 크기 메트릭 테이블로 계산하므로 폰트를 새로 만들지 않는다.
     """
+    key = (text, rect.width, rect.height, font_name, bold, max_size, inner_pad, glow_layers)
+    best = _fit_cache.get(key)
+    if best is None:
+        best = _fit_cache[key] = _fit_size(text, rect, font_name, bold, max_size, inner_pad, glow_layers)
+    return get_font(font_name, best, bold=bold)
+
+
+def _fit_size(text, rect, font_name, bold, max_size, inner_pad, glow_layers) -> int:
     # 글로우가 네 방향으로 번지므로 여유를 빼고 사용 가능한 영역 계산
     avail_w = rect.width  - 2*inner_pad - 2*glow_layers
     avail_h = rect.height - 2*inner_pad - 2*glow_layers
     if avail_w <= 0 or avail_h <= 0:
-        return pygame.font.SysFont(font_name, 8, bold=bold)
+        return 8
 
+    m = _glyph_metrics(font_name, bold)
     lo, hi, best = 8, max_size, 8
-    while lo <= hi:                        # 이진탐색으로 가장 큰 글자 크기 찾기
-        mid  = (lo + hi) // 2
-        font = pygame.font.SysFont(font_name, mid, bold=bold)
-        tw, th = font.size(text)
+    while lo <= hi:                        # 이진탐색 (메트릭 테이블로만 계산)
+        mid = (lo + hi) // 2
+        tw, th = m.size_at(text, mid)
         if tw <= avail_w and th <= avail_h:
             best = mid; lo = mid + 1
         else:
             hi = mid - 1
-    return pygame.font.SysFont(font_name, best, bold=bold)
\ No newline at end of file
+    # 추정 높이는 실제 줄 높이보다 1~2px 작을 수 있으므로 고른 크기만 실제 폰트로 한 번 확인
+    while best > 8:
+        tw, th = get_font(font_name, best, bold=bold).size(text)
+        if tw <= avail_w and th <= avail_h:
+            break
+        best -= 1
+    return best
@@ -0,0 +1,139 @@
+# utils/latency.py
+# 카메라 경로 지연 계측: 캡처 → 변환 → blit → flip 구간별 롤링 백분위수
+#  - 기준 시각: 백엔드가 주는 버퍼 시각(Frame.cap_ts), 없으면 read 시각(Frame.ts)
+#  - CamPresenter.draw가 blit(tag, ...)로 기록, main이 present 직후 flip() → 대기 중인 blit 확정
+#  - age_at_flip: flip 때 화면에 있는 카메라 이미지의 나이 (같은 프레임 재사용 포함 = 체감 지연)
+#  - 보정 모드(MG_LATENCY_CAL=1): 화면 구석 마커를 깜빡이고, 카메라가 그 마커를 찍은 프레임이
+#    다시 화면에 나올 때까지(glass-to-glass)를 밝기 변화로 측정. 카메라 화면 중앙에 마커가 오게 둘 것.
+import os
+import time
+from collections import deque
+
+import pygame
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+from utils.dirty import damage
+
+
+class Rolling:
+    """최근 window개 샘플(ms)의 백분위수"""
+    def __init__(self, window: int = 600):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+
+    def add(self, v: float):
+        self.samples.append(v)
+        self.count += 1
+
+    def pct(self, p: float) -> float:
+        if not self.samples:
+            return 0.0
+        s = sorted(self.samples)
+        return s[min(len(s) - 1, int(p / 100.0 * len(s)))]
+
+    def summary(self) -> dict:
+        if not self.samples:
+            return {"n": 0}
+        return {"n": self.count, "p50": round(self.pct(50), 1), "p95": round(self.pct(95), 1),
+                "p99": round(self.pct(99), 1), "max": round(max(self.samples), 1)}
+
+
+class LatencyTracker:
+    """tag(예: "main", "play")별 구간 통계. enabled=False면 기록 안 함."""
+    def __init__(self, window: int = 600):
+        self.window = window
+        self.enabled = True
+        self.stats: dict = {}            # (tag, 구간) → Rolling
+        self._pending = []               # 이번 프레임 blit들: (tag, frame_id, origin, new, image)
+        self.calibrator = None
+
+    def _roll(self, tag, name) -> Rolling:
+        r = self.stats.get((tag, name))
+        if r is None:
+            r = self.stats[(tag, name)] = Rolling(self.window)
+        return r
+
+    def blit(self, tag, frame_id, origin, conv_ms=None, new=True, image=None):
+        """카메라 이미지를 화면 버퍼에 올린 직후 (origin=캡처 기준 시각, conv_ms=변환 소요)"""
+        if not self.enabled or origin is None:
+            return
+        now = time.monotonic()
+        if new:
+            self._roll(tag, "cap_to_blit").add((now - origin) * 1000.0)
+            if conv_ms is not None:
+                self._roll(tag, "convert").add(conv_ms)
+        self._pending.append((tag, frame_id, origin, new, image))
+
+    def flip(self, now=None):
+        """damage.present() 직후: 이번 프레임에 그린 카메라 이미지가 화면에 나간 시각"""
+        if not self.enabled:
+            return
+        now = time.monotonic() if now is None else now
+        for tag, fid, origin, new, image in self._pending:
+            ms = (now - origin) * 1000.0
+            self._roll(tag, "age_at_flip").add(ms)
+            if new:
+                self._roll(tag, "cap_to_flip").add(ms)
+                if self.calibrator:
+                    self.calibrator.observe(image, now)
+        self._pending.clear()
+        if self.calibrator:
+            self.calibrator.on_flip(now)
+
+    def report(self) -> dict:
+        return {f"{tag}.{name}": r.summary() for (tag, name), r in sorted(self.stats.items())}
+
+
+class LatencyCalibrator:
+    """
+    마커(흰/검 사각형)를 period초마다 토글. 켜진 프레임의 flip 시각을 기록해 두고,
+    카메라 프레임 중앙 ROI 밝기가 (최근 min/max의 중간값)을 위로 넘는 첫 프레임이 화면에 나가면
+    그 flip 시각 - 마커 켜진 flip 시각 = glass_to_glass.
+    """
+    def __init__(self, tracker: LatencyTracker, rect=(40, 1100, 300, 300), period: float = 1.0):
+        self.tracker = tracker
+        self.rect = pygame.Rect(rect)
+        self.period = period
+        self.on = False
+        self._toggle_t = 0.0
+        self._drawn_on = None          # 이번 프레임에 그린 마커 상태
+        self._on_flip_t = None         # 마커가 켜진 채로 처음 flip된 시각
+        self._lit = False
+        self._lo, self._hi = 255.0, 0.0
+
+    def draw(self, screen, now):
+        if now - self._toggle_t >= self.period:
+            self.on = not self.on
+            self._toggle_t = now
+        damage.add(screen.fill((255, 255, 255) if self.on else (0, 0, 0), self.rect))
+        self._drawn_on = self.on
+
+    def on_flip(self, now):
+        if self._drawn_on and self._on_flip_t is None:
+            self._on_flip_t = now
+        elif self._drawn_on is False:
+            self._on_flip_t = None
+            self._lit = False
+
+    def observe(self, image, flip_t):
+        if image is None or np is None or getattr(image, "ndim", 0) != 3:
+            return
+        h, w = image.shape[:2]
+        v = float(image[h // 4: 3 * h // 4: 4, w // 4: 3 * w // 4: 4].mean())
+        self._lo = min(self._lo * 0.999 + v * 0.001, v)     # 천천히 잊는 min/max
+        self._hi = max(self._hi * 0.999 + v * 0.001, v)
+        if self._hi - self._lo < 30:                        # 대비가 부족하면 판정 안 함
+            return
+        bright = v > (self._lo + self._hi) / 2
+        if bright and not self._lit and self._on_flip_t is not None:
+            self._lit = True
+            self.tracker._roll("cal", "glass_to_glass").add((flip_t - self._on_flip_t) * 1000.0)
+
+
+latency = LatencyTracker()
+if os.environ.get("MG_LATENCY_CAL", "0") == "1":
+    latency.calibrator = LatencyCalibrator(latency)
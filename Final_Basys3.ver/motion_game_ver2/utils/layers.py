@@ -0,0 +1,50 @@
+# utils/layers.py
+# 씬별 정적 레이어: 배경 + 움직이지 않는 요소를 한 장의 화면 포맷 Surface로 미리 합성
+import pygame
+
+from utils.dirty import damage
+from utils.assets import to_display
+
+
+class StaticLayer:
+    """
+    build(layer)가 layer.blit(...)으로 정적 요소를 그린다.
+    - get(base): base(배경) 복사본 위에 합성한 Surface. base나 key()가 바뀌면 자동 재합성
+    - over=True로 올린 스프라이트는 restore_over(screen, rect)로 동적 요소(카메라 등)
+      위에 그 rect와 겹치는 부분만 다시 올릴 수 있다 (원래 그리기 순서 유지용)
+    """
+    def __init__(self, build, key=None):
+        self._build = build
+        self._key_fn = key
+        self._key = None
+        self._over: list = []      # (sprite, 화면 rect)
+        self.surface = None
+        self.builds = 0
+
+    def blit(self, sprite, pos, over=False):
+        r = self.surface.blit(sprite, pos)
+        if over:
+            self._over.append((sprite, r))
+        return r
+
+    def get(self, base: "pygame.Surface") -> "pygame.Surface":
+        key = (id(base), base.get_size(), self._key_fn() if self._key_fn else None)
+        if self.surface is None or key != self._key:
+            surf = to_display(base, alpha=False)   # 불투명 화면 포맷 사본
+            self.surface = base.copy() if surf is base else surf
+            self._over = []
+            self._build(self)
+            self._key = key
+            self.builds += 1
+        return self.surface
+
+    def invalidate(self):
+        self._key = None
+
+    def restore_over(self, screen: "pygame.Surface", rect):
+        """rect(동적 영역)와 겹치는 over 스프라이트 부분만 screen에 다시 blit"""
+        rect = pygame.Rect(rect)
+        for sprite, r in self._over:
+            clip = r.clip(rect)
+            if clip.width and clip.height:
+                damage.add(screen.blit(sprite, clip.topleft, area=clip.move(-r.x, -r.y)), screen)
@@ -0,0 +1,30 @@
+# utils/layout.py
+# 화면/스프라이트 고정 크기 모음 (main, 씬, tools/bake_assets가 같은 값을 쓴다)
+
+SCREEN_SIZE   = (2560, 1440)
+CHAR_SIZE     = (600, 900)      # INTRO 캐릭터 1.png / 2.png
+CARD_SIZE     = (530, 500)      # MUSIC 카드
+MOTION_SIZE   = (550, 900)      # PLAY 모션 이미지 G*/S*
+GEAR_SIZE     = (90, 90)        # PLAY 일시정지 아이콘
+PLAY_VGA_SIZE = (1600, 1200)    # PLAY 결과 오버레이 (PlayScene.VGA_RECT 크기)
+MODE_1P_SIZE  = (550, 900)
+MODE_2P_SIZE  = (500, 900)
+
+# 오프라인 베이크 대상: (파일명 패턴(소문자, fnmatch), 목표 크기, alpha)
+# 패턴은 assets 아래 모든 폴더의 파일 이름에 적용된다.
+BAKE_SPECS = [
+    ("background.png", SCREEN_SIZE,   False),
+    ("1.png",          CHAR_SIZE,     True),
+    ("2.png",          CHAR_SIZE,     True),
+    ("1p.png",         MODE_1P_SIZE,  True),
+    ("2p.png",         MODE_2P_SIZE,  True),
+    ("golden.png",     CARD_SIZE,     True),
+    ("soda_pop.png",   CARD_SIZE,     True),
+    ("ques.png",       CARD_SIZE,     True),
+    ("perfect.png",    PLAY_VGA_SIZE, True),
+    ("good.png",       PLAY_VGA_SIZE, True),
+    ("bad.png",        PLAY_VGA_SIZE, True),
+    ("gear.png",       GEAR_SIZE,     True),
+    ("g[0-9]*.png",    MOTION_SIZE,   True),
+    ("s[0-9]*.png",    MOTION_SIZE,   True),
+]
@@ -0,0 +1,145 @@
+# utils/mjpeg.py
+# MJPEG 원본(JPEG 바이트) 디코드 풀: 캡처 스레드는 압축 데이터만 넘기고
+# 워커들이 cv2.imdecode(IMREAD_REDUCED_COLOR_n)로 필요한 크기에 가깝게 바로 디코드 → LatestFrame
+#  - 축소 배율 auto: 디코드 결과가 target 크기보다 작아지지 않는 가장 큰 1/2/4/8
+#    (set_target()으로 그리는 크기가 바뀌면 다음 프레임 헤더로 다시 고름)
+#  - 대기열은 워커 수만큼만: 밀리면 가장 오래된 JPEG부터 버림 (최신 프레임 우선)
+#  - 늦게 끝난 옛 프레임은 올리지 않음 (frame_id 역행 방지)
+import threading
+import time
+from collections import deque
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+try:
+    import cv2
+except Exception:
+    cv2 = None
+
+REDUCE_FLAGS = {}
+if cv2 is not None:
+    REDUCE_FLAGS = {1: cv2.IMREAD_COLOR, 2: cv2.IMREAD_REDUCED_COLOR_2,
+                    4: cv2.IMREAD_REDUCED_COLOR_4, 8: cv2.IMREAD_REDUCED_COLOR_8}
+
+
+def is_jpeg_payload(img) -> bool:
+    """CONVERT_RGB=0 으로 받은 MJPEG 버퍼 (1xN 또는 N uint8, SOI 마커로 시작)"""
+    if np is None or not isinstance(img, np.ndarray) or img.dtype != np.uint8:
+        return False
+    if img.ndim == 2 and img.shape[0] == 1:
+        img = img[0]
+    return img.ndim == 1 and img.size > 4 and img[0] == 0xFF and img[1] == 0xD8
+
+
+def jpeg_size(buf):
+    """JPEG SOF 헤더에서 (w, h) — 전체 디코드 없이. 못 찾으면 None"""
+    b = bytes(buf)
+    i, n = 2, len(b)
+    while i + 9 < n:
+        if b[i] != 0xFF:
+            i += 1
+            continue
+        m = b[i + 1]
+        if m in (0xC0, 0xC1, 0xC2):
+            return (b[i + 7] << 8) | b[i + 8], (b[i + 5] << 8) | b[i + 6]
+        if m == 0xD8 or m == 0x01 or 0xD0 <= m <= 0xD7:
+            i += 2
+            continue
+        i += 2 + ((b[i + 2] << 8) | b[i + 3])
+    return None
+
+
+def pick_reduce(src_size, target_size) -> int:
+    """src를 1/f로 줄여도 target을 덮는 가장 큰 f (비율 유지 fit 기준)"""
+    if not src_size or not target_size:
+        return 1
+    s = min(target_size[0] / src_size[0], target_size[1] / src_size[1])
+    f = 1
+    for cand in (2, 4, 8):
+        if s * cand <= 1.0:
+            f = cand
+    return f
+
+
+class MjpegDecodePool:
+    """
+    submit(frame_id, payload, ts, cap_ts): 캡처 스레드에서 호출 (블록 없음)
+    워커 결과는 Frame(frame_id, BGR, ts, cap_ts)로 slot.publish
+    reduce: "auto" 또는 1/2/4/8 고정
+    """
+    def __init__(self, slot, frame_cls, *, workers: int = 2, target_size=None, reduce="auto"):
+        self.slot = slot
+        self.frame_cls = frame_cls
+        self.target_size = target_size
+        self.reduce = reduce
+        self.factor = None if reduce == "auto" else int(reduce)
+        self._q: deque = deque()
+        self._max_pending = max(1, workers)
+        self._cv = threading.Condition()
+        self._stop = False
+        self._last_pub = 0
+        self.decoded = 0
+        self.dropped = 0        # 대기열이 차서 디코드 전에 버린 JPEG
+        self.late = 0           # 더 새 프레임이 먼저 올라가 버린 결과
+        self.failed = 0
+        self.decode_ms = 0.0
+        self._threads = [threading.Thread(target=self._run, name=f"mjpeg-{i}", daemon=True)
+                         for i in range(max(1, workers))]
+        for t in self._threads:
+            t.start()
+
+    def set_target(self, size):
+        """화면에 그리는 크기가 바뀜 (auto면 다음 submit에서 배율 재선택)"""
+        self.target_size = size
+        if self.reduce == "auto":
+            self.factor = None
+
+    def submit(self, frame_id, payload, ts, cap_ts=None):
+        if self.factor is None:          # 첫 프레임 헤더로 배율 결정
+            self.factor = pick_reduce(jpeg_size(payload.reshape(-1)), self.target_size)
+            if self.factor not in REDUCE_FLAGS:
+                self.factor = 1
+        with self._cv:
+            if len(self._q) >= self._max_pending:
+                self._q.popleft()
+                self.dropped += 1
+            self._q.append((frame_id, payload, ts, cap_ts))
+            self._cv.notify()
+
+    def _run(self):
+        while True:
+            with self._cv:
+                while not self._q and not self._stop:
+                    self._cv.wait()
+                if self._stop:
+                    return
+                fid, payload, ts, cap_ts = self._q.popleft()
+            t = time.perf_counter()
+            img = cv2.imdecode(payload.reshape(-1), REDUCE_FLAGS.get(self.factor, cv2.IMREAD_COLOR))
+            dt = (time.perf_counter() - t) * 1000.0
+            with self._cv:
+                self.decode_ms += dt
+                if img is None:
+                    self.failed += 1
+                    continue
+                self.decoded += 1
+                if fid <= self._last_pub:
+                    self.late += 1
+                    continue
+                self._last_pub = fid
+                self.slot.publish(self.frame_cls(fid, img, ts, cap_ts))   # 락 안에서 올려 순서 보장
+
+    def stop(self):
+        with self._cv:
+            self._stop = True
+            self._cv.notify_all()
+        for t in self._threads:
+            t.join(timeout=0.5)
+
+    def stats(self) -> dict:
+        with self._cv:
+            return {"jpeg_decoded": self.decoded, "jpeg_dropped": self.dropped, "jpeg_late": self.late,
+                    "jpeg_failed": self.failed, "reduce": self.factor,
+                    "decode_ms": round(self.decode_ms / self.decoded, 2) if self.decoded else 0.0}
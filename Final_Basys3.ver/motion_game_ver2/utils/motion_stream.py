@@ -0,0 +1,133 @@
+# utils/motion_stream.py
+# 모션 이미지 스트리밍: 현재 + 다음 ahead장만 메모리에 두고, 다음 장은 워커 스레드에서 미리 디코드
+import queue
+import threading
+from collections import OrderedDict
+
+from utils.assets import cache, decode_image, display_template, surface_bytes
+
+
+class MotionStream:
+    """
+    paths[i] → size로 스케일한 화면 포맷 Surface.
+    - get(i): 상주 중이면 바로, 아니면 (프리로드된 AssetCache → 동기 디코드) 순으로 가져옴
+    - prefetch(i): i..현재+ahead 중 없는 것을 워커에 요청 (show_result 대기 중에 호출)
+    - pump(): 메인 루프에서 호출, 워커 결과를 상주 목록에 넣고 창 밖/예산 초과분 제거
+    상주 범위는 [현재, 현재+ahead] 이고 총량은 budget_bytes 이하 (현재 장은 항상 유지).
+    """
+    def __init__(self, paths, size, *, ahead: int = 1, budget_bytes: int = 64 * 2**20, debug=False):
+        self.paths = list(paths)
+        self.size = tuple(size)
+        self.ahead = max(0, int(ahead))
+        self.budget_bytes = budget_bytes
+        self.debug = debug
+        self.cur = 0
+        self._resident: "OrderedDict" = OrderedDict()    # idx → Surface
+        self._req: "queue.Queue" = queue.Queue()
+        self._done: "queue.Queue" = queue.Queue()
+        self._pending = set()
+        self._tmpl = display_template(True)               # 메인 스레드에서 생성
+        self._worker = None
+        self.sync_loads = 0
+        self.prefetched = 0
+        self.evicted = 0
+
+    # ---- 메인 스레드 ----
+    def _load_sync(self, i):
+        p = self.paths[i]
+        img = cache.get(cache.key(p, self.size, True))    # 프리로더가 올려 둔 첫 장들
+        if img is None:
+            img = decode_image(p, self.size, True)
+            self.sync_loads += 1
+        return img
+
+    def get(self, i):
+        if not (0 <= i < len(self.paths)):
+            return None
+        img = self._resident.get(i)
+        if img is None:
+            self.pump()
+            img = self._resident.get(i)
+        if img is None:
+            try:
+                img = self._load_sync(i)
+            except Exception as e:
+                print(f"[WARN] image load fail {self.paths[i]}: {e}")
+                return None
+            self._resident[i] = img
+            self._trim()
+        return img
+
+    def seek(self, i):
+        """현재 장 변경: 창 밖 장 해제"""
+        self.cur = i
+        self._trim()
+
+    def prefetch(self, i=None):
+        i = self.cur if i is None else i
+        for j in range(i, min(len(self.paths), self.cur + self.ahead + 1)):
+            if j in self._resident or j in self._pending:
+                continue
+            img = cache.get(cache.key(self.paths[j], self.size, True))
+            if img is not None:                          # 프리로더가 이미 만든 장
+                self._resident[j] = img
+                continue
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, daemon=True)
+                self._worker.start()
+            self._pending.add(j)
+            self._req.put(j)
+
+    def pump(self) -> int:
+        n = 0
+        while True:
+            try:
+                j, img = self._done.get_nowait()
+            except queue.Empty:
+                break
+            self._pending.discard(j)
+            if img is not None and self.cur <= j <= self.cur + self.ahead:
+                self._resident[j] = img
+                self.prefetched += 1
+            n += 1
+        if n:
+            self._trim()
+        return n
+
+    def _trim(self):
+        lo, hi = self.cur, self.cur + self.ahead
+        for j in [j for j in self._resident if not (lo <= j <= hi)]:
+            del self._resident[j]
+            self.evicted += 1
+        # 예산 초과 시 현재 장에서 먼 것부터
+        while self.resident_bytes() > self.budget_bytes and len(self._resident) > 1:
+            far = max((j for j in self._resident if j != self.cur), key=lambda j: abs(j - self.cur), default=None)
+            if far is None:
+                break
+            del self._resident[far]
+            self.evicted += 1
+
+    def resident_bytes(self) -> int:
+        return sum(surface_bytes(s) for s in self._resident.values())
+
+    def close(self):
+        self._req.put(None)
+        self._resident.clear()
+
+    def stats(self) -> dict:
+        return {"resident": sorted(self._resident), "mb": round(self.resident_bytes() / 2**20, 1),
+                "sync_loads": self.sync_loads, "prefetched": self.prefetched, "evicted": self.evicted}
+
+    # ---- 워커 ----
+    def _run(self):
+        while True:
+            j = self._req.get()
+            if j is None:
+                return
+            try:
+                img = decode_image(self.paths[j], self.size, True, template=self._tmpl)
+            except Exception as e:
+                img = None
+                if self.debug:
+                    print(f"[MOTION] prefetch fail {self.paths[j]}: {e}")
+            self._done.put((j, img))
@@ -1,14 +1,187 @@
 # utils/neon.py
+from collections import OrderedDict
 import pygame
 
-def draw_neon_text(surface, font, text, base_color, glow_color, rect, glow_layers=6, alpha=40):
-    """네온 글로우 텍스트. rect는 반드시 font.size(text)로 만든 크기를 권장."""
+from utils.dirty import damage
+
+# numpy/cv2는 블러 글로우를 처음 만들 때 import (main.py import 시간에서 제외)
+np = None
+cv2 = None
+_blur_libs_checked = False
+
+def _load_blur_libs() -> bool:
+    """블러 경로용 numpy/cv2 지연 import. numpy가 없으면 False (→ "fan")"""
+    global np, cv2, _blur_libs_checked
+    if not _blur_libs_checked:
+        _blur_libs_checked = True
+        try:
+            import numpy as np
+        except Exception:
+            np = None
+        try:
+            import cv2
+        except Exception:
+            cv2 = None
+    return np is not None
+
+# 글로우 품질: "fan" = 기존 8방향×glow_layers 알파 블릿
+#  low/medium/high = 알파 마스크 블러 1회 (다운샘플 배율, 박스블러 반복 횟수, 가우시안 여부)
+GLOW_QUALITY = {
+    "low":    (2, 1, False),
+    "medium": (1, 2, False),
+    "high":   (1, 1, True),
+}
+glow_quality = "medium"
+
+def set_glow_quality(q: str):
+    """기본 글로우 품질 변경 ("fan"|"low"|"medium"|"high"). 캐시도 비운다."""
+    global glow_quality
+    if q != "fan" and q not in GLOW_QUALITY:
+        raise ValueError(f"unknown glow quality: {q}")
+    glow_quality = q
+    sprite_cache.clear()
+
+
+class SpriteCache:
+    """
+    렌더링된 텍스트/글로우 스프라이트 LRU 캐시.
+    - max_bytes: 보관 중인 Surface 픽셀 메모리 합(w*h*bytesize) 상한
+    - 초과 시 가장 오래 안 쓴 항목부터 제거
+    """
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._items: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _cost(surf: "pygame.Surface") -> int:
+        return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+    def get(self, key):
+        surf = self._items.get(key)
+        if surf is None:
+            self.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.hits += 1
+        return surf
+
+    def put(self, key, surf: "pygame.Surface"):
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.bytes -= self._cost(old)
+        self._items[key] = surf
+        self.bytes += self._cost(surf)
+        while self.bytes > self.max_bytes and len(self._items) > 1:
+            _, ev = self._items.popitem(last=False)
+            self.bytes -= self._cost(ev)
+            self.evictions += 1
+        return surf
+
+    def clear(self):
+        self._items.clear(); self.bytes = 0
+
+    def stats(self) -> dict:
+        return {"items": len(self._items), "bytes": self.bytes, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions}
+
+
+sprite_cache = SpriteCache()
+
+
+def render_text(font, text, color):
+    """font.render 결과 캐시 (antialias=True)."""
+    key = ("text", font, text, tuple(color))
+    surf = sprite_cache.get(key)
+    if surf is None:
+        surf = sprite_cache.put(key, font.render(text, True, color))
+    return surf
+
+
+def _box_blur(a, r: int):
+    """float32 2D 배열 분리형 박스 블러 (반경 r, 가장자리는 0 패딩으로 가정)"""
+    if cv2 is not None:
+        return cv2.blur(a, (2*r + 1, 2*r + 1), borderType=cv2.BORDER_CONSTANT)
+    k = 2*r + 1
+    for axis in (0, 1):
+        pad = [(0, 0), (0, 0)]; pad[axis] = (r + 1, r)
+        c = np.cumsum(np.pad(a, pad), axis=axis, dtype=np.float32)
+        a = (np.take(c, range(k, c.shape[axis]), axis=axis) -
+             np.take(c, range(0, c.shape[axis] - k), axis=axis)) / k
+    return a
+
+def _blur_glow_alpha(mask, r: int, alpha: int, quality: str):
+    """
+    글자 알파(0..255, 이미 r만큼 패딩됨)를 블러해서 글로우 알파로 변환.
+    fan 방식에서 픽셀 알파 = 1-(1-a)^(덮는 탭 수) 이므로
+    블러 결과(덮는 비율)×전체 탭 수(8*r)를 같은 식에 넣어 밝기를 맞춘다.
+    """
+    down, passes, gaussian = GLOW_QUALITY[quality]
+    a = mask.astype(np.float32) * (1.0 / 255.0)
+    h, w = a.shape
+    rr = max(1, r // down)
+    if down > 1 and cv2 is not None:
+        a = cv2.resize(a, (max(1, w // down), max(1, h // down)), interpolation=cv2.INTER_AREA)
+    if gaussian and cv2 is not None:
+        a = cv2.GaussianBlur(a, (2*rr + 1, 2*rr + 1), rr / 2.0, borderType=cv2.BORDER_CONSTANT)
+    else:
+        for _ in range(passes):
+            a = _box_blur(a, max(1, rr // passes) if passes > 1 else rr)
+    if a.shape != (h, w):
+        a = cv2.resize(a, (w, h), interpolation=cv2.INTER_LINEAR)
+    taps = 8 * r
+    lut = 255.0 * (1.0 - (1.0 - alpha / 255.0) ** (np.arange(256, dtype=np.float32) / 255.0 * taps))
+    idx = np.clip(a * 255.0, 0, 255).astype(np.uint8)
+    return lut.astype(np.uint8)[idx]
+
+def _render_blur_glow(font, text, base_color, glow_color, glow_layers, alpha, quality):
+    base = font.render(text, True, base_color)
+    pad = glow_layers
+    w, h = base.get_width() + 2*pad, base.get_height() + 2*pad
+    mask_src = font.render(text, True, (255, 255, 255)).convert_alpha()
+    mask = np.zeros((h, w), np.uint8)
+    mask[pad:pad + base.get_height(), pad:pad + base.get_width()] = pygame.surfarray.array_alpha(mask_src).T
+    sprite = pygame.Surface((w, h), pygame.SRCALPHA).convert_alpha()
+    sprite.fill((*glow_color[:3], 0))
+    pa = pygame.surfarray.pixels_alpha(sprite)
+    pa[:] = _blur_glow_alpha(mask, glow_layers, alpha, quality).T
+    del pa
+    sprite.blit(base, (pad, pad))
+    return sprite
+
+def render_neon_text(font, text, base_color, glow_color, glow_layers=6, alpha=40, quality=None):
+    """
+    글로우까지 합성된 스프라이트 1장. 글자 기준 사방으로 glow_layers px 여백이 붙는다.
+    (font, text, 색, glow_layers, alpha, quality) 키로 캐시됨.
+    quality None이면 glow_quality 사용, numpy가 없으면 항상 "fan".
+    """
+    q = quality or glow_quality
+    if q != "fan" and (glow_layers <= 0 or not _load_blur_libs()):
+        q = "fan"
+    key = ("neon", font, text, tuple(base_color), tuple(glow_color), glow_layers, alpha, q)
+    sprite = sprite_cache.get(key)
+    if sprite is not None:
+        return sprite
+    if q != "fan":
+        return sprite_cache.put(key, _render_blur_glow(font, text, base_color, glow_color,
+                                                       glow_layers, alpha, q))
+
+    base = font.render(text, True, base_color)
     glow = font.render(text, True, glow_color).convert_alpha()
     glow.set_alpha(alpha)
+    pad = glow_layers
+    sprite = pygame.Surface((base.get_width() + 2*pad, base.get_height() + 2*pad), pygame.SRCALPHA)
     for i in range(1, glow_layers + 1):
-        surface.blit(glow, rect.move( i, 0)); surface.blit(glow, rect.move(-i, 0))
-        surface.blit(glow, rect.move(0,  i)); surface.blit(glow, rect.move(0, -i))
-        surface.blit(glow, rect.move( i,  i)); surface.blit(glow, rect.move(-i, -i))
-        surface.blit(glow, rect.move( i, -i)); surface.blit(glow, rect.move(-i,  i))
-    base = font.render(text, True, base_color)
-    surface.blit(base, rect)
\ No newline at end of file
+        for dx, dy in ((i,0),(-i,0),(0,i),(0,-i),(i,i),(-i,-i),(i,-i),(-i,i)):
+            sprite.blit(glow, (pad + dx, pad + dy))
+    sprite.blit(base, (pad, pad))
+    return sprite_cache.put(key, sprite.convert_alpha())
+
+
+def draw_neon_text(surface, font, text, base_color, glow_color, rect, glow_layers=6, alpha=40, quality=None):
+    """네온 글로우 텍스트. rect는 반드시 font.size(text)로 만든 크기를 권장."""
+    sprite = render_neon_text(font, text, base_color, glow_color, glow_layers, alpha, quality)
+    damage.add(surface.blit(sprite, (rect[0] - glow_layers, rect[1] - glow_layers)), surface)
@@ -0,0 +1,113 @@
+# utils/preload.py
+# 곡 팩 프리로더: MUSIC 선택 중에 워커 스레드가 PlayScene용 이미지를 미리 디코드/스케일
+#  - 워커: decode_image(..., template=화면 포맷) → 디스플레이에 손대지 않고 완성 Surface 생성
+#  - 메인: pump()로 완성본을 AssetCache에 넣음 → PlayScene의 load_image가 전부 캐시 적중
+import itertools
+import queue
+import threading
+import time
+
+from utils.assets import cache, decode_image, display_template
+
+
+class Preloader(threading.Thread):
+    """
+    want(pack, jobs, priority): jobs=[(path, size, alpha)] 를 우선순위 큐에 넣는다
+      (priority가 작을수록 먼저. 같은 파일을 다시 넣으면 더 높은 우선순위만 반영)
+    pump(): 메인 루프에서 매 프레임 호출, 완성된 Surface를 캐시에 등록
+    ready(pack) / wait(pack, timeout)
+    """
+    def __init__(self, debug=False):
+        super().__init__(daemon=True)
+        self.debug = debug
+        self._q: "queue.PriorityQueue" = queue.PriorityQueue()
+        self._done: "queue.Queue" = queue.Queue()
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._queued: dict = {}        # cache key → 큐에 넣은 priority (아직 완료 전)
+        self._packs: dict = {}         # pack → [cache key, ...]
+        self._failed: set = set()      # 디코드 실패한 cache key (다시 기다리지 않음)
+        self._stop_evt = threading.Event()
+        self._tmpl = {True: display_template(True), False: display_template(False)}   # 메인 스레드에서 생성
+        self.decoded = 0
+        self.failed = 0
+        self.decode_ms = 0.0
+
+    # ---- 메인 스레드 ----
+    def want(self, pack, jobs, priority: int = 10):
+        keys = []
+        for path, size, alpha in jobs:
+            try:
+                key = cache.key(path, size, alpha)
+            except OSError:
+                continue
+            keys.append(key)
+            if key in cache or key in self._failed:
+                continue
+            with self._lock:
+                prev = self._queued.get(key)
+                if prev is not None and prev <= priority:
+                    continue
+                self._queued[key] = priority
+            self._q.put((priority, next(self._seq), key, (path, size, alpha)))
+        self._packs[pack] = keys
+
+    def pump(self) -> int:
+        n = 0
+        while True:
+            try:
+                key, surf = self._done.get_nowait()
+            except queue.Empty:
+                return n
+            if surf is None:
+                self._failed.add(key)
+            elif key not in cache:
+                cache.put(key, surf)
+            n += 1
+
+    def ready(self, pack) -> bool:
+        """pack의 모든 항목이 끝났는지 (실패한 항목도 끝난 것으로 봄 → PlayScene이 동기 로드로 처리)"""
+        keys = self._packs.get(pack)
+        return keys is not None and all(k in cache or k in self._failed for k in keys)
+
+    def wait(self, pack, timeout: float = 2.0) -> bool:
+        """pack이 다 준비될 때까지 pump (남은 건 PlayScene이 동기 로드)"""
+        deadline = time.monotonic() + timeout
+        while True:
+            self.pump()
+            if self.ready(pack) or time.monotonic() >= deadline:
+                return self.ready(pack)
+            time.sleep(0.005)
+
+    def stop(self, timeout=1.0):
+        self._stop_evt.set()
+        self._q.put((-1, -1, None, None))
+        if self.is_alive():
+            self.join(timeout=timeout)
+
+    def stats(self) -> dict:
+        return {"decoded": self.decoded, "failed": self.failed, "queued": self._q.qsize(),
+                "decode_ms": round(self.decode_ms, 1)}
+
+    # ---- 워커 ----
+    def run(self):
+        while not self._stop_evt.is_set():
+            prio, _, key, job = self._q.get()
+            if key is None:
+                continue
+            with self._lock:
+                if self._queued.get(key) != prio:   # 더 높은 우선순위로 이미 다시 들어간 항목
+                    continue
+                del self._queued[key]
+            path, size, alpha = job
+            t = time.perf_counter()
+            try:
+                surf = decode_image(path, size, alpha, template=self._tmpl[bool(alpha)])
+                self.decoded += 1
+            except Exception as e:
+                surf = None
+                self.failed += 1
+                if self.debug:
+                    print(f"[PRELOAD] fail {path}: {e}")
+            self.decode_ms += (time.perf_counter() - t) * 1000.0
+            self._done.put((key, surf))
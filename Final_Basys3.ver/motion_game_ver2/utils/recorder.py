@@ -0,0 +1,287 @@
+# utils/recorder.py
+# 세션 레코더: 최근 N초 카메라 프레임 + 판정 결과를 메모리 링 버퍼에 유지, 요청 시에만 별도 프로세스에서 인코드
+#  - push(frame): 캡처 단계(LatestFrame.tap)에서 호출 → 미리 잡아 둔 링 슬롯에 축소 복사 (할당 없음)
+#  - mark(kind, **info): 판정/이벤트 기록 (PlayScene)
+#  - request_clip(reason): 라운드 종료/이의 제기 시 → 복사 스레드가 공유 메모리로 옮기고 인코더 프로세스에 전달
+#  - 메모리 상한: 링 + 내보내기 버퍼 = max_mb 이하 (초과분은 보관 시간을 줄임), 인코드는 한 번에 하나
+#  - 진행 중이면 요청 1개를 대기시킴 (priority 요청=이의 제기는 대기 중인 일반 요청을 밀어냄),
+#    클립 구간은 요청 시점까지 (대기하는 동안 쌓인 프레임은 넣지 않음)
+#  - 드롭 카운터: busy(링 잠금 경합), encode_busy(인코드 중 요청), overwritten(복사 전에 덮어쓴 프레임)
+#  - 실패: 복사/인코드 예외는 error 기록으로 돌아오고, 인코더 프로세스가 죽으면 poll()이 알리고 녹화를 끔
+# 사용: MG_RECORD=1 (MG_RECORD_SECONDS, MG_RECORD_MB, MG_RECORD_FPS) — 기본은 꺼짐, 모든 호출이 no-op
+import os
+import json
+import time
+import queue
+import threading
+import multiprocessing as mp
+from collections import deque
+from pathlib import Path
+
+np = None            # numpy/cv2/shared_memory는 start()에서 import (꺼져 있으면 import 비용 없음)
+cv2 = None
+shared_memory = None
+
+OUT_DIR = Path(__file__).resolve().parent.parent / "recordings"
+
+
+def _encoder_main(shm_name, shape, req_q, done_q):
+    """인코더 프로세스: 내보내기 공유 메모리에서 n프레임을 읽어 MJPG .avi + 이벤트 .json 작성"""
+    import cv2 as _cv2
+    import numpy as _np
+    from multiprocessing import shared_memory as _shm
+    shm = _shm.SharedMemory(name=shm_name)
+    buf = _np.ndarray(shape, _np.uint8, buffer=shm.buf)
+    try:
+        while True:
+            req = req_q.get()
+            if req is None:
+                break
+            try:
+                n, fps, path, meta = req["n"], req["fps"], req["path"], req["meta"]
+                t = time.perf_counter()
+                h, w = shape[1], shape[2]
+                vw = _cv2.VideoWriter(path, _cv2.VideoWriter_fourcc(*"MJPG"), fps, (w, h))
+                for i in range(n):
+                    vw.write(buf[i])
+                vw.release()
+                with open(Path(path).with_suffix(".json"), "w", encoding="utf-8") as f:
+                    json.dump(meta, f, ensure_ascii=False, indent=1)
+                done_q.put({"path": path, "frames": n, "encode_ms": round((time.perf_counter() - t) * 1000.0, 1)})
+            except Exception as e:      # 요청 하나가 실패해도 완료 통지는 반드시 (→ 메인이 busy 해제)
+                done_q.put({"path": req.get("path"), "error": f"encode: {e!r}"})
+    finally:
+        del buf
+        shm.close()
+
+
+class SessionRecorder:
+    def __init__(self):
+        self.enabled = False
+        self.lock = threading.Lock()
+        self.events = deque(maxlen=512)
+        self.dropped_busy = 0
+        self.dropped_encode_busy = 0
+        self.overwritten = 0
+        self.pushed = 0
+        self.clips = []
+        self.replaced = 0        # priority 요청에 밀려난 대기 요청
+        self.failed = 0
+        self.last_error = None
+        self._proc = None
+
+    # ---- 설정/시작 (메인 스레드) ----
+    def start(self, size=(320, 240), seconds: float = 10.0, fps: float = 15.0, max_mb: float = 96.0,
+              out_dir: Path = OUT_DIR, debug: bool = False):
+        global np, cv2, shared_memory
+        if self.enabled:
+            return self
+        try:
+            import numpy as np
+            import cv2
+            from multiprocessing import shared_memory
+        except Exception as e:
+            print(f"[REC] disabled: {e}")
+            return self
+        self.size, self.fps, self.debug = tuple(size), float(fps), debug
+        self.out_dir = Path(out_dir)
+        fb = self.size[0] * self.size[1] * 3
+        # 링과 내보내기 버퍼가 같은 프레임 수 → 둘이 합쳐 max_mb 이하가 되도록 보관 시간 조정
+        cap = int(min(seconds * fps, (max_mb * 2**20) // (2 * fb)))
+        if cap < 2:
+            print(f"[REC] max_mb={max_mb} too small for {self.size}")
+            return self
+        self.capacity = cap
+        self.seconds = cap / fps
+        shape = (cap, self.size[1], self.size[0], 3)
+        self.ring = np.zeros(shape, np.uint8)                        # 캡처 스레드가 쓰는 링
+        self.ring_ts = np.zeros(cap, np.float64)
+        self._shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)))
+        self.export = np.ndarray(shape, np.uint8, buffer=self._shm.buf)   # 인코더 프로세스와 공유
+        self.head = 0            # 다음에 쓸 위치 (누적 카운트)
+        self._last_push_t = 0.0
+        self._req_q = mp.Queue()
+        self._done_q = mp.Queue()
+        self._proc = mp.Process(target=_encoder_main, name="rec-encoder", daemon=True,
+                                args=(self._shm.name, shape, self._req_q, self._done_q))
+        self._proc.start()
+        self._clip_q: "queue.Queue" = queue.Queue(maxsize=1)       # 복사 스레드 입력 (한 번에 하나)
+        self._busy = threading.Event()                             # 내보내기 버퍼 사용 중 (복사~인코드 완료)
+        self._seq = 0
+        self._pending = None                                       # busy 동안 대기하는 요청 1개 (메인 스레드)
+        threading.Thread(target=self._copy_loop, name="rec-copy", daemon=True).start()
+        self.enabled = True
+        print(f"[REC] ring {cap} frames {self.size[0]}x{self.size[1]} @{fps:g} = {self.seconds:.1f}s, "
+              f"{2 * cap * fb / 2**20:.1f} MB (ring + export)")
+        return self
+
+    # ---- 캡처 단계 ----
+    def push(self, frame):
+        """LatestFrame.tap: 절대 블록하지 않음 (잠금 경합이면 버리고 dropped_busy)"""
+        if not self.enabled:
+            return
+        img = frame.image
+        if getattr(img, "ndim", 0) != 3:
+            return
+        if frame.ts - self._last_push_t < 0.9 / self.fps:       # 녹화 fps로 솎기 (드롭 아님)
+            return
+        if not self.lock.acquire(blocking=False):
+            self.dropped_busy += 1
+            return
+        try:
+            i = self.head % self.capacity
+            dst = self.ring[i]
+            if img.shape[:2] == (self.size[1], self.size[0]):
+                dst[...] = img
+            else:
+                cv2.resize(img, self.size, dst=dst, interpolation=cv2.INTER_AREA)
+            self.ring_ts[i] = frame.origin
+            self.head += 1
+            self.pushed += 1
+            self._last_push_t = frame.ts
+        finally:
+            self.lock.release()
+
+    # ---- 게임 쪽 (메인 스레드) ----
+    def mark(self, kind: str, **info):
+        if self.enabled:
+            self.events.append({"t": time.monotonic(), "kind": kind, **info})
+
+    def request_clip(self, reason: str, seconds=None, priority: bool = False, **info) -> bool:
+        """
+        최근 seconds초(기본 전체 링)를 클립으로. 진행 중이면 1개까지 대기 (poll()이 이어서 보냄).
+        대기 자리가 차 있으면: priority면 대기 중인 일반 요청을 밀어내고(replaced), 아니면 False + dropped_encode_busy
+        """
+        self.poll()                  # 끝난 클립 정리 + 대기 요청을 먼저 보냄 (순서 유지)
+        if not self.enabled:
+            return False
+        req = {"reason": reason, "seconds": seconds or self.seconds, "t": time.monotonic(),
+               "head": self.head, "priority": priority, **info}
+        if not self._busy.is_set():
+            self._dispatch(req)
+        elif self._pending is None:
+            self._pending = req
+        elif priority and not self._pending["priority"]:
+            self._pending = req
+            self.replaced += 1
+            self.dropped_encode_busy += 1
+        else:
+            self.dropped_encode_busy += 1
+            return False
+        return True
+
+    def _dispatch(self, req):
+        self._busy.set()
+        self._clip_q.put(req)
+
+    def poll(self):
+        """인코더 완료 통지 수거 (메인 루프에서 가끔). 인코더 프로세스가 죽었으면 알리고 녹화 중지"""
+        if not self.enabled:
+            return
+        self._drain_done()
+        if not self._proc.is_alive():
+            self._fail(f"encoder exited (code {self._proc.exitcode})")
+            self.enabled = False
+            return
+        if self._pending is not None and not self._busy.is_set():
+            req, self._pending = self._pending, None
+            self._dispatch(req)
+
+    def _fail(self, msg: str):
+        self.failed += 1
+        self.last_error = msg
+        self._busy.clear()
+        print(f"[REC] {msg}")
+
+    def _drain_done(self):
+        while True:
+            try:
+                done = self._done_q.get_nowait()
+            except queue.Empty:
+                return
+            if "error" in done:
+                self._fail(f"clip failed {done}")
+                continue
+            self.clips.append(done)
+            self._busy.clear()
+            if self.debug:
+                print(f"[REC] clip {done}")
+
+    # ---- 복사 스레드 ----
+    def _copy_loop(self):
+        while True:
+            req = self._clip_q.get()
+            try:
+                self._export_clip(req)
+            except Exception as e:      # mkdir 실패 등 → busy를 풀어 다음 요청을 받을 수 있게
+                self._fail(f"copy failed ({req['reason']}): {e!r}")
+
+    def _export_clip(self, req):
+        """링에서 최근 프레임을 내보내기 버퍼로 옮기고 인코더에 요청"""
+        want = int(min(self.capacity, req["seconds"] * self.fps))
+        with self.lock:
+            end = min(self.head, req["head"])         # 요청 시점까지
+        start = max(0, end - want, end - self.capacity)
+        n = 0
+        for k in range(start, end):
+            with self.lock:            # 프레임 하나씩만 잠금 → 캡처 쪽은 길게 막히지 않음
+                if self.head - k > self.capacity:     # 복사 전에 덮어씀
+                    self.overwritten += 1
+                    continue
+                self.export[n] = self.ring[k % self.capacity]
+                t = float(self.ring_ts[k % self.capacity])
+            n += 1
+            if n == 1:
+                t_first = t
+        if n == 0:
+            self._busy.clear()
+            return
+        t_last = t
+        events = [e for e in self.events if t_first - 1.0 <= e["t"] <= max(t_last, req["t"])]
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        if not (self.out_dir / ".gitignore").exists():
+            (self.out_dir / ".gitignore").write_text("*\n")
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        self._seq += 1                                 # 같은 초에 여러 클립이어도 이름이 겹치지 않게
+        path = str(self.out_dir / f"{stamp}_{self._seq:03d}_{req['reason']}.avi")
+        meta = {"reason": req["reason"], "frames": n, "fps": self.fps,
+                "t0": t_first, "t1": t_last, "request": req, "events": events}
+        self._req_q.put({"n": n, "fps": self.fps, "path": path, "meta": meta})
+
+    def stop(self, timeout: float = 3.0):
+        if not self._proc:
+            return
+        deadline = time.monotonic() + timeout      # 진행/대기 중인 클립(이의 제기 등)은 마무리
+        while self.enabled and (self._busy.is_set() or self._pending) and time.monotonic() < deadline:
+            self.poll()
+            time.sleep(0.02)
+        self.enabled = False
+        self._req_q.put(None)
+        self._proc.join(timeout=timeout)
+        if self._proc.is_alive():
+            self._proc.terminate()
+        self._drain_done()
+        self._proc = None
+        try:
+            del self.export
+            self._shm.close()
+            self._shm.unlink()
+        except Exception:
+            pass
+
+    def stats(self) -> dict:
+        return {"enabled": self.enabled, "pushed": self.pushed, "dropped_busy": self.dropped_busy,
+                "dropped_encode_busy": self.dropped_encode_busy, "replaced": self.replaced,
+                "overwritten": self.overwritten, "clips": len(self.clips), "failed": self.failed}
+
+
+recorder = SessionRecorder()
+
+
+def start_from_env(debug: bool = True) -> SessionRecorder:
+    """MG_RECORD=1 이면 환경변수 설정으로 시작"""
+    if os.environ.get("MG_RECORD", "0") == "1":
+        recorder.start(seconds=float(os.environ.get("MG_RECORD_SECONDS", "10")),
+                       fps=float(os.environ.get("MG_RECORD_FPS", "15")),
+                       max_mb=float(os.environ.get("MG_RECORD_MB", "96")), debug=debug)
+    return recorder
@@ -0,0 +1,124 @@
+# utils/songs.py
+# 곡 매니페스트(assets/songs.json) 인덱스: 폴더/시작 문자/모션 목록을 코드 대신 파일 한 곳에서 관리
+#  - 곡 추가 = songs.json에 항목 추가 (씬 생성 시 iterdir/정규식 스캔 없음)
+#  - 키는 대문자, aliases로 예전 이름(SODAPOP 등)도 같은 곡으로 찾는다
+#  - 로드 시 검사: start_char / pattern_rom_base 중복, ROM 범위 밖 주소 → 경고 (FPGA 쪽 곡 선택과 어긋남)
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+ASSETS_DIR    = Path(__file__).resolve().parent.parent / "assets"
+MANIFEST_NAME = "songs.json"
+RESULT_KEYS   = ("P", "G", "B")
+PATTERN_ROM_DEPTH = 600       # pattern_rom.sv music_rom[0:(30*20)-1]
+
+
+@dataclass
+class Song:
+    key: str
+    label: str
+    folder: Path
+    start_char: Optional[str]
+    pattern_rom_base: int
+    motions: list = field(default_factory=list)     # [Path] 재생 순서
+    overlays: dict = field(default_factory=dict)    # "P"/"G"/"B" → Path
+    gear: Optional[Path] = None
+    card: Optional[Path] = None
+    aliases: tuple = ()
+    ending: list = field(default_factory=list)      # [(Path, (w, h), (x, y))] 엔딩 캐릭터, 붙이는 순서대로
+
+    def ending_layout(self, W: int) -> list:
+        """엔딩 캐릭터 배치 (x가 음수면 화면 폭 W 기준 오른쪽에서)"""
+        return [(p, size, (x + W if x < 0 else x, y)) for p, size, (x, y) in self.ending]
+
+
+class SongIndex:
+    """songs.json → Song 목록 + (키/별칭 → Song) 조회표. 로드 시 한 번만 파일 존재 확인."""
+    def __init__(self, songs, assets_dir: Path = ASSETS_DIR):
+        self.assets_dir = Path(assets_dir)
+        self._songs = list(songs)
+        self._by_key: dict = {}
+        for s in self._songs:
+            for k in (s.key, *s.aliases):
+                self._by_key[k.upper()] = s
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None, assets_dir: Path = ASSETS_DIR, debug: bool = False):
+        assets_dir = Path(assets_dir)
+        path = Path(path) if path else assets_dir / MANIFEST_NAME
+        data = json.loads(path.read_text(encoding="utf-8"))
+
+        def _p(rel, what, key):
+            if not rel:
+                return None
+            p = assets_dir / rel
+            if not p.is_file():
+                if debug:
+                    print(f"[SONGS][WARN] {key}: {what} 없음 → {p}")
+                return None
+            return p
+
+        songs = []
+        for ent in data.get("songs", []):
+            key = ent["key"].upper()
+            motions = [p for p in (_p(m, "motion", key) for m in ent.get("motions", [])) if p]
+            ending = [(p, tuple(e["size"]), tuple(e["pos"])) for e in ent.get("ending", [])
+                      for p in [_p(e["file"], "ending", key)] if p]
+            overlays = {k: p for k, p in ((k, _p(ent.get("overlays", {}).get(k), f"overlay {k}", key))
+                                          for k in RESULT_KEYS) if p}
+            songs.append(Song(
+                key=key,
+                label=ent.get("label", key.title()),
+                folder=assets_dir / ent.get("folder", key.lower()),
+                start_char=ent.get("start_char"),
+                pattern_rom_base=int(ent.get("pattern_rom_base", 0)),
+                motions=motions,
+                overlays=overlays,
+                gear=_p(ent.get("gear"), "gear", key),
+                card=_p(ent.get("card"), "card", key),
+                aliases=tuple(a.upper() for a in ent.get("aliases", [])),
+                ending=ending,
+            ))
+        if debug:
+            _check_fpga_fields(songs)
+        return cls(songs, assets_dir)
+
+    def get(self, key) -> Optional[Song]:
+        return self._by_key.get((key or "").upper())
+
+    def canonical(self, key) -> str:
+        """별칭 → 대표 키 (모르는 키는 대문자 그대로)"""
+        s = self.get(key)
+        return s.key if s else (key or "").upper()
+
+    def songs(self) -> list:
+        return list(self._songs)
+
+    def keys(self) -> list:
+        return [s.key for s in self._songs]
+
+
+def _check_fpga_fields(songs):
+    """FPGA가 곡을 구분하는 값(시작 문자, 패턴 ROM 시작 주소)이 곡마다 다르고 ROM 안에 있는지"""
+    seen_char, seen_base = {}, {}
+    for s in songs:
+        if s.start_char is not None:
+            if s.start_char in seen_char:
+                print(f"[SONGS][WARN] {s.key}: start_char '{s.start_char}' = {seen_char[s.start_char]}")
+            seen_char.setdefault(s.start_char, s.key)
+        if s.pattern_rom_base in seen_base:
+            print(f"[SONGS][WARN] {s.key}: pattern_rom_base {s.pattern_rom_base} = {seen_base[s.pattern_rom_base]}")
+        seen_base.setdefault(s.pattern_rom_base, s.key)
+        if not 0 <= s.pattern_rom_base < PATTERN_ROM_DEPTH:
+            print(f"[SONGS][WARN] {s.key}: pattern_rom_base {s.pattern_rom_base} ROM 범위(0~{PATTERN_ROM_DEPTH - 1}) 밖")
+
+
+_index: Optional[SongIndex] = None
+
+def song_index() -> SongIndex:
+    """assets/songs.json을 처음 부를 때 한 번 로드"""
+    global _index
+    if _index is None:
+        _index = SongIndex.load(debug=True)
+    return _index
@@ -0,0 +1,144 @@
+# utils/startup.py
+# 시작 타임라인: main.py import → 첫 프레임까지 단계별 소요 시간 기록 (재부팅 후 복귀 시간 추적)
+#  - phase(name): with 블록 하나 = 한 단계 (시작 시각/소요 ms)
+#  - mark(name): 한 시점 (splash/interactive 등, 처음 한 번만 기록)
+#  - write(): logs/startup.jsonl 에 부팅 1회당 한 줄 추가 (MG_STARTUP_LOG로 경로 변경)
+#  - StartupLoader: 시작 에셋을 스레드 풀에서 디코드, 메인은 스플래시를 그리며 pump()
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import contextmanager
+from pathlib import Path
+
+T0 = time.perf_counter()    # 이 모듈을 처음 import한 시각 (main.py 첫 줄에서 import)
+
+LOG_PATH = Path(__file__).resolve().parent.parent / "logs" / "startup.jsonl"
+
+
+class StartupTimeline:
+    def __init__(self, t0: float = T0):
+        self.t0 = t0
+        self.phases = []        # [(name, start_ms, dur_ms)]
+        self.marks = {}         # name → ms
+        self.written = False
+
+    def now_ms(self) -> float:
+        return (time.perf_counter() - self.t0) * 1000.0
+
+    @contextmanager
+    def phase(self, name: str):
+        start = self.now_ms()
+        try:
+            yield
+        finally:
+            self.phases.append((name, start, self.now_ms() - start))
+
+    def mark(self, name: str):
+        self.marks.setdefault(name, self.now_ms())
+
+    def report(self) -> dict:
+        return {
+            "ts": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "pid": os.getpid(),
+            "argv": sys.argv,
+            "phases": [{"name": n, "start_ms": round(s, 1), "ms": round(d, 1)} for n, s, d in self.phases],
+            "marks": {k: round(v, 1) for k, v in self.marks.items()},
+        }
+
+    def summary(self) -> str:
+        lines = [f"  {n:<18} {d:8.1f} ms  (@{s:7.1f})" for n, s, d in self.phases]
+        lines += [f"  {k:<18} @{v:8.1f} ms" for k, v in self.marks.items()]
+        return "\n".join(lines)
+
+    def write(self, path=None):
+        """한 번만 기록. 로그 폴더는 커밋 대상이 아니므로 .gitignore도 같이 만든다."""
+        if self.written:
+            return
+        self.written = True
+        path = Path(path or os.environ.get("MG_STARTUP_LOG") or LOG_PATH)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if path == LOG_PATH and not (path.parent / ".gitignore").exists():
+                (path.parent / ".gitignore").write_text("*\n")
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(self.report(), ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"[STARTUP] log write fail {path}: {e}")
+
+
+timeline = StartupTimeline()
+
+
+class StartupLoader:
+    """
+    jobs=[(path, size, alpha)] 를 스레드 풀에서 decode_image(template=화면 포맷)로 디코드
+    (이미지 디코드/smoothscale은 GIL을 놓으므로 병렬로 진행).
+    pump(): 메인 스레드에서 완료분을 AssetCache에 등록 → 이후 load_image가 전부 캐시 적중.
+    """
+    def __init__(self, jobs, workers: int = 0):
+        from utils.assets import cache, display_template
+        self.cache = cache
+        self.jobs = []
+        for path, size, alpha in jobs:
+            key = cache.key(path, size, alpha)
+            if key not in cache and all(key != k for k, _ in self.jobs):
+                self.jobs.append((key, (path, size, alpha)))
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self._tmpl = {True: display_template(True), False: display_template(False)}   # 메인 스레드에서 생성
+        self._pool = None
+        self._futs = {}
+        self.loaded = 0
+        self.failed = 0
+
+    def start(self):
+        if not self.jobs:
+            return self
+        from utils.assets import decode_image
+        self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="startup")
+        for key, (path, size, alpha) in self.jobs:
+            fut = self._pool.submit(decode_image, path, size, alpha, self._tmpl[bool(alpha)])
+            self._futs[fut] = (key, path)
+        return self
+
+    def pump(self, timeout: float = 0.0) -> int:
+        """완료된 것을 캐시에 넣는다. timeout>0이면 하나라도 끝날 때까지 최대 그만큼 대기."""
+        if not self._futs:
+            return 0
+        done, _ = wait(list(self._futs), timeout=timeout, return_when=FIRST_COMPLETED)
+        for fut in done:
+            key, path = self._futs.pop(fut)
+            try:
+                self.cache.put(key, fut.result())
+                self.loaded += 1
+            except Exception as e:
+                self.failed += 1     # 본 로드(load_image)에서 다시 시도/경고
+                print(f"[STARTUP] decode fail {path}: {e}")
+        if not self._futs and self._pool:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+        return len(done)
+
+    def done(self) -> bool:
+        return not self._futs
+
+    def progress(self) -> float:
+        return 1.0 if not self.jobs else (self.loaded + self.failed) / len(self.jobs)
+
+
+def draw_splash(screen, progress: float, text: str = "Loading"):
+    """검정 화면 + 진행 바 (폰트 1개, 사각형 3개 — 스플래시 자체가 로딩을 늦추지 않게)"""
+    import pygame           # 모듈 상단에 두면 pygame import가 T0 이전이 되어 타임라인에서 빠짐
+    from utils.fonts import get_font
+    W, H = screen.get_size()
+    screen.fill((0, 0, 0))
+    bar = pygame.Rect(0, 0, W // 3, 24)
+    bar.center = (W // 2, H // 2 + 60)
+    pygame.draw.rect(screen, (40, 40, 50), bar)
+    fill = bar.copy()
+    fill.width = int(bar.width * max(0.0, min(1.0, progress)))
+    pygame.draw.rect(screen, (100, 150, 255), fill)
+    pygame.draw.rect(screen, (200, 200, 220), bar, 2)
+    label = get_font("Arial", 48, True).render(f"{text}  {int(progress * 100)}%", True, (255, 255, 255))
+    screen.blit(label, label.get_rect(midbottom=(W // 2, bar.top - 20)))
@@ -0,0 +1,76 @@
+# utils/surfaces.py
+# 매 프레임 쓰는 반투명 오버레이를 (크기, 색, 모양) 키로 한 번만 만들어 재사용
+from collections import OrderedDict
+
+import pygame
+
+from utils.assets import to_display
+
+
+class OverlayCache:
+    """
+    - solid(size, rgb, alpha): 불투명 화면 포맷 Surface + surface alpha
+      (SRCALPHA 전체 fill보다 blit이 빠르고, alpha만 바뀌는 플래시도 같은 Surface 재사용)
+    - rounded(size, rgba, radius, border): 둥근 모서리/테두리가 있는 SRCALPHA 오버레이 (카드 바탕 등)
+    키 개수가 max_items를 넘으면 가장 오래 안 쓴 것부터 버린다.
+    """
+    def __init__(self, max_items: int = 64):
+        self.max_items = max_items
+        self._items: "OrderedDict" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, key, build):
+        s = self._items.get(key)
+        if s is not None:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return s
+        self.misses += 1
+        s = self._items[key] = build()
+        while len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+        return s
+
+    def solid(self, size, rgb, alpha: int = 255) -> "pygame.Surface":
+        """
+        단색 오버레이. 반환된 Surface는 공유되므로 alpha는 호출 때마다 여기서 설정된다
+        (반환 후 set_alpha를 직접 바꾸지 말 것).
+        """
+        size, rgb = tuple(size), tuple(rgb)
+
+        def build():
+            s = to_display(pygame.Surface(size), alpha=False)
+            s.fill(rgb)
+            return s
+        s = self._get(("solid", size, rgb), build)
+        s.set_alpha(max(0, min(255, int(alpha))))
+        return s
+
+    def rounded(self, size, rgba, radius: int = 0, border=None) -> "pygame.Surface":
+        """border=(rgba, width, radius) 이면 테두리까지 그린 오버레이"""
+        size, rgba = tuple(size), tuple(rgba)
+        border = (tuple(border[0]), int(border[1]), int(border[2])) if border else None
+
+        def build():
+            s = to_display(pygame.Surface(size, pygame.SRCALPHA), alpha=True)
+            r = s.get_rect()
+            if radius:
+                s.fill((0, 0, 0, 0))
+                pygame.draw.rect(s, rgba, r, border_radius=radius)
+            else:
+                s.fill(rgba)
+            if border:
+                pygame.draw.rect(s, border[0], r, width=border[1], border_radius=border[2])
+            return s
+        return self._get(("rounded", size, rgba, radius, border), build)
+
+    def clear(self):
+        self._items.clear()
+
+    def stats(self) -> dict:
+        nbytes = sum(s.get_width() * s.get_height() * s.get_bytesize() for s in self._items.values())
+        return {"items": len(self._items), "bytes": nbytes, "hits": self.hits, "misses": self.misses}
+
+
+overlays = OverlayCache()
@@ -8,6 +8,9 @@ import pygame
 import time
 from utils.neon import draw_neon_text
 from utils.helpers import make_font_to_fit_rect
+from utils.neon import render_text, render_neon_text
+from utils.fonts import get_font, fonts
+from utils.dirty import damage
 
 try:
     import serial  # optional
@@ -153,9 +156,9 @@ class StartHoldWidget:
             self.reader = UartReader(port, baud, parse_mode, self.q, debug)
             self.reader.start()
 
-        self.title_font = pygame.font.SysFont("Arial", 180, bold=True)
-        self.btn_font   = pygame.font.SysFont("Arial", 150, bold=True)
-        self.hint_font  = pygame.font.SysFont("Arial", 36)
+        self.title_font = get_font("Arial", 180, bold=True)
+        self.btn_font   = get_font("Arial", 150, bold=True)
+        self.hint_font  = get_font("Arial", 36)
 
         self.label_idle = label_idle
         self.label_done = label_done
@@ -226,19 +229,28 @@ class StartHoldWidget:
             self._completed = True
         return self._completed
 
+    def title_sprite(self, title: Optional[str] = None):
+        """타이틀 네온 스프라이트와 blit 위치 (정적 레이어에 굽는 용도)"""
+        if title is None:
+            title = self.title_default
+        tw, th = self.title_font.size(title)
+        title_rect = pygame.Rect(0,0,tw,th); title_rect.center = self.title_center
+        sprite = render_neon_text(self.title_font, title, self.WHITE, (100,150,255))
+        return sprite, (title_rect.x - 6, title_rect.y - 6)   # glow_layers=6 여백
+
     def draw(self, surface: "pygame.Surface",
              title: Optional[str] = None,
              hint: str = "손을 START 영역에 유지 · Space=테스트 · ESC=종료"):
+        """title=""이면 타이틀 생략 (정적 레이어에 이미 구운 경우)"""
         if title is None:
             title = self.title_default
         if title:
-            tw, th = self.title_font.size(title)
-            title_rect = pygame.Rect(0,0,tw,th); title_rect.center = self.title_center
-            draw_neon_text(surface, self.title_font, title, self.WHITE, (100,150,255), title_rect)
+            sprite, pos = self.title_sprite(title)
+            damage.add(surface.blit(sprite, pos), surface)
 
         r = self.btn_rect_base
         fill = self.DONE if self._completed else (self.ACTIVE if self._active else self.IDLE)
-        pygame.draw.rect(surface, fill, r, border_radius=24)
+        damage.add(pygame.draw.rect(surface, fill, r, border_radius=24), surface)
         pygame.draw.rect(surface, self.BORDER, r, width=4, border_radius=24)
 
         pad = 14
@@ -271,8 +283,9 @@ class StartHoldWidget:
         draw_neon_text(surface, font, text, self.WHITE, self.NEON_RED, lbl_rect, glow_layers=6)
 
         if hint:
-            hs = self.hint_font.render(hint, True, (230,230,230))
-            surface.blit(hs, hs.get_rect(midbottom=(self.W//2, self.H-20)))
+            # 힌트는 한글이라 한글 폰트로 대체
+            hs = render_text(fonts.for_text(hint, "Arial", 36), hint, (230,230,230))
+            damage.add(surface.blit(hs, hs.get_rect(midbottom=(self.W//2, self.H-20))), surface)
 
         text = self.label_idle if not self._completed else self.label_done
 